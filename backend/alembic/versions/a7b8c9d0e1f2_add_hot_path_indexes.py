@@ -0,0 +1,66 @@
+"""add composite indexes for hot query paths
+
+Revision ID: a7b8c9d0e1f2
+Revises: f6a7b8c9d0e1
+Create Date: 2026-10-17
+
+Indexes are built with CREATE INDEX CONCURRENTLY so the migration does not
+block writes on live tables.  CONCURRENTLY cannot run inside a transaction,
+hence the autocommit block.  A failed concurrent build leaves an INVALID
+index behind, which IF NOT EXISTS would then skip: re-runs drop those first.
+"""
+import sqlalchemy as sa
+from alembic import context, op
+
+revision = "a7b8c9d0e1f2"
+down_revision = "f6a7b8c9d0e1"
+branch_labels = None
+depends_on = None
+
+
+# (name, table, columns, INCLUDE columns)
+INDEXES = [
+    ("ix_transactions_user_transacted", "transactions", ["user_id", "transacted_at", "id"], None),
+    ("ix_transactions_card_type_transacted", "transactions", ["user_card_id", "type", "transacted_at"], ["amount"]),
+    ("ix_transactions_category_id", "transactions", ["category_id"], None),
+    ("ix_categories_user_type", "categories", ["user_id", "type"], None),
+    ("ix_user_cards_user_created", "user_cards", ["user_id", "created_at"], None),
+    ("ix_user_cards_catalog_id", "user_cards", ["catalog_id"], None),
+    ("ix_user_card_benefits_card_created", "user_card_benefits", ["user_card_id", "created_at"], None),
+    ("ix_catalog_benefits_catalog_created", "catalog_benefits", ["catalog_id", "created_at"], None),
+    ("ix_email_verifications_user_created", "email_verifications", ["user_id", "created_at"], None),
+]
+
+
+def _drop_if_invalid(name: str, table: str) -> None:
+    if context.is_offline_mode():
+        return  # generated SQL targets a fresh run
+    invalid = op.get_bind().scalar(
+        sa.text(
+            "SELECT NOT i.indisvalid FROM pg_index i "
+            "WHERE i.indexrelid = to_regclass(quote_ident(current_schema()) || '.' || :name)"
+        ),
+        {"name": name},
+    )
+    if invalid:
+        op.drop_index(name, table_name=table, postgresql_concurrently=True)
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns, include in INDEXES:
+            _drop_if_invalid(name, table)
+            op.create_index(
+                name,
+                table,
+                columns,
+                postgresql_include=include or [],
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,40 @@
+"""move data_version to user_data_versions
+
+Revision ID: b4c5d6e7f8a9
+Revises: a3b4c5d6e7f8
+Create Date: 2026-10-17
+
+Bumping users.data_version rewrote updated_at and held the users row lock
+for the whole writer transaction; the counter gets its own table.
+"""
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision = "b4c5d6e7f8a9"
+down_revision = "a3b4c5d6e7f8"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "user_data_versions",
+        sa.Column("user_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("version", sa.BigInteger(), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("user_id"),
+    )
+    op.execute(
+        "INSERT INTO user_data_versions (user_id, version) "
+        "SELECT id, data_version FROM users WHERE data_version > 0"
+    )
+    op.drop_column("users", "data_version")
+
+
+def downgrade() -> None:
+    op.add_column("users", sa.Column("data_version", sa.BigInteger(), server_default="0", nullable=False))
+    op.execute(
+        "UPDATE users SET data_version = v.version FROM user_data_versions v WHERE v.user_id = users.id"
+    )
+    op.drop_table("user_data_versions")
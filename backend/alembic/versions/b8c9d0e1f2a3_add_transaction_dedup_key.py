@@ -0,0 +1,81 @@
+"""add dedup_key to transactions
+
+Revision ID: b8c9d0e1f2a3
+Revises: a7b8c9d0e1f2
+Create Date: 2026-10-17
+
+Import duplicate detection moves into the database: each transaction carries
+md5(UTC date:amount:description) and a unique (user_id, dedup_key) index lets
+imports use INSERT ... ON CONFLICT DO NOTHING.  Existing rows are backfilled
+keeping the key on the oldest row of each identical group; the others stay
+NULL.  The unique index is built CONCURRENTLY outside the transaction; the
+column and backfill are committed before it, so a re-run after a failed
+build keeps the column and replaces the INVALID index the build left.
+"""
+import sqlalchemy as sa
+from alembic import context, op
+
+revision = "b8c9d0e1f2a3"
+down_revision = "a7b8c9d0e1f2"
+branch_labels = None
+depends_on = None
+
+
+DEDUP_KEY_SQL = """
+    md5(
+        to_char(transacted_at AT TIME ZONE 'UTC', 'YYYY-MM-DD')
+        || ':' || CASE WHEN amount = trunc(amount) THEN trunc(amount)::text ELSE amount::text END
+        || ':' || COALESCE(description, '')
+    )
+"""
+
+
+def _drop_if_invalid(name: str, table: str) -> None:
+    if context.is_offline_mode():
+        return  # generated SQL targets a fresh run
+    invalid = op.get_bind().scalar(
+        sa.text(
+            "SELECT NOT i.indisvalid FROM pg_index i "
+            "WHERE i.indexrelid = to_regclass(quote_ident(current_schema()) || '.' || :name)"
+        ),
+        {"name": name},
+    )
+    if invalid:
+        op.drop_index(name, table_name=table, postgresql_concurrently=True)
+
+
+def upgrade() -> None:
+    op.execute("ALTER TABLE transactions ADD COLUMN IF NOT EXISTS dedup_key VARCHAR(32)")
+    op.execute(
+        f"""
+        UPDATE transactions t
+        SET dedup_key = k.key
+        FROM (
+            SELECT DISTINCT ON (user_id, key) id, key
+            FROM (SELECT id, user_id, created_at, {DEDUP_KEY_SQL} AS key FROM transactions) s
+            ORDER BY user_id, key, created_at, id
+        ) k
+        WHERE t.id = k.id
+        """
+    )
+    with op.get_context().autocommit_block():
+        _drop_if_invalid("uq_transactions_user_dedup_key", "transactions")
+        op.create_index(
+            "uq_transactions_user_dedup_key",
+            "transactions",
+            ["user_id", "dedup_key"],
+            unique=True,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "uq_transactions_user_dedup_key",
+            table_name="transactions",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+    op.drop_column("transactions", "dedup_key")
@@ -0,0 +1,34 @@
+"""add import_staging (UNLOGGED)
+
+Revision ID: c9d0e1f2a3b4
+Revises: b8c9d0e1f2a3
+Create Date: 2026-10-17
+
+Shared store for import preview data when IMPORT_STAGING_BACKEND=postgres.
+UNLOGGED because rows live for minutes and are safe to lose on a crash.
+"""
+import sqlalchemy as sa
+from alembic import op
+
+revision = "c9d0e1f2a3b4"
+down_revision = "b8c9d0e1f2a3"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "import_staging",
+        sa.Column("import_id", sa.String(length=36), nullable=False),
+        sa.Column("payload", sa.LargeBinary(), nullable=False),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("import_id"),
+        prefixes=["UNLOGGED"],
+    )
+    op.create_index("ix_import_staging_expires_at", "import_staging", ["expires_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_import_staging_expires_at", table_name="import_staging")
+    op.drop_table("import_staging")
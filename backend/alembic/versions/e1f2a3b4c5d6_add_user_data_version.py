@@ -0,0 +1,24 @@
+"""add data_version to users
+
+Revision ID: e1f2a3b4c5d6
+Revises: d0e1f2a3b4c5
+Create Date: 2026-10-17
+
+Per-user counter bumped on transaction/category/card writes; keys the
+export cache.  The constant default makes ADD COLUMN metadata-only.
+"""
+import sqlalchemy as sa
+from alembic import op
+
+revision = "e1f2a3b4c5d6"
+down_revision = "d0e1f2a3b4c5"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("users", sa.Column("data_version", sa.BigInteger(), server_default="0", nullable=False))
+
+
+def downgrade() -> None:
+    op.drop_column("users", "data_version")
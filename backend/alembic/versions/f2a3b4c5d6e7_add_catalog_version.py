@@ -0,0 +1,31 @@
+"""add catalog_version
+
+Revision ID: f2a3b4c5d6e7
+Revises: e1f2a3b4c5d6
+Create Date: 2026-10-17
+
+Single-row counter for the in-memory card catalog snapshot: API processes
+reload card_catalog / catalog_benefits when it changes.  Later catalog
+migrations bump it in the same transaction as their data changes.
+"""
+import sqlalchemy as sa
+from alembic import op
+
+revision = "f2a3b4c5d6e7"
+down_revision = "e1f2a3b4c5d6"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "catalog_version",
+        sa.Column("id", sa.SmallInteger(), autoincrement=False, nullable=False),
+        sa.Column("version", sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.execute("INSERT INTO catalog_version (id, version) VALUES (1, 1)")
+
+
+def downgrade() -> None:
+    op.drop_table("catalog_version")
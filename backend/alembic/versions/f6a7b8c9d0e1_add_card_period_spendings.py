@@ -0,0 +1,45 @@
+"""add card_period_spendings ledger
+
+Revision ID: f6a7b8c9d0e1
+Revises: e5f6a7b8c9d0
+Create Date: 2026-10-17
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+revision = "f6a7b8c9d0e1"
+down_revision = "e5f6a7b8c9d0"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "card_period_spendings",
+        sa.Column("user_card_id", postgresql.UUID(as_uuid=True), sa.ForeignKey("user_cards.id", ondelete="CASCADE"), primary_key=True),
+        sa.Column("period_start", sa.Date(), primary_key=True),
+        sa.Column("amount", sa.Numeric(18, 2), nullable=False, server_default="0"),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+    )
+
+    # 기존 거래 백필 — period_start = first_of_month(date + offset) - offset, offset = 14 - billing_day
+    op.execute(
+        """
+        INSERT INTO card_period_spendings (user_card_id, period_start, amount, updated_at)
+        SELECT t.user_card_id,
+               CAST(date_trunc('month', CAST(CAST(t.transacted_at AT TIME ZONE 'UTC' AS DATE)
+                                             + COALESCE(14 - c.billing_day, 0) AS TIMESTAMP)) AS DATE)
+                 - COALESCE(14 - c.billing_day, 0) AS period_start,
+               SUM(t.amount),
+               NOW()
+        FROM transactions t
+        JOIN user_cards c ON c.id = t.user_card_id
+        WHERE t.type = 'expense'
+        GROUP BY 1, 2
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("card_period_spendings")
@@ -9,6 +9,7 @@ from app.core.database import get_db
 from app.models.card_benefit import UserCardBenefit
 from app.models.user_card import UserCard
 from app.schemas.card_benefit import UserCardBenefitCreate, UserCardBenefitResponse, UserCardBenefitUpdate
+from app.services import benefit_index, data_version
 
 router = APIRouter(prefix="/cards", tags=["card-benefits"])
 
@@ -54,7 +55,9 @@ def create_benefit(
         min_amount=data.min_amount,
     )
     db.add(benefit)
+    data_version.bump(db, current_user.id)
     db.commit()
+    benefit_index.invalidate(current_user.id)
     db.refresh(benefit)
     return benefit
 
@@ -78,7 +81,9 @@ def update_benefit(
         raise HTTPException(status_code=404, detail="Benefit not found")
     for field, value in data.model_dump(exclude_unset=True).items():
         setattr(benefit, field, value)
+    data_version.bump(db, current_user.id)
     db.commit()
+    benefit_index.invalidate(current_user.id)
     db.refresh(benefit)
     return benefit
 
@@ -100,4 +105,6 @@ def delete_benefit(
     if benefit is None:
         raise HTTPException(status_code=404, detail="Benefit not found")
     db.delete(benefit)
+    data_version.bump(db, current_user.id)
     db.commit()
+    benefit_index.invalidate(current_user.id)
@@ -1,37 +1,54 @@
 import uuid
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
 from sqlalchemy.orm import Session
-from sqlalchemy import select
 
 from app.core.database import get_db
-from app.models.card_catalog import CardCatalog
-from app.models.card_benefit import CatalogBenefit
 from app.schemas.card_catalog import CardCatalogResponse
+from app.services import catalog_snapshot
 
 router = APIRouter(prefix="/cards/catalog", tags=["card-catalog"])
 
+# Clients may keep the body but must revalidate (cheap: 304 on a matching ETag)
+_CACHE_CONTROL = "no-cache"
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """If-None-Match uses weak comparison: W/ prefixes are ignored."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+
+def _json_response(body: bytes, etag: str, if_none_match: str | None) -> Response:
+    headers = {"ETag": etag, "Cache-Control": _CACHE_CONTROL}
+    if _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
 
 @router.get("/", response_model=list[CardCatalogResponse])
 def list_catalog(
     q: str | None = Query(default=None, description="이름/발급사 검색어"),
+    if_none_match: str | None = Header(default=None),
     db: Session = Depends(get_db),
 ):
-    stmt = select(CardCatalog).where(CardCatalog.is_active == True)
-    if q:
-        stmt = stmt.where(
-            CardCatalog.name.ilike(f"%{q}%") | CardCatalog.issuer.ilike(f"%{q}%")
-        )
-    return list(db.scalars(stmt.order_by(CardCatalog.issuer, CardCatalog.name)).all())
+    snapshot = catalog_snapshot.get(db)
+    if not q:
+        return _json_response(snapshot.list_body, snapshot.list_etag, if_none_match)
+    body = snapshot.search(q)
+    return _json_response(body, catalog_snapshot.etag_for(body), if_none_match)
 
 
 @router.get("/{catalog_id}", response_model=CardCatalogResponse)
 def get_catalog(
     catalog_id: uuid.UUID,
+    if_none_match: str | None = Header(default=None),
     db: Session = Depends(get_db),
 ):
-    from fastapi import HTTPException
-    card = db.scalar(select(CardCatalog).where(CardCatalog.id == catalog_id, CardCatalog.is_active == True))
-    if card is None:
+    body = catalog_snapshot.get(db).card_json(catalog_id)
+    if body is None:
         raise HTTPException(status_code=404, detail="Catalog card not found")
-    return card
+    return _json_response(body, catalog_snapshot.etag_for(body), if_none_match)
@@ -1,12 +1,23 @@
 import uuid
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Query, status
 from sqlalchemy.orm import Session
 
 from app.api.v1.endpoints.auth import get_current_user
 from app.core.database import get_db
-from app.schemas.card_benefit import RecommendRequest, RecommendResult
-from app.schemas.user_card import CardPerformanceItem, UserCardCreate, UserCardResponse, UserCardUpdate
+from app.schemas.card_benefit import (
+    RecommendBatchRequest,
+    RecommendBatchResult,
+    RecommendRequest,
+    RecommendResult,
+)
+from app.schemas.user_card import (
+    CardPerformanceHistoryItem,
+    CardPerformanceItem,
+    UserCardCreate,
+    UserCardResponse,
+    UserCardUpdate,
+)
 import app.services.user_card as card_service
 import app.services.card_recommendation as recommend_service
 
@@ -21,6 +32,16 @@ def get_performance(
     return card_service.get_cards_performance(db, current_user.id)
 
 
+@router.get("/performance/history", response_model=list[CardPerformanceHistoryItem])
+def get_performance_history(
+    periods: int = Query(default=12, ge=1, le=36),
+    current_user=Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """Spending per card for the last `periods` performance periods, newest first."""
+    return card_service.get_cards_performance_history(db, current_user.id, periods)
+
+
 @router.get("/", response_model=list[UserCardResponse])
 def list_cards(
     current_user=Depends(get_current_user),
@@ -65,3 +86,17 @@ def recommend_cards(
 ):
     amount = data.amount if data.amount is not None else 10000
     return recommend_service.recommend_cards(db, current_user.id, data.category, amount)
+
+
+@router.post("/recommend/batch", response_model=list[RecommendBatchResult])
+def recommend_cards_batch(
+    data: RecommendBatchRequest,
+    current_user=Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    items = [(item.category, item.amount if item.amount is not None else 10000) for item in data.items]
+    ranked = recommend_service.recommend_cards_batch(db, current_user.id, items)
+    return [
+        RecommendBatchResult(category=category, amount=amount, results=results)
+        for (category, amount), results in zip(items, ranked)
+    ]
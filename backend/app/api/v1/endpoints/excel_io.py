@@ -1,16 +1,33 @@
 # backend/app/api/v1/endpoints/excel_io.py
-from fastapi import APIRouter, Depends, Query, UploadFile, status
+import os
+
+from fastapi import APIRouter, Depends, HTTPException, Query, UploadFile, status
 from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 
 from app.api.v1.endpoints.auth import get_current_user
+from app.core.config import settings
 from app.core.database import get_db
-from app.schemas.excel_io import ImportConfirmRequest, ImportConfirmResponse, ImportPreviewResponse
+from app.schemas.excel_io import (
+    ImportBatchResponse,
+    ImportConfirmRequest,
+    ImportConfirmResponse,
+    ImportJobResponse,
+    ImportPreviewResponse,
+)
 from app.services import excel_io as excel_service
+from app.services import import_jobs, sheet_reader
 
 router = APIRouter(prefix="/transactions", tags=["excel"])
 
-MAX_FILE_SIZE = 5 * 1024 * 1024  # 5MB
+MAX_FILE_SIZE = settings.IMPORT_MAX_FILE_MB * 1024 * 1024
+
+
+def _check_upload(filename: str | None, contents: bytes) -> None:
+    if not filename or not filename.lower().endswith(sheet_reader.SUPPORTED_EXTENSIONS):
+        raise HTTPException(status_code=400, detail=".xlsx, .xls 또는 .csv 파일만 지원합니다.")
+    if len(contents) > MAX_FILE_SIZE:
+        raise HTTPException(status_code=400, detail=f"파일 크기가 {MAX_FILE_SIZE // (1024 * 1024)}MB를 초과합니다.")
 
 
 @router.post("/import/preview", response_model=ImportPreviewResponse)
@@ -18,17 +35,55 @@ async def import_preview(
     file: UploadFile,
     current_user=Depends(get_current_user),
 ):
-    """Upload an xlsx file and return a preview with auto-detected column mapping."""
-    if not file.filename or not file.filename.lower().endswith((".xlsx", ".xls")):
-        from fastapi import HTTPException
-        raise HTTPException(status_code=400, detail=".xlsx 또는 .xls 파일만 지원합니다.")
+    """Upload an xlsx/xls/csv file and return a preview with auto-detected column mapping."""
+    contents = await file.read()
+    _check_upload(file.filename, contents)
 
+    return await excel_service.parse_and_preview_async(contents, file.filename)
+
+
+@router.post(
+    "/import",
+    response_model=ImportConfirmResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+async def import_file(
+    file: UploadFile,
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_user),
+):
+    """Import a file in one request using the mapping saved for its header row.
+
+    404 if this layout was never confirmed; use preview + confirm once first.
+    """
     contents = await file.read()
-    if len(contents) > MAX_FILE_SIZE:
-        from fastapi import HTTPException
-        raise HTTPException(status_code=400, detail="파일 크기가 5MB를 초과합니다.")
+    _check_upload(file.filename, contents)
 
-    return excel_service.parse_and_preview(contents, file.filename)
+    return await excel_service.import_with_profile(db, current_user.id, contents, file.filename)
+
+
+@router.post(
+    "/import/batch",
+    response_model=ImportBatchResponse,
+    status_code=status.HTTP_201_CREATED,
+)
+async def import_batch(
+    files: list[UploadFile],
+    db: Session = Depends(get_db),
+    current_user=Depends(get_current_user),
+):
+    """Import several statements (xlsx/xls/csv files or zip archives of them) at once.
+
+    Each file uses the mapping saved for its header row, else the auto-detected one.
+    """
+    uploads = []
+    for file in files:
+        contents = await file.read()
+        if len(contents) > MAX_FILE_SIZE:
+            raise HTTPException(status_code=400, detail=f"파일 크기가 {MAX_FILE_SIZE // (1024 * 1024)}MB를 초과합니다.")
+        uploads.append((file.filename or "", contents))
+
+    return await excel_service.import_batch(db, current_user.id, uploads)
 
 
 @router.post(
@@ -51,25 +106,69 @@ def import_confirm(
     )
 
 
+@router.post(
+    "/import/jobs",
+    response_model=ImportJobResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+def create_import_job(
+    body: ImportConfirmRequest,
+    current_user=Depends(get_current_user),
+):
+    """Queue the import confirmation as a background job; poll GET /import/jobs/{job_id}."""
+    return import_jobs.submit(current_user.id, body.import_id, body.mapping, body.default_type)
+
+
+@router.get("/import/jobs/{job_id}", response_model=ImportJobResponse)
+def get_import_job(
+    job_id: str,
+    current_user=Depends(get_current_user),
+):
+    """Progress and result of a background import job."""
+    return import_jobs.get(current_user.id, job_id)
+
+
 @router.get("/export")
 def export_transactions(
     period: str = Query(default="month", pattern="^(month|year|all)$"),
     year: int | None = None,
     month: int | None = None,
+    format: str = Query(default="xlsx", pattern="^(xlsx|csv|columnar)$"),
     db: Session = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
-    """Export transactions as an xlsx file."""
-    buf = excel_service.export_transactions(db, current_user.id, period, year, month)
+    """Export transactions.
 
+    xlsx is built in a spooled (cached) file and sent with a Content-Length;
+    csv and columnar are streamed from the database cursor as they are generated.
+    """
     filename = "transactions"
     if period == "month" and year and month:
         filename = f"transactions_{year}_{month:02d}"
     elif period == "year" and year:
         filename = f"transactions_{year}"
 
+    if format == "csv":
+        return StreamingResponse(
+            excel_service.iter_csv_export(current_user.id, period, year, month),
+            media_type="text/csv; charset=utf-8",
+            headers={"Content-Disposition": f'attachment; filename="{filename}.csv"'},
+        )
+    if format == "columnar":
+        return StreamingResponse(
+            excel_service.iter_columnar_export(current_user.id, period, year, month),
+            media_type="application/octet-stream",
+            headers={"Content-Disposition": f'attachment; filename="{filename}.bbcol"'},
+        )
+
+    fh = excel_service.export_transactions(db, current_user.id, period, year, month)
+    size = os.fstat(fh.fileno()).st_size
+
     return StreamingResponse(
-        buf,
+        excel_service.iter_file_chunks(fh),
         media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-        headers={"Content-Disposition": f'attachment; filename="{filename}.xlsx"'},
+        headers={
+            "Content-Disposition": f'attachment; filename="{filename}.xlsx"',
+            "Content-Length": str(size),
+        },
     )
@@ -7,21 +7,34 @@ from sqlalchemy.orm import Session
 
 from app.api.v1.endpoints.auth import get_current_user
 from app.core.database import get_db
-from app.schemas.transaction import TransactionCreate, TransactionUpdate, TransactionResponse, FavoritePatch
+from app.schemas.transaction import TransactionCreate, TransactionUpdate, TransactionResponse, TransactionPage, FavoritePatch
 import app.services.transaction as transaction_service
 
 router = APIRouter(prefix="/transactions", tags=["transactions"])
 
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
 
-@router.get("/", response_model=list[TransactionResponse])
+
+@router.get("/", response_model=list[TransactionResponse] | TransactionPage)
 def list_transactions(
     card_id: uuid.UUID | None = None,
     from_date: date | None = Query(default=None, alias="from"),
     to_date: date | None = Query(default=None, alias="to"),
+    limit: int | None = Query(default=None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: str | None = None,
     db: Session = Depends(get_db),
     current_user=Depends(get_current_user),
 ):
-    return transaction_service.list_transactions(db, current_user.id, card_id, from_date, to_date)
+    """Paginated when `limit` or `cursor` is given; otherwise the legacy full list for old clients."""
+    if limit is None and cursor is None:
+        return transaction_service.list_transactions(db, current_user.id, card_id, from_date, to_date)
+    items, next_cursor = transaction_service.list_transactions_page(
+        db, current_user.id, card_id, from_date, to_date,
+        limit=limit or DEFAULT_PAGE_SIZE,
+        cursor=cursor,
+    )
+    return TransactionPage(items=items, next_cursor=next_cursor)
 
 
 @router.post("/", response_model=TransactionResponse, status_code=status.HTTP_201_CREATED)
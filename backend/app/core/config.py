@@ -16,5 +16,43 @@ class Settings(BaseSettings):
     SMTP_PASSWORD: str = ""
     SMTP_FROM: str = ""
 
+    # Largest accepted import upload; previews cache the file itself, so this is not bound by heap
+    IMPORT_MAX_FILE_MB: int = 20
+
+    # Process pool for spreadsheet decoding at preview (0 = thread pool, no processes)
+    IMPORT_PARSE_WORKERS: int = 2
+    # Uploads being decoded or waiting for a worker; more are refused with 503
+    IMPORT_PARSE_MAX_PENDING: int = 8
+    # Statements accepted by one batch import (files + zip members)
+    IMPORT_BATCH_MAX_FILES: int = 36
+    # Uncompressed size of all statements in one batch (parsed rows are held until the insert)
+    IMPORT_BATCH_MAX_TOTAL_MB: int = 100
+
+    # Import preview staging: "memory" (single process) or "postgres" (shared by all workers)
+    IMPORT_STAGING_BACKEND: str = "memory"
+    # Memory backend bounds (LRU eviction past either limit) and expiry sweep interval
+    IMPORT_CACHE_MAX_BYTES: int = 256 * 1024 * 1024
+    IMPORT_CACHE_MAX_ENTRIES: int = 200
+    IMPORT_CACHE_SWEEP_SECONDS: float = 60
+
+    # Generated exports cached on local disk, keyed by the user's data version
+    # (LRU past the size limit; 0 disables).  Empty dir = <tmp>/benefit_butler_exports
+    EXPORT_CACHE_DIR: str = ""
+    EXPORT_CACHE_MAX_MB: int = 512
+
+    # Compiled per-user benefit tables for /cards/recommend (app/services/benefit_index.py),
+    # LRU past the user limit
+    RECOMMEND_INDEX_MAX_USERS: int = 10000
+
+    # How often each process re-reads catalog_version to pick up catalog changes
+    # (app/services/catalog_snapshot.py); 0 = on every catalog read
+    CATALOG_VERSION_CHECK_SECONDS: float = 30
+
+    # Background import jobs (app/services/import_jobs.py)
+    IMPORT_WORKERS: int = 2
+    IMPORT_MAX_PENDING_JOBS: int = 20
+    # A running job that reports no progress for this long lost its process and is failed
+    IMPORT_JOB_STALE_SECONDS: float = 600
+
 
 settings = Settings()
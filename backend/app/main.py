@@ -3,6 +3,7 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.api.v1.router import api_router
+from app.services import catalog_snapshot, parse_pool
 
 app = FastAPI(
     title="Benefit Butler API",
@@ -21,6 +22,16 @@ app.add_middleware(
 app.include_router(api_router, prefix="/api/v1")
 
 
+@app.on_event("startup")
+def load_card_catalog():
+    catalog_snapshot.load_at_startup()
+
+
+@app.on_event("shutdown")
+def shutdown_parse_pool():
+    parse_pool.shutdown()
+
+
 @app.get("/health")
 def health():
     return {"status": "ok"}
@@ -1,10 +1,14 @@
 # backend/app/models/__init__.py
-from app.models.user import User
+from app.models.user import User, UserDataVersion
 from app.models.category import Category
 from app.models.transaction import Transaction
 from app.models.user_card import UserCard
-from app.models.card_catalog import CardCatalog
+from app.models.card_catalog import CardCatalog, CatalogVersion
 from app.models.card_benefit import CatalogBenefit, UserCardBenefit
 from app.models.email_verification import EmailVerification
+from app.models.card_spending import CardPeriodSpending
+from app.models.import_staging import ImportStaging
+from app.models.import_profile import ImportProfile
+from app.models.import_job import ImportJob
 
-__all__ = ["User", "Category", "Transaction", "UserCard", "CardCatalog", "CatalogBenefit", "UserCardBenefit", "EmailVerification"]
+__all__ = ["User", "UserDataVersion", "Category", "Transaction", "UserCard", "CardCatalog", "CatalogVersion", "CatalogBenefit", "UserCardBenefit", "EmailVerification", "CardPeriodSpending", "ImportStaging", "ImportProfile", "ImportJob"]
@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime, timezone
 
-from sqlalchemy import DateTime, Float, ForeignKey, Integer, String
+from sqlalchemy import DateTime, Float, ForeignKey, Index, Integer, String
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -10,6 +10,7 @@ from app.core.database import Base
 
 class CatalogBenefit(Base):
     __tablename__ = "catalog_benefits"
+    __table_args__ = (Index("ix_catalog_benefits_catalog_created", "catalog_id", "created_at"),)
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     catalog_id: Mapped[uuid.UUID] = mapped_column(
@@ -30,6 +31,7 @@ class CatalogBenefit(Base):
 
 class UserCardBenefit(Base):
     __tablename__ = "user_card_benefits"
+    __table_args__ = (Index("ix_user_card_benefits_card_created", "user_card_id", "created_at"),)
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_card_id: Mapped[uuid.UUID] = mapped_column(
@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime, timezone
 
-from sqlalchemy import Boolean, DateTime, String
+from sqlalchemy import BigInteger, Boolean, DateTime, SmallInteger, String
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -22,3 +22,17 @@ class CardCatalog(Base):
         default=lambda: datetime.now(timezone.utc),
         nullable=False,
     )
+
+
+class CatalogVersion(Base):
+    """Single row (id=1) bumped by every change to card_catalog / catalog_benefits.
+
+    API processes keep the catalog in memory and reload it when the version
+    moves (app/services/catalog_snapshot.py); bump it in the transaction that
+    edits the catalog.
+    """
+
+    __tablename__ = "catalog_version"
+
+    id: Mapped[int] = mapped_column(SmallInteger, primary_key=True, autoincrement=False, default=1)
+    version: Mapped[int] = mapped_column(BigInteger, nullable=False, default=0)
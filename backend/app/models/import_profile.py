@@ -0,0 +1,28 @@
+import uuid
+from datetime import datetime, timezone
+
+from sqlalchemy import DateTime, ForeignKey, String
+from sqlalchemy.dialects.postgresql import JSONB, UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+
+class ImportProfile(Base):
+    """Column mapping a user confirmed for one statement layout (keyed by header fingerprint)."""
+
+    __tablename__ = "import_profiles"
+
+    user_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True
+    )
+    header_hash: Mapped[str] = mapped_column(String(64), primary_key=True)  # sha256 of the header row
+    mapping: Mapped[dict] = mapped_column(JSONB, nullable=False)            # ColumnMapping
+    default_type: Mapped[str] = mapped_column(String(20), nullable=False, default="expense")
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        default=lambda: datetime.now(timezone.utc),
+        onupdate=lambda: datetime.now(timezone.utc),
+        nullable=False,
+    )
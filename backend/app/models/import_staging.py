@@ -0,0 +1,28 @@
+from datetime import datetime, timezone
+
+from sqlalchemy import DateTime, Index, LargeBinary, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.core.database import Base
+
+
+class ImportStaging(Base):
+    """Import preview data shared between API workers (postgres staging backend).
+
+    payload is the headers JSON (length-prefixed) followed by zlib-compressed
+    WorkbookRows (the uploaded file, re-parsed on confirm); see
+    import_cache/postgres.py.
+
+    UNLOGGED: the rows are disposable (5-minute TTL), so WAL is skipped.
+    """
+
+    __tablename__ = "import_staging"
+    __table_args__ = (
+        Index("ix_import_staging_expires_at", "expires_at"),
+        {"prefixes": ["UNLOGGED"]},
+    )
+
+    import_id: Mapped[str] = mapped_column(String(36), primary_key=True)
+    payload: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), nullable=False)
@@ -3,7 +3,7 @@ import uuid
 from datetime import datetime, timezone
 from decimal import Decimal
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, Numeric, String, Text
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, Numeric, String, Text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -12,6 +12,19 @@ from app.core.database import Base
 
 class Transaction(Base):
     __tablename__ = "transactions"
+    __table_args__ = (
+        # list / keyset pagination: WHERE user_id ORDER BY transacted_at DESC, id DESC
+        Index("ix_transactions_user_transacted", "user_id", "transacted_at", "id"),
+        # per-card spending windows; amount included for index-only SUM
+        Index(
+            "ix_transactions_card_type_transacted",
+            "user_card_id", "type", "transacted_at",
+            postgresql_include=["amount"],
+        ),
+        Index("ix_transactions_category_id", "category_id"),
+        # import dedup: INSERT ... ON CONFLICT (user_id, dedup_key) DO NOTHING
+        Index("uq_transactions_user_dedup_key", "user_id", "dedup_key", unique=True),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
@@ -25,5 +38,7 @@ class Transaction(Base):
     )
     is_favorite: Mapped[bool] = mapped_column(Boolean, server_default="false", nullable=False)
     transacted_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    # md5("YYYY-MM-DD:amount:description"); NULL when an identical row already holds the key
+    dedup_key: Mapped[str | None] = mapped_column(String(32), nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), nullable=False)
     updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc), nullable=False)
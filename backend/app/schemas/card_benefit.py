@@ -1,7 +1,7 @@
 import uuid
 from datetime import datetime
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class UserCardBenefitCreate(BaseModel):
@@ -42,6 +42,15 @@ class RecommendRequest(BaseModel):
     category: str | None = None
 
 
+class RecommendBatchItem(BaseModel):
+    category: str | None = None
+    amount: int | None = None  # default 10000, as in RecommendRequest
+
+
+class RecommendBatchRequest(BaseModel):
+    items: list[RecommendBatchItem] = Field(min_length=1, max_length=100)
+
+
 class RecommendResult(BaseModel):
     card_id: str
     card_name: str
@@ -49,3 +58,9 @@ class RecommendResult(BaseModel):
     benefit_description: str
     effective_value: int
     is_near_target: bool
+
+
+class RecommendBatchResult(BaseModel):
+    category: str | None
+    amount: int
+    results: list[RecommendResult]
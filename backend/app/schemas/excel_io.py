@@ -31,3 +31,22 @@ class ImportConfirmResponse(BaseModel):
     duplicate_count: int
     error_count: int
     errors: list[dict]   # [{row: int, message: str}]
+
+
+class ImportJobResponse(ImportConfirmResponse):
+    job_id: str
+    status: str          # pending / running / done / failed
+    total_rows: int
+    processed_rows: int
+    detail: str | None = None   # 실패 사유 (status == failed)
+
+
+class ImportBatchFileResult(BaseModel):
+    filename: str
+    total_rows: int
+    error_count: int
+    detail: str | None = None   # 파일을 읽지 못한 사유 (이 파일은 건너뜀)
+
+
+class ImportBatchResponse(ImportConfirmResponse):
+    files: list[ImportBatchFileResult]   # errors 항목에는 file 키가 추가됨
@@ -45,3 +45,8 @@ class TransactionResponse(BaseModel):
     is_favorite: bool
 
     model_config = {"from_attributes": True}
+
+
+class TransactionPage(BaseModel):
+    items: list[TransactionResponse]
+    next_cursor: str | None  # None when there are no more pages
@@ -39,3 +39,19 @@ class CardPerformanceItem(BaseModel):
     current_spending: int
     remaining: int | None          # None if monthly_target is None
     achievement_percent: float | None
+
+
+class CardPeriodSpendingItem(BaseModel):
+    period_start: date
+    period_end: date
+    spending: int
+    achievement_percent: float | None
+
+
+class CardPerformanceHistoryItem(BaseModel):
+    card_id: str
+    card_name: str
+    card_type: str
+    monthly_target: int | None
+    billing_day: int | None
+    periods: list[CardPeriodSpendingItem]   # 최신 실적기간부터 (periods[1] = 전월 실적)
@@ -0,0 +1,169 @@
+# backend/app/services/benefit_index.py
+"""Per-user compiled benefit table for card recommendation.
+
+A user's cards and the benefits that apply to them (user_card_benefits,
+else the linked catalog card's, taken from the in-memory catalog snapshot)
+are loaded once and compiled into plain
+objects: per card, rules grouped by category, each group sorted by
+min_amount so the rules a payment qualifies for are a bisect away.  Repeat
+recommendations then touch the database only for current-period spending.
+
+The cache lives in the process, but freshness comes from the database:
+each table records the user's data_version (bumped in the same transaction
+as every card and card-benefit write, see data_version) and is rebuilt when
+the version read on lookup differs, so writes made through any worker are
+seen by the next recommendation.  The version is read before the data, so a
+concurrent write can only make a table look older than it is.  A table
+compiled against an older catalog snapshot is rebuilt too, and the least
+recently used users are dropped past RECOMMEND_INDEX_MAX_USERS.
+"""
+import threading
+import uuid
+from bisect import bisect_right
+from collections import OrderedDict
+from typing import Iterator, Sequence
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.card_benefit import UserCardBenefit
+from app.models.user_card import UserCard
+from app.services import catalog_snapshot, data_version
+from app.services.catalog_snapshot import CatalogRule, Snapshot
+
+ALL_CATEGORIES = "전체"
+_NO_MINIMUM = float("-inf")  # threshold of rules without min_amount: any amount qualifies
+
+
+class Rule:
+    __slots__ = ("category", "benefit_type", "rate", "flat_amount", "monthly_cap", "min_amount", "position")
+
+    def __init__(self, b: UserCardBenefit | CatalogRule, position: int) -> None:
+        self.category = b.category
+        self.benefit_type = b.benefit_type
+        self.rate = b.rate
+        self.flat_amount = b.flat_amount
+        self.monthly_cap = b.monthly_cap
+        self.min_amount = b.min_amount or _NO_MINIMUM
+        self.position = position  # order among the card's benefits (created_at), for ties
+
+
+class RuleGroup:
+    """One card's rules for one category, sorted by min_amount."""
+
+    __slots__ = ("thresholds", "rules")
+
+    def __init__(self, rules: list[Rule]) -> None:
+        rules.sort(key=lambda r: (r.min_amount, r.position))
+        self.rules = tuple(rules)
+        self.thresholds = [r.min_amount for r in rules]
+
+    def eligible(self, amount: int) -> tuple[Rule, ...]:
+        """Rules whose min_amount the payment reaches."""
+        return self.rules[:bisect_right(self.thresholds, amount)]
+
+
+class CardRules:
+    __slots__ = ("id", "name", "monthly_target", "billing_day", "by_category")
+
+    def __init__(self, card: UserCard, benefits: Sequence[UserCardBenefit | CatalogRule]) -> None:
+        self.id = card.id
+        self.name = card.name
+        self.monthly_target = card.monthly_target
+        self.billing_day = card.billing_day
+        grouped: dict[str, list[Rule]] = {}
+        for position, b in enumerate(benefits):
+            grouped.setdefault(b.category, []).append(Rule(b, position))
+        self.by_category = {category: RuleGroup(rules) for category, rules in grouped.items()}
+
+    def candidates(self, category: str | None, amount: int) -> Iterator[Rule]:
+        """Rules matching "전체" or `category` that the payment qualifies for."""
+        for key in (ALL_CATEGORIES, category):
+            group = self.by_category.get(key) if key else None
+            if group is not None:
+                yield from group.eligible(amount)
+            if category == ALL_CATEGORIES:
+                break
+
+
+class BenefitIndex:
+    __slots__ = ("cards", "catalog", "data_version")
+
+    def __init__(self, cards: list[CardRules], catalog: Snapshot, version: int) -> None:
+        self.cards = tuple(cards)
+        self.catalog = catalog
+        self.data_version = version
+
+
+_lock = threading.Lock()
+_entries: "OrderedDict[uuid.UUID, BenefitIndex]" = OrderedDict()
+
+
+def _load(db: Session, user_id: uuid.UUID, catalog: Snapshot, version: int) -> BenefitIndex:
+    """Compile the user's cards with benefits, in at most two queries.
+
+    user_card_benefits take priority; cards without any fall back to the
+    benefits of their linked catalog card.  Cards with no benefits at all
+    are left out.
+    """
+    cards = list(
+        db.scalars(
+            select(UserCard).where(UserCard.user_id == user_id).order_by(UserCard.created_at.asc(), UserCard.id.asc())
+        ).all()
+    )
+    if not cards:
+        return BenefitIndex([], catalog, version)
+
+    user_benefits: dict[uuid.UUID, list[UserCardBenefit]] = {}
+    for b in db.scalars(
+        select(UserCardBenefit)
+        .where(UserCardBenefit.user_card_id.in_([c.id for c in cards]))
+        .order_by(UserCardBenefit.created_at.asc(), UserCardBenefit.id.asc())
+    ).all():
+        user_benefits.setdefault(b.user_card_id, []).append(b)
+
+    compiled = []
+    for card in cards:
+        benefits = user_benefits.get(card.id) or catalog.benefits(card.catalog_id)
+        if benefits:
+            compiled.append(CardRules(card, benefits))
+    return BenefitIndex(compiled, catalog, version)
+
+
+def get(db: Session, user_id: uuid.UUID) -> BenefitIndex:
+    """The user's compiled benefit table, built on a miss, a new data version or a new catalog."""
+    catalog = catalog_snapshot.get(db)
+    version = data_version.current(db, user_id)
+    with _lock:
+        index = _entries.get(user_id)
+        if index is not None and index.catalog is catalog and index.data_version == version:
+            _entries.move_to_end(user_id)
+            return index
+
+    index = _load(db, user_id, catalog, version)
+
+    with _lock:
+        current = _entries.get(user_id)
+        if current is None or current.data_version <= version:  # never replace a newer build
+            _entries[user_id] = index
+            _entries.move_to_end(user_id)
+            while len(_entries) > settings.RECOMMEND_INDEX_MAX_USERS:
+                _entries.popitem(last=False)
+    return index
+
+
+def invalidate(user_id: uuid.UUID) -> None:
+    """Drop the user's table after a committed change to their cards or benefits.
+
+    Only frees memory early: the bumped data_version already makes the next
+    lookup, in any process, rebuild it.
+    """
+    with _lock:
+        _entries.pop(user_id, None)
+
+
+def clear() -> None:
+    """Drop every table (tests)."""
+    with _lock:
+        _entries.clear()
@@ -10,18 +10,17 @@ effective_benefit_value:
 performance_bonus:
   remaining / monthly_target < 20%  →  +500 (sort weight)
 
-Benefit priority: user_card_benefits first → catalog_benefits fallback.
+Benefit priority: user_card_benefits first → catalog_benefits fallback
+(resolved when the user's benefit index is compiled, see benefit_index).
 """
 import uuid
-from datetime import date, datetime, timedelta, timezone
+from datetime import date
+from typing import Sequence
 
-from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
-from app.models.card_benefit import CatalogBenefit, UserCardBenefit
-from app.models.user_card import UserCard
 from app.schemas.card_benefit import RecommendResult
-from app.services.user_card import get_performance_period
+from app.services import benefit_index, card_spending
 
 
 # ── Pure calculation helpers ──────────────────────────────────────────────────
@@ -74,133 +73,46 @@ def _benefit_description(
     return " / ".join(parts)
 
 
-# ── Used-this-month for a card-benefit calculation ────────────────────────────
-
-
-def _get_used_benefit_amount(
-    db: Session,
-    user_card_id: uuid.UUID,
-    billing_day: int | None,
-    today: date,
-) -> int:
-    """Approximate 'used benefit amount' this period.
-
-    We proxy used_this_month as current_spending for simplicity — the benefit
-    engine uses this only to cap against monthly_cap.  A more precise
-    implementation would track actual benefit redemptions; this approximation
-    is sufficient for sorting purposes.
-    """
-    from app.models.transaction import Transaction  # avoid circular import
-
-    start, end = get_performance_period(billing_day, today)
-    start_dt = datetime(start.year, start.month, start.day, tzinfo=timezone.utc)
-    end_dt = datetime(
-        (end + timedelta(days=1)).year,
-        (end + timedelta(days=1)).month,
-        (end + timedelta(days=1)).day,
-        tzinfo=timezone.utc,
-    )
-    raw = db.scalar(
-        select(func.sum(Transaction.amount)).where(
-            Transaction.user_card_id == user_card_id,
-            Transaction.type == "expense",
-            Transaction.transacted_at >= start_dt,
-            Transaction.transacted_at < end_dt,
-        )
-    )
-    return int(raw or 0)
-
-
 # ── Main recommend function ───────────────────────────────────────────────────
 
 
-def recommend_cards(
-    db: Session,
-    user_id: uuid.UUID,
-    category: str | None,
+def _rank(
+    cards: Sequence[benefit_index.CardRules],
+    candidates: dict[uuid.UUID, list[benefit_index.Rule]],
+    used_by_card: dict[uuid.UUID, int],
     amount: int,
 ) -> list[RecommendResult]:
-    """Return cards sorted by expected benefit score, highest first.
-
-    category=None  → match only "전체" benefits
-    category=<str> → match exact category OR "전체"
-    """
-    today = date.today()
-
-    cards: list[UserCard] = list(
-        db.scalars(
-            select(UserCard).where(UserCard.user_id == user_id)
-        ).all()
-    )
-
+    """Score each card's candidate benefits for one payment; best card first."""
     results: list[tuple[int, RecommendResult]] = []
 
     for card in cards:
-        # 1. Determine benefits to use (user override first, then catalog fallback)
-        user_benefits: list[UserCardBenefit] = list(
-            db.scalars(
-                select(UserCardBenefit).where(UserCardBenefit.user_card_id == card.id)
-            ).all()
-        )
-
-        if user_benefits:
-            # Use only user-defined benefits
-            candidate_benefits = [
-                (b.category, b.benefit_type, b.rate, b.flat_amount, b.monthly_cap, b.min_amount)
-                for b in user_benefits
-            ]
-        elif card.catalog_id:
-            # Fallback to catalog benefits
-            catalog_benefits: list[CatalogBenefit] = list(
-                db.scalars(
-                    select(CatalogBenefit).where(CatalogBenefit.catalog_id == card.catalog_id)
-                ).all()
-            )
-            candidate_benefits = [
-                (b.category, b.benefit_type, b.rate, b.flat_amount, b.monthly_cap, b.min_amount)
-                for b in catalog_benefits
-            ]
-        else:
-            candidate_benefits = []
-
-        # 2. Filter matching benefits
-        matching = [
-            b for b in candidate_benefits
-            if b[0] == "전체" or (category and b[0] == category)
-        ]
-
-        if not matching:
-            continue
-
-        # 3. Pick best matching benefit for this card
-        used = _get_used_benefit_amount(db, card.id, card.billing_day, today)
+        used = used_by_card.get(card.id, 0)
         best_value = 0
-        best_benefit = None
-        for b in matching:
-            b_cat, b_type, b_rate, b_flat, b_cap, b_min = b
-            # Check min_amount condition
-            if b_min and amount < b_min:
-                continue
-            value = _calc_effective_benefit(b_type, b_rate, b_flat, b_cap, amount, used)
-            if value > best_value:
+        best_rule = None
+        # Pick the best benefit; on equal value the earliest-created benefit wins
+        for rule in candidates[card.id]:
+            value = _calc_effective_benefit(
+                rule.benefit_type, rule.rate, rule.flat_amount, rule.monthly_cap, amount, used
+            )
+            tie = best_rule is not None and value == best_value and rule.position < best_rule.position
+            if value > best_value or tie:
                 best_value = value
-                best_benefit = b
+                best_rule = rule
 
-        if best_benefit is None:
-            # All benefits had min_amount > amount; still include with value=0
-            # only if there's at least one benefit (skip card entirely if no match)
+        if best_rule is None:
+            # No benefit yields a positive value for this amount
             continue
 
-        b_cat, b_type, b_rate, b_flat, b_cap, b_min = best_benefit
-
-        # 4. Performance bonus
+        # Performance bonus
         perf_remaining: int | None = None
         if card.monthly_target is not None:
             perf_remaining = max(0, card.monthly_target - used)
         bonus = _calc_performance_bonus(perf_remaining, card.monthly_target)
         score = best_value + bonus
 
-        description = _benefit_description(b_type, b_rate, b_flat, b_cap, b_cat)
+        description = _benefit_description(
+            best_rule.benefit_type, best_rule.rate, best_rule.flat_amount, best_rule.monthly_cap, best_rule.category
+        )
         is_near = bonus > 0
 
         results.append((
@@ -208,7 +120,7 @@ def recommend_cards(
             RecommendResult(
                 card_id=str(card.id),
                 card_name=card.name,
-                benefit_type=b_type,
+                benefit_type=best_rule.benefit_type,
                 benefit_description=description,
                 effective_value=best_value,
                 is_near_target=is_near,
@@ -217,3 +129,64 @@ def recommend_cards(
 
     results.sort(key=lambda x: x[0], reverse=True)
     return [r for _, r in results]
+
+
+def recommend_cards(
+    db: Session,
+    user_id: uuid.UUID,
+    category: str | None,
+    amount: int,
+) -> list[RecommendResult]:
+    """Return cards sorted by expected benefit score, highest first.
+
+    category=None  → match only "전체" benefits
+    category=<str> → match exact category OR "전체"
+
+    Cards and their benefits come from the user's compiled benefit index
+    (built in two queries plus the in-memory catalog, then cached); period
+    spending is read from the ledger in one query per call.
+    """
+    index = benefit_index.get(db, user_id)
+
+    # Benefits matching the category whose min_amount the payment reaches
+    candidates = {card.id: list(card.candidates(category, amount)) for card in index.cards}
+    matching_cards = [c for c in index.cards if candidates[c.id]]
+
+    # used_this_month is approximated by current-period spending — the engine
+    # uses it only to cap against monthly_cap, which is sufficient for sorting.
+    used_by_card = card_spending.get_spending(db, matching_cards, date.today())
+
+    return _rank(matching_cards, candidates, used_by_card, amount)
+
+
+def recommend_cards_batch(
+    db: Session,
+    user_id: uuid.UUID,
+    items: Sequence[tuple[str | None, int]],
+) -> list[list[RecommendResult]]:
+    """recommend_cards for each (category, amount), in item order.
+
+    Each item is scored independently, exactly as a separate recommend_cards
+    call would (spending is not accumulated across items), but the benefit
+    index and the spending lookup are shared: the batch costs the same
+    queries as a single recommendation.  Repeated items are scored once.
+    """
+    index = benefit_index.get(db, user_id)
+
+    candidates_by_item: dict[tuple[str | None, int], dict[uuid.UUID, list[benefit_index.Rule]]] = {}
+    for category, amount in items:
+        if (category, amount) not in candidates_by_item:
+            candidates_by_item[(category, amount)] = {
+                card.id: list(card.candidates(category, amount)) for card in index.cards
+            }
+
+    matching_ids = {
+        card_id for candidates in candidates_by_item.values() for card_id, rules in candidates.items() if rules
+    }
+    used_by_card = card_spending.get_spending(db, [c for c in index.cards if c.id in matching_ids], date.today())
+
+    ranked: dict[tuple[str | None, int], list[RecommendResult]] = {}
+    for key, candidates in candidates_by_item.items():
+        matching_cards = [c for c in index.cards if candidates[c.id]]
+        ranked[key] = _rank(matching_cards, candidates, used_by_card, key[1])
+    return [list(ranked[(category, amount)]) for category, amount in items]
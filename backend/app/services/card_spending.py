@@ -0,0 +1,239 @@
+"""Per-card, per-performance-period spending ledger.
+
+card_period_spendings holds SUM(amount) of expense transactions for every
+(card, performance period) pair.  The transaction write paths update it in the
+same DB transaction via apply(), so reads are point lookups by
+(user_card_id, period_start) instead of range scans over transactions.
+
+A card's performance period only depends on its billing_day.  Shifting the
+date by offset = 14 - billing_day maps every period onto a calendar month:
+
+    period_start = first_of_month(day + offset) - offset
+
+which equals get_performance_period(billing_day, day)[0] and can be computed
+in SQL as well (see period_start_sql).
+"""
+import uuid
+from collections import defaultdict
+from datetime import date, datetime, timedelta, timezone
+from decimal import Decimal
+from typing import Iterable, NamedTuple
+
+from sqlalchemy import (
+    Date,
+    DateTime,
+    Integer,
+    and_,
+    cast,
+    delete,
+    func,
+    insert,
+    literal,
+    literal_column,
+    select,
+    true,
+    tuple_,
+)
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from app.models.card_spending import CardPeriodSpending
+from app.models.transaction import Transaction
+from app.models.user_card import UserCard
+
+
+class Spend(NamedTuple):
+    """The fields of a transaction that determine its ledger contribution."""
+
+    user_card_id: uuid.UUID | None
+    type: str
+    transacted_at: datetime
+    amount: Decimal
+
+    @classmethod
+    def of(cls, tx: Transaction) -> "Spend":
+        return cls(tx.user_card_id, tx.type, tx.transacted_at, tx.amount)
+
+
+# ── Period keys ───────────────────────────────────────────────────────────────
+
+
+def _offset(billing_day: int | None) -> int:
+    return 0 if billing_day is None else 14 - billing_day
+
+
+def period_start(billing_day: int | None, day: date) -> date:
+    """Start of the performance period containing `day`."""
+    offset = _offset(billing_day)
+    shifted = day + timedelta(days=offset)
+    return shifted.replace(day=1) - timedelta(days=offset)
+
+
+def utc_date(value: datetime) -> date:
+    """Calendar date of a timestamp in UTC."""
+    # Naive datetimes are stored as UTC by PostgreSQL (session timezone UTC).
+    if value.tzinfo is None:
+        return value.date()
+    return value.astimezone(timezone.utc).date()
+
+
+def utc_date_sql(ts):
+    """SQL: calendar date of a timestamptz in UTC."""
+    return cast(ts.op("AT TIME ZONE")(literal_column("'UTC'")), Date)
+
+
+def period_start_sql(billing_day, day, periods_back=None):
+    """SQL counterpart of period_start().
+
+    billing_day is either a column expression or a plain int/None.  Constants
+    are rendered inline so the expression can be repeated in GROUP BY.
+    periods_back (an integer expression) selects the start of that many
+    periods before the one containing `day`.
+    """
+    if billing_day is None or isinstance(billing_day, int):
+        offset = literal_column(str(_offset(billing_day)), Integer)
+    else:
+        offset = func.coalesce(
+            literal_column("14", Integer) - billing_day, literal_column("0", Integer)
+        )
+    month = func.date_trunc(literal_column("'month'"), cast(day + offset, DateTime))
+    if periods_back is not None:
+        month = month - func.make_interval(0, periods_back)
+    return cast(month, Date) - offset
+
+
+# ── Writes ────────────────────────────────────────────────────────────────────
+
+
+def apply(
+    db: Session,
+    added: Iterable[Spend | Transaction] = (),
+    removed: Iterable[Spend | Transaction] = (),
+) -> None:
+    """Add `added` and subtract `removed` from the ledger (no commit).
+
+    Only expense transactions linked to a card contribute.  An edit is
+    expressed as removed=[old values], added=[new values], which moves the
+    amount between cards and periods as needed.
+    """
+    entries = [(s, 1) for s in added] + [(s, -1) for s in removed]
+    entries = [(s, sign) for s, sign in entries if s.type == "expense" and s.user_card_id is not None]
+    if not entries:
+        return
+
+    billing_days: dict[uuid.UUID, int | None] = dict(
+        db.execute(
+            select(UserCard.id, UserCard.billing_day).where(
+                UserCard.id.in_({s.user_card_id for s, _ in entries})
+            )
+        ).all()
+    )
+
+    deltas: dict[tuple[uuid.UUID, date], Decimal] = defaultdict(Decimal)
+    for s, sign in entries:
+        if s.user_card_id not in billing_days:
+            continue
+        key = (s.user_card_id, period_start(billing_days[s.user_card_id], utc_date(s.transacted_at)))
+        deltas[key] += sign * Decimal(s.amount)
+
+    rows = [
+        {"user_card_id": card_id, "period_start": start, "amount": amount}
+        for (card_id, start), amount in deltas.items()
+        if amount != 0
+    ]
+    if not rows:
+        return
+
+    stmt = pg_insert(CardPeriodSpending).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[CardPeriodSpending.user_card_id, CardPeriodSpending.period_start],
+        set_={
+            "amount": CardPeriodSpending.amount + stmt.excluded.amount,
+            "updated_at": func.now(),
+        },
+    )
+    db.execute(stmt)
+
+
+def rebuild_card(db: Session, card: UserCard) -> None:
+    """Recompute every ledger row of a card (no commit).
+
+    Needed when billing_day changes, since that moves all period boundaries.
+    """
+    db.execute(delete(CardPeriodSpending).where(CardPeriodSpending.user_card_id == card.id))
+    start = period_start_sql(card.billing_day, utc_date_sql(Transaction.transacted_at))
+    db.execute(
+        insert(CardPeriodSpending).from_select(
+            ["user_card_id", "period_start", "amount", "updated_at"],
+            select(Transaction.user_card_id, start, func.sum(Transaction.amount), func.now())
+            .where(Transaction.user_card_id == card.id, Transaction.type == "expense")
+            .group_by(Transaction.user_card_id, start),
+        )
+    )
+
+
+# ── Reads ─────────────────────────────────────────────────────────────────────
+
+
+def get_spending(db: Session, cards: list[UserCard], today: date) -> dict[uuid.UUID, int]:
+    """Current-period spending for each card, in one point-lookup query.
+
+    Only id and billing_day are read, so compiled cards (benefit_index) work too.
+    """
+    if not cards:
+        return {}
+    keys = [(c.id, period_start(c.billing_day, today)) for c in cards]
+    rows = db.execute(
+        select(CardPeriodSpending.user_card_id, CardPeriodSpending.amount).where(
+            tuple_(CardPeriodSpending.user_card_id, CardPeriodSpending.period_start).in_(keys)
+        )
+    ).all()
+    return {card_id: int(amount) for card_id, amount in rows}
+
+
+def get_cards_with_spending(db: Session, user_id: uuid.UUID, today: date) -> list[tuple[UserCard, int]]:
+    """All of a user's cards (oldest first) with their current-period spending, in one query.
+
+    Each card's period start is computed in SQL from its billing_day and joined
+    to the ledger's primary key, so the cost does not grow per card.
+    """
+    start = period_start_sql(UserCard.billing_day, cast(literal(today), Date))
+    rows = db.execute(
+        select(UserCard, func.coalesce(CardPeriodSpending.amount, 0))
+        .outerjoin(
+            CardPeriodSpending,
+            and_(CardPeriodSpending.user_card_id == UserCard.id, CardPeriodSpending.period_start == start),
+        )
+        .where(UserCard.user_id == user_id)
+        .order_by(UserCard.created_at.asc())
+    ).all()
+    return [(card, int(amount)) for card, amount in rows]
+
+
+def get_spending_history(
+    db: Session, user_id: uuid.UUID, today: date, periods: int
+) -> list[tuple[UserCard, list[tuple[date, int]]]]:
+    """Spending of each card over its last `periods` performance periods, newest first.
+
+    One query: generate_series(0, periods - 1) crossed with the user's cards
+    yields every (card, period_start) in SQL, joined to the ledger's primary
+    key; periods without spending come back as 0.
+    """
+    back = func.generate_series(0, periods - 1).table_valued("n").alias("back")
+    start = period_start_sql(UserCard.billing_day, cast(literal(today), Date), back.c.n)
+    rows = db.execute(
+        select(UserCard, start, func.coalesce(CardPeriodSpending.amount, 0))
+        .select_from(UserCard)
+        .join(back, true())
+        .outerjoin(
+            CardPeriodSpending,
+            and_(CardPeriodSpending.user_card_id == UserCard.id, CardPeriodSpending.period_start == start),
+        )
+        .where(UserCard.user_id == user_id)
+        .order_by(UserCard.created_at.asc(), UserCard.id, back.c.n)
+    ).all()
+
+    history: dict[uuid.UUID, tuple[UserCard, list[tuple[date, int]]]] = {}
+    for card, period, amount in rows:
+        history.setdefault(card.id, (card, []))[1].append((period, int(amount)))
+    return list(history.values())
@@ -0,0 +1,174 @@
+# backend/app/services/catalog_snapshot.py
+"""Immutable in-memory snapshot of the card catalog.
+
+card_catalog and catalog_benefits are reference data changed only by
+migrations or manual SQL, so each process loads them whole (at startup and
+on version change) instead of querying on every request.  A snapshot is
+never mutated: a reload builds a new one and swaps the module reference,
+so readers always see one consistent catalog.
+
+Freshness comes from the single-row catalog_version table.  Whoever edits
+the catalog bumps it in the same transaction (bump()); get() re-reads the
+version at most every CATALOG_VERSION_CHECK_SECONDS and reloads when it
+moved.  The version is read before the data, so a concurrent edit can only
+make a snapshot look older than it is, never newer.
+
+Catalog responses are serialized once per snapshot and carry strong ETags
+(hash of the body), so clients revalidate with If-None-Match for free.
+"""
+import hashlib
+import logging
+import threading
+import time
+import uuid
+from datetime import datetime
+from types import MappingProxyType
+from typing import Mapping, NamedTuple
+
+from sqlalchemy import Connection, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import SessionLocal
+from app.models.card_benefit import CatalogBenefit
+from app.models.card_catalog import CardCatalog, CatalogVersion
+from app.schemas.card_catalog import CardCatalogResponse
+
+logger = logging.getLogger(__name__)
+
+
+class CatalogCard(NamedTuple):
+    id: uuid.UUID
+    name: str
+    issuer: str
+    card_type: str
+    image_url: str | None
+    is_active: bool
+    created_at: datetime
+
+
+class CatalogRule(NamedTuple):
+    category: str
+    benefit_type: str
+    rate: float | None
+    flat_amount: int | None
+    monthly_cap: int | None
+    min_amount: int | None
+
+
+def etag_for(body: bytes) -> str:
+    return '"' + hashlib.sha256(body).hexdigest()[:32] + '"'
+
+
+class Snapshot:
+    """One version of the catalog: active cards sorted by issuer and name,
+    benefits of every card (inactive ones too: linked user cards still fall
+    back to them), and pre-serialized JSON bodies."""
+
+    __slots__ = ("version", "active", "_by_id", "_benefits", "_json", "list_body", "list_etag")
+
+    def __init__(self, version: int, cards: list[CatalogCard], benefits: dict[uuid.UUID, list[CatalogRule]]) -> None:
+        self.version = version
+        self.active = tuple(sorted((c for c in cards if c.is_active), key=lambda c: (c.issuer, c.name)))
+        self._by_id: Mapping[uuid.UUID, CatalogCard] = MappingProxyType({c.id: c for c in self.active})
+        self._benefits: Mapping[uuid.UUID, tuple[CatalogRule, ...]] = MappingProxyType(
+            {catalog_id: tuple(rules) for catalog_id, rules in benefits.items()}
+        )
+        self._json: Mapping[uuid.UUID, bytes] = MappingProxyType(
+            {c.id: CardCatalogResponse.model_validate(c._asdict()).model_dump_json().encode() for c in self.active}
+        )
+        self.list_body = self._list_json(self.active)
+        self.list_etag = etag_for(self.list_body)
+
+    def _list_json(self, cards: tuple[CatalogCard, ...] | list[CatalogCard]) -> bytes:
+        return b"[" + b",".join(self._json[c.id] for c in cards) + b"]"
+
+    def search(self, q: str | None) -> bytes:
+        """JSON list of active cards whose name or issuer contains q (case-insensitive)."""
+        if not q:
+            return self.list_body
+        needle = q.lower()
+        return self._list_json([c for c in self.active if needle in c.name.lower() or needle in c.issuer.lower()])
+
+    def card_json(self, catalog_id: uuid.UUID) -> bytes | None:
+        """JSON of an active card, or None."""
+        return self._json.get(catalog_id)
+
+    def get(self, catalog_id: uuid.UUID) -> CatalogCard | None:
+        return self._by_id.get(catalog_id)
+
+    def benefits(self, catalog_id: uuid.UUID | None) -> tuple[CatalogRule, ...]:
+        """Benefits of a catalog card in created_at order (empty if none)."""
+        return self._benefits.get(catalog_id, ()) if catalog_id else ()
+
+
+_lock = threading.Lock()
+_snapshot: Snapshot | None = None
+_checked_at = 0.0
+
+
+def _read_version(db: Session) -> int:
+    return db.scalar(select(CatalogVersion.version).where(CatalogVersion.id == 1)) or 0
+
+
+def _load(db: Session, version: int) -> Snapshot:
+    cards = [
+        CatalogCard(c.id, c.name, c.issuer, c.card_type, c.image_url, c.is_active, c.created_at)
+        for c in db.scalars(select(CardCatalog)).all()
+    ]
+    benefits: dict[uuid.UUID, list[CatalogRule]] = {}
+    for b in db.scalars(
+        select(CatalogBenefit).order_by(CatalogBenefit.created_at.asc(), CatalogBenefit.id.asc())
+    ).all():
+        benefits.setdefault(b.catalog_id, []).append(
+            CatalogRule(b.category, b.benefit_type, b.rate, b.flat_amount, b.monthly_cap, b.min_amount)
+        )
+    return Snapshot(version, cards, benefits)
+
+
+def reload(db: Session) -> Snapshot:
+    """Load the catalog now and make it the current snapshot."""
+    global _snapshot, _checked_at
+    with _lock:
+        version = _read_version(db)
+        _snapshot = _load(db, version)
+        _checked_at = time.monotonic()
+        return _snapshot
+
+
+def get(db: Session) -> Snapshot:
+    """The current snapshot, reloaded first if catalog_version moved since the last check."""
+    global _snapshot, _checked_at
+    snapshot = _snapshot
+    if snapshot is not None and time.monotonic() - _checked_at < settings.CATALOG_VERSION_CHECK_SECONDS:
+        return snapshot
+
+    with _lock:
+        snapshot = _snapshot
+        if snapshot is not None and time.monotonic() - _checked_at < settings.CATALOG_VERSION_CHECK_SECONDS:
+            return snapshot  # another thread checked meanwhile
+        version = _read_version(db)
+        if snapshot is None or version != snapshot.version:
+            snapshot = _snapshot = _load(db, version)
+        _checked_at = time.monotonic()
+        return snapshot
+
+
+def load_at_startup() -> None:
+    """Warm the snapshot; if the database is not reachable yet, the first request loads it."""
+    try:
+        with SessionLocal() as db:
+            reload(db)
+    except SQLAlchemyError:
+        logger.warning("card catalog not loaded at startup", exc_info=True)
+
+
+def bump(db: Session | Connection) -> None:
+    """Advance catalog_version (Session or Connection; caller commits with its catalog changes)."""
+    db.execute(
+        insert(CatalogVersion)
+        .values(id=1, version=1)
+        .on_conflict_do_update(index_elements=[CatalogVersion.id], set_={"version": CatalogVersion.version + 1})
+    )
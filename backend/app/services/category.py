@@ -7,6 +7,7 @@ from sqlalchemy.orm import Session
 
 from app.models.category import Category
 from app.schemas.category import CategoryCreate, CategoryUpdate
+from app.services import data_version
 
 
 def list_categories(db: Session, user_id: uuid.UUID) -> list[Category]:
@@ -39,6 +40,7 @@ def create_category(db: Session, user_id: uuid.UUID, data: CategoryCreate) -> Ca
         color=data.color,
     )
     db.add(category)
+    data_version.bump(db, user_id)
     db.commit()
     db.refresh(category)
     return category
@@ -61,6 +63,7 @@ def update_category(
         raise HTTPException(status_code=403, detail="기본 카테고리는 수정할 수 없습니다.")
     for field, value in data.model_dump(exclude_unset=True).items():
         setattr(category, field, value)
+    data_version.bump(db, user_id)
     db.commit()
     db.refresh(category)
     return category
@@ -71,6 +74,7 @@ def delete_category(db: Session, user_id: uuid.UUID, category_id: uuid.UUID) ->
     if category.is_default:
         raise HTTPException(status_code=403, detail="기본 카테고리는 삭제할 수 없습니다.")
     db.delete(category)
+    data_version.bump(db, user_id)
     db.commit()
 
 
@@ -100,4 +104,5 @@ DEFAULT_CATEGORIES: list[dict] = [
 def seed_default_categories(db: Session, user_id: uuid.UUID) -> None:
     for item in DEFAULT_CATEGORIES:
         db.add(Category(user_id=user_id, is_default=True, **item))
+    data_version.bump(db, user_id)
     db.commit()
@@ -0,0 +1,203 @@
+# backend/app/services/columnar.py
+"""Compact columnar binary format for transaction exports.
+
+Parquet-like in spirit (typed columns, dictionary encoding, row groups) but
+written front to back so it can be streamed straight from a database
+cursor: there is no footer to seek back to.  All integers are little-endian.
+
+    file       := MAGIC  u32 schema_len  schema_json  row_group*  u32 0
+    row_group  := u32 n  column_chunk*          (one chunk per schema column)
+    chunk      := u32 byte_len  payload
+
+Column payloads by type:
+
+    timestamp  validity bitmap, n x i64 microseconds since the Unix epoch (UTC)
+    decimal    validity bitmap, n x i64 unscaled value (value * 10**scale)
+    string     validity bitmap, (n + 1) x u32 offsets, UTF-8 bytes
+    dict       u32 k, (k + 1) x u32 offsets, UTF-8 bytes of the k values added
+               to the column dictionary by this row group, n x i32 codes into
+               the dictionary accumulated so far (-1 = null)
+
+The validity bitmap is ceil(n / 8) bytes, bit i (LSB first) set when row i
+is not null; null slots hold 0 / empty strings.  read() decodes a file back
+into Python columns.
+"""
+import json
+import struct
+import sys
+from array import array
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from typing import IO, Iterable, Iterator, Sequence
+
+MAGIC = b"BBCOL\x00\x01\n"
+TIMESTAMP = "timestamp"
+DECIMAL = "decimal"
+STRING = "string"
+DICT = "dict"
+
+_U32 = struct.Struct("<I")
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _little(values: array) -> bytes:
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values.tobytes()
+
+
+def _bitmap(present: Iterable[bool], n: int) -> bytes:
+    bits = bytearray((n + 7) // 8)
+    for i, ok in enumerate(present):
+        if ok:
+            bits[i >> 3] |= 1 << (i & 7)
+    return bytes(bits)
+
+
+def _strings(values: Sequence[str]) -> bytes:
+    encoded = [v.encode("utf-8") for v in values]
+    offsets = array("I", [0])
+    total = 0
+    for b in encoded:
+        total += len(b)
+        offsets.append(total)
+    return _little(offsets) + b"".join(encoded)
+
+
+class Writer:
+    """Encodes row groups for a fixed schema: [(name, type[, scale])]."""
+
+    def __init__(self, schema: Sequence[tuple]) -> None:
+        self.schema = [{"name": c[0], "type": c[1], **({"scale": c[2]} if c[1] == DECIMAL else {})} for c in schema]
+        self._dicts: list[dict[str, int] | None] = [{} if c["type"] == DICT else None for c in self.schema]
+
+    def header(self) -> bytes:
+        schema = json.dumps({"columns": self.schema}, ensure_ascii=False).encode("utf-8")
+        return MAGIC + _U32.pack(len(schema)) + schema
+
+    def footer(self) -> bytes:
+        return _U32.pack(0)
+
+    def row_group(self, columns: Sequence[Sequence]) -> bytes:
+        """Encode one row group given as a list of column value lists (None = null)."""
+        n = len(columns[0])
+        parts = [_U32.pack(n)]
+        for spec, values, dictionary in zip(self.schema, columns, self._dicts):
+            payload = self._encode(spec, values, n, dictionary)
+            parts.append(_U32.pack(len(payload)))
+            parts.append(payload)
+        return b"".join(parts)
+
+    @staticmethod
+    def _encode(spec: dict, values: Sequence, n: int, dictionary: dict[str, int] | None) -> bytes:
+        kind = spec["type"]
+        if kind == DICT:
+            added: list[str] = []
+            codes = array("i")
+            for v in values:
+                if v is None:
+                    codes.append(-1)
+                    continue
+                code = dictionary.get(v)
+                if code is None:
+                    code = dictionary[v] = len(dictionary)
+                    added.append(v)
+                codes.append(code)
+            return _U32.pack(len(added)) + _strings(added) + _little(codes)
+
+        validity = _bitmap((v is not None for v in values), n)
+        if kind == TIMESTAMP:
+            micros = array("q", (
+                0 if v is None else (v - _EPOCH) // timedelta(microseconds=1) for v in values
+            ))
+            return validity + _little(micros)
+        if kind == DECIMAL:
+            factor = 10 ** spec["scale"]
+            unscaled = array("q", (0 if v is None else int(v * factor) for v in values))
+            return validity + _little(unscaled)
+        if kind == STRING:
+            return validity + _strings(["" if v is None else v for v in values])
+        raise ValueError(f"unknown column type: {kind}")
+
+
+# ── Reading ──────────────────────────────────────────────────────────────────
+
+
+class _Cursor:
+    def __init__(self, data: bytes) -> None:
+        self.data = memoryview(data)
+        self.pos = 0
+
+    def take(self, size: int) -> memoryview:
+        if self.pos + size > len(self.data):
+            raise ValueError("truncated columnar file")
+        chunk = self.data[self.pos:self.pos + size]
+        self.pos += size
+        return chunk
+
+    def u32(self) -> int:
+        return _U32.unpack(self.take(4))[0]
+
+
+def _array(code: str, raw: memoryview) -> array:
+    values = array(code)
+    values.frombytes(raw)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+
+def _read_strings(cur: _Cursor, count: int) -> list[str]:
+    offsets = _array("I", cur.take(4 * (count + 1)))
+    blob = bytes(cur.take(offsets[-1]))
+    return [blob[offsets[i]:offsets[i + 1]].decode("utf-8") for i in range(count)]
+
+
+def _decode(spec: dict, payload: memoryview, n: int, dictionary: list[str]) -> list:
+    cur = _Cursor(payload)
+    kind = spec["type"]
+    if kind == DICT:
+        dictionary.extend(_read_strings(cur, cur.u32()))
+        return [None if c < 0 else dictionary[c] for c in _array("i", cur.take(4 * n))]
+
+    bits = cur.take((n + 7) // 8)
+    present = [bool(bits[i >> 3] >> (i & 7) & 1) for i in range(n)]
+    if kind == TIMESTAMP:
+        values = [_EPOCH + timedelta(microseconds=v) for v in _array("q", cur.take(8 * n))]
+    elif kind == DECIMAL:
+        scale = spec["scale"]
+        values = [Decimal(v).scaleb(-scale) for v in _array("q", cur.take(8 * n))]
+    elif kind == STRING:
+        values = _read_strings(cur, n)
+    else:
+        raise ValueError(f"unknown column type: {kind}")
+    return [v if ok else None for v, ok in zip(values, present)]
+
+
+def _open(data: bytes) -> tuple[_Cursor, list[dict]]:
+    cur = _Cursor(data)
+    if bytes(cur.take(len(MAGIC))) != MAGIC:
+        raise ValueError("not a columnar export file")
+    return cur, json.loads(bytes(cur.take(cur.u32())))["columns"]
+
+
+def iter_row_groups(data: bytes) -> Iterator[dict[str, list]]:
+    """Yield each row group of a columnar file as {column name: values}."""
+    cur, schema = _open(data)
+    dictionaries: list[list[str]] = [[] for _ in schema]
+    while n := cur.u32():
+        yield {
+            spec["name"]: _decode(spec, cur.take(cur.u32()), n, dictionary)
+            for spec, dictionary in zip(schema, dictionaries)
+        }
+
+
+def read(fh: IO[bytes] | bytes) -> dict[str, list]:
+    """Decode a whole columnar file into {column name: values}."""
+    data = fh if isinstance(fh, bytes) else fh.read()
+    _, schema = _open(data)
+    columns: dict[str, list] = {spec["name"]: [] for spec in schema}
+    for group in iter_row_groups(data):
+        for name, values in group.items():
+            columns[name].extend(values)
+    return columns
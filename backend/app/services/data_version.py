@@ -0,0 +1,32 @@
+# backend/app/services/data_version.py
+"""Per-user data version: a counter bumped by every write to the user's
+transactions, categories or cards (card benefits included).
+
+Derived results (the export cache, the recommendation benefit index) are
+keyed by it, so they never need to be invalidated explicitly.  bump() runs
+in the writer's transaction: the new version becomes visible together with
+the data it describes.  The counter lives in user_data_versions, not users,
+so a long import does not hold the users row lock or touch updated_at.
+"""
+import uuid
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.models.user import UserDataVersion
+
+
+def bump(db: Session, user_id: uuid.UUID) -> None:
+    """Increment the user's data version (caller commits)."""
+    db.execute(
+        insert(UserDataVersion)
+        .values(user_id=user_id, version=1)
+        .on_conflict_do_update(
+            index_elements=[UserDataVersion.user_id], set_={"version": UserDataVersion.version + 1}
+        )
+    )
+
+
+def current(db: Session, user_id: uuid.UUID) -> int:
+    return db.scalar(select(UserDataVersion.version).where(UserDataVersion.user_id == user_id)) or 0
@@ -1,24 +1,49 @@
 # backend/app/services/excel_io.py
 """Core logic for Excel import/export of transactions."""
+import csv
 import re
+import tempfile
 import uuid
-from datetime import datetime, timezone
+from contextlib import aclosing
+from datetime import date, datetime, timedelta, timezone
 from decimal import Decimal, InvalidOperation
-from io import BytesIO
+from io import StringIO
+from itertools import islice
+from typing import IO, Callable, Iterable, Iterator, NamedTuple
 
 import openpyxl
-import xlrd
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Alignment, Font, PatternFill
 from fastapi import HTTPException
-from sqlalchemy import select
+from sqlalchemy import select, text
+from starlette.concurrency import run_in_threadpool
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 
+from app.core.config import settings
+from app.core.database import SessionLocal
 from app.models.transaction import Transaction
 from app.models.user_card import UserCard
-from app.schemas.excel_io import ColumnMapping, ImportConfirmResponse, ImportPreviewResponse
-from app.services import import_cache
+from app.schemas.excel_io import (
+    ColumnMapping,
+    ImportBatchFileResult,
+    ImportBatchResponse,
+    ImportConfirmResponse,
+    ImportPreviewResponse,
+)
+from app.services import (
+    card_spending,
+    columnar,
+    data_version,
+    export_cache,
+    import_cache,
+    import_profile,
+    parse_pool,
+    sheet_reader,
+)
 from app.services.category import list_categories
-from app.services.transaction import list_transactions
+from app.services.import_cache import WorkbookRows
+from app.services.transaction import compute_dedup_key, transactions_query
 
 # ── Header pattern matching ──────────────────────────────────────────────────
 
@@ -44,6 +69,13 @@ TYPE_MAP: dict[str, str] = {
     "transfer": "transfer",
 }
 
+PAYMENT_TYPE_MAP: dict[str, str] = {
+    "현금": "cash", "cash": "cash",
+    "신용카드": "credit_card", "credit_card": "credit_card", "credit": "credit_card",
+    "체크카드": "debit_card", "debit_card": "debit_card", "debit": "debit_card",
+    "계좌이체": "bank", "bank": "bank", "이체": "bank",
+}
+
 # ── Auto-detect column mapping ───────────────────────────────────────────────
 
 
@@ -62,85 +94,46 @@ def auto_detect_mapping(headers: list[str]) -> ColumnMapping:
 # ── Parse and preview ────────────────────────────────────────────────────────
 
 
-def _read_rows_xlsx(file_bytes: bytes) -> list[list]:
-    """Read all rows from an xlsx file."""
-    wb = openpyxl.load_workbook(BytesIO(file_bytes), read_only=True, data_only=True)
-    ws = wb.active
-    if ws is None:
-        wb.close()
-        return []
-    rows: list[list] = []
-    for row in ws.iter_rows():
-        rows.append([cell.value for cell in row])
-    wb.close()
-    return rows
-
-
-def _read_rows_xls(file_bytes: bytes) -> list[list]:
-    """Read all rows from an xls (Excel 97-2003) file."""
-    wb = xlrd.open_workbook(file_contents=file_bytes)
-    if wb.nsheets == 0:
-        return []
-    ws = wb.sheet_by_index(0)
-    rows: list[list] = []
-    for row_idx in range(ws.nrows):
-        row_values: list = []
-        for col_idx in range(ws.ncols):
-            cell = ws.cell(row_idx, col_idx)
-            if cell.ctype == xlrd.XL_CELL_DATE:
-                # Convert xlrd date tuple to datetime
-                dt_tuple = xlrd.xldate_as_tuple(cell.value, wb.datemode)
-                row_values.append(datetime(*dt_tuple[:6], tzinfo=timezone.utc))
-            else:
-                row_values.append(cell.value)
-        rows.append(row_values)
-    return rows
-
-
-def parse_and_preview(file_bytes: bytes, filename: str = "") -> ImportPreviewResponse:
-    """Parse an xlsx/xls file and return a preview with auto-detected mapping."""
-    is_xls = filename.lower().endswith(".xls") and not filename.lower().endswith(".xlsx")
-
-    try:
-        if is_xls:
-            all_rows = _read_rows_xls(file_bytes)
-        else:
-            all_rows = _read_rows_xlsx(file_bytes)
-    except Exception:
-        fmt = "xls" if is_xls else "xlsx"
-        raise HTTPException(status_code=400, detail=f"올바른 {fmt} 파일이 아닙니다.")
+PREVIEW_ROWS = 10
 
-    if len(all_rows) == 0:
-        raise HTTPException(status_code=400, detail="빈 엑셀 파일입니다.")
 
-    headers = [str(v) if v is not None else "" for v in all_rows[0]]
-    data_rows = all_rows[1:]
+def _store_preview(file_bytes: bytes, sample: sheet_reader.SheetSample) -> ImportPreviewResponse:
+    import_id = import_cache.store(sample.headers, WorkbookRows(file_bytes, sample.fmt, sample.total_rows))
+    return ImportPreviewResponse(
+        import_id=import_id,
+        headers=sample.headers,
+        auto_mapping=auto_detect_mapping(sample.headers),
+        preview_rows=sample.preview_rows,
+        total_rows=sample.total_rows,
+    )
 
-    if len(data_rows) == 0:
-        raise HTTPException(status_code=400, detail="데이터 행이 없습니다.")
 
-    auto_mapping = auto_detect_mapping(headers)
+def parse_and_preview(file_bytes: bytes, filename: str = "") -> ImportPreviewResponse:
+    """Parse an xlsx/xls/csv file and return a preview with auto-detected mapping.
 
-    # Convert all cell values to strings for preview
-    preview_rows: list[list[str | None]] = []
-    for row in data_rows[:10]:
-        preview_rows.append([str(v) if v is not None else None for v in row])
+    Only the header and the first PREVIEW_ROWS rows are read; the file itself
+    is cached (WorkbookRows) and streamed again by confirm_import, so preview
+    latency does not grow with the statement length.
+    """
+    try:
+        sample = sheet_reader.inspect(file_bytes, filename, PREVIEW_ROWS)
+    except sheet_reader.SheetError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return _store_preview(file_bytes, sample)
 
-    # Store in cache
-    # Convert data rows for cache (keep original types for parsing later)
-    cache_rows = []
-    for row in data_rows:
-        cache_rows.append([v for v in row])
 
-    import_id = import_cache.store(headers, cache_rows)
+async def parse_and_preview_async(file_bytes: bytes, filename: str = "") -> ImportPreviewResponse:
+    """parse_and_preview with the workbook decoding done in the parse process pool.
 
-    return ImportPreviewResponse(
-        import_id=import_id,
-        headers=headers,
-        auto_mapping=auto_mapping,
-        preview_rows=preview_rows,
-        total_rows=len(data_rows),
-    )
+    The cache entry is written from this API process, since the in-memory
+    staging backend is per process, but on the thread pool: with the postgres
+    backend it is a database write of the whole file.
+    """
+    try:
+        sample = await parse_pool.run(sheet_reader.inspect, file_bytes, filename, PREVIEW_ROWS)
+    except sheet_reader.SheetError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return await run_in_threadpool(_store_preview, file_bytes, sample)
 
 
 # ── Date parsing ─────────────────────────────────────────────────────────────
@@ -203,8 +196,407 @@ def _parse_type(value, default_type: str) -> str:
     return TYPE_MAP.get(s, default_type)
 
 
+# ── Column compilation ───────────────────────────────────────────────────────
+#
+# confirm_import looks at a sample of each mapped column once and picks a
+# specialized parser for it (native datetime, "YYYY-MM-DD", "YY.MM.DD",
+# int/float, "1,234원"), then maps those parsers over each chunk column by
+# column.  Every fast parser falls back to the generic _parse_* function on
+# anything it does not recognize, so results are identical to the generic
+# path; the fast paths only skip the regex work for the common shapes.
+
+_COMPILE_SAMPLE_ROWS = 50
+PARSE_CHUNK_SIZE = 1000
+_DATE_SEPARATORS = frozenset("-/.")
+_AMOUNT_STRIP = str.maketrans("", "", "원₩, \t\u00a0\u3000")
+_UTC = timezone.utc
+_MEMO_LIMIT = 4096
+
+
+def _date_native(value) -> datetime | None:
+    if value.__class__ is datetime:
+        return value if value.tzinfo is not None else value.replace(tzinfo=_UTC)
+    return _parse_date(value)
+
+
+def _ascii_digits(s: str) -> bool:
+    # str.isdigit() alone also accepts "²", "①" etc., which int() rejects
+    return s.isascii() and s.isdigit()
+
+
+def _is_iso_date(s: str) -> bool:
+    # "YYYY-MM-DD", "YYYY/MM/DD", "YYYY.MM.DD", optionally followed by a time
+    return (
+        len(s) >= 10 and s[4] in _DATE_SEPARATORS and s[7] in _DATE_SEPARATORS
+        and _ascii_digits(s[0:4]) and _ascii_digits(s[5:7]) and _ascii_digits(s[8:10])
+        and (len(s) == 10 or not s[10].isdigit())
+    )
+
+
+def _is_short_date(s: str) -> bool:
+    # "YY.MM.DD" (or - and /) as used by card company exports
+    return (
+        len(s) >= 8 and s[2] in _DATE_SEPARATORS and s[5] in _DATE_SEPARATORS
+        and _ascii_digits(s[0:2]) and _ascii_digits(s[3:5]) and _ascii_digits(s[6:8])
+        and (len(s) == 8 or not s[8].isdigit())
+    )
+
+
+def _date_iso(value) -> datetime | None:
+    if value.__class__ is str:
+        s = value.strip()
+        if _is_iso_date(s):
+            try:
+                y = int(s[0:4])
+                return datetime(y + 2000 if y < 100 else y, int(s[5:7]), int(s[8:10]), tzinfo=_UTC)
+            except ValueError:
+                pass
+    return _parse_date(value)
+
+
+def _date_short(value) -> datetime | None:
+    if value.__class__ is str:
+        s = value.strip()
+        if _is_short_date(s):
+            try:
+                return datetime(2000 + int(s[0:2]), int(s[3:5]), int(s[6:8]), tzinfo=_UTC)
+            except ValueError:
+                pass
+    return _parse_date(value)
+
+
+def _amount_number(value) -> Decimal | None:
+    cls = value.__class__
+    if cls is int or cls is float:
+        return Decimal(str(abs(value)))
+    return _parse_amount(value)
+
+
+def _amount_text(value) -> Decimal | None:
+    # "15000", "15,000", "15,000원", "₩15,000", "-15,000"
+    if value.__class__ is str:
+        s = value.translate(_AMOUNT_STRIP)
+        if s:
+            try:
+                return abs(Decimal(s))
+            except InvalidOperation:
+                pass
+    return _parse_amount(value)
+
+
+def _compile_date(sample: list) -> Callable[[object], datetime | None]:
+    values = [v for v in sample if v is not None]
+    if values and all(isinstance(v, datetime) for v in values):
+        return _date_native
+    texts = [v.strip() for v in values if isinstance(v, str)]
+    if texts and sum(map(_is_short_date, texts)) > sum(map(_is_iso_date, texts)):
+        return _date_short
+    if texts:
+        return _date_iso
+    return _parse_date
+
+
+def _compile_amount(sample: list) -> Callable[[object], Decimal | None]:
+    values = [v for v in sample if v is not None]
+    if values and all(isinstance(v, (int, float)) for v in values):
+        return _amount_number
+    if values:
+        return _amount_text
+    return _parse_amount
+
+
+def _column(rows: list[list], idx: int | None) -> list:
+    """Values of one column across a chunk (None where the row is short)."""
+    if idx is None:
+        return [None] * len(rows)
+    return [row[idx] if idx < len(row) else None for row in rows]
+
+
+class _Memo(dict):
+    """Per-column cache of parser results keyed by the raw cell value.
+
+    Statement columns repeat a lot (dates, merchant categories, card names),
+    so most cells become a C-level dict hit; caching stops at _MEMO_LIMIT
+    distinct values to keep high-cardinality columns bounded.
+    """
+
+    __slots__ = ("_fn",)
+
+    def __init__(self, fn: Callable) -> None:
+        super().__init__()
+        self._fn = fn
+
+    def __missing__(self, key):
+        value = self._fn(key)
+        if len(self) < _MEMO_LIMIT:
+            self[key] = value
+        return value
+
+
+def _description(value) -> str | None:
+    return str(value) if value is not None else None
+
+
+def _payment_type(value) -> str | None:
+    if value is None:
+        return None
+    s = str(value).strip()
+    return PAYMENT_TYPE_MAP.get(s.lower()) if s else s
+
+
+def _name_lookup(names: dict[str, uuid.UUID]) -> Callable[[object], uuid.UUID | None]:
+    def lookup(value) -> uuid.UUID | None:
+        if value is None:
+            return None
+        name = str(value).strip().lower()
+        return names.get(name) if name else None
+    return lookup
+
+
+def _parse_rows(
+    rows: Iterable[list],
+    mapping: ColumnMapping,
+    default_type: str,
+    cat_map: dict[str, uuid.UUID],
+    card_map: dict[str, uuid.UUID],
+) -> Iterator[tuple[int, dict | str]]:
+    """Yield (sheet row number, parsed fields) or (row number, error message).
+
+    Sheet row numbers start at 2 (row 1 is the header).
+    """
+    rows = iter(rows)
+    sample = list(islice(rows, _COMPILE_SAMPLE_ROWS))
+    parse_date = _Memo(_compile_date(_column(sample, mapping.transacted_at))).__getitem__
+    parse_amount = _Memo(_compile_amount(_column(sample, mapping.amount))).__getitem__
+    parse_type = _Memo(lambda value: _parse_type(value, default_type)).__getitem__
+    parse_payment_type = _Memo(_payment_type).__getitem__
+    category_id = _Memo(_name_lookup(cat_map)).__getitem__
+    card_id = _Memo(_name_lookup(card_map)).__getitem__
+
+    row_number = 2
+    chunk = sample
+    while chunk:
+        columns = zip(
+            map(parse_date, _column(chunk, mapping.transacted_at)),
+            map(parse_amount, _column(chunk, mapping.amount)),
+            map(_description, _column(chunk, mapping.description)),
+            map(parse_type, _column(chunk, mapping.type)),
+            map(parse_payment_type, _column(chunk, mapping.payment_type)),
+            map(category_id, _column(chunk, mapping.category_name)),
+            map(card_id, _column(chunk, mapping.card_name)),
+        )
+        for dt, amount, description, tx_type, payment_type, cat_id, user_card_id in columns:
+            if dt is None:
+                yield row_number, "날짜를 파싱할 수 없습니다."
+            elif amount is None or amount == 0:
+                yield row_number, "금액을 파싱할 수 없습니다."
+            else:
+                yield row_number, {
+                    "category_id": cat_id,
+                    "type": tx_type,
+                    "amount": amount,
+                    "description": description,
+                    "transacted_at": dt,
+                    "payment_type": payment_type,
+                    "user_card_id": user_card_id,
+                }
+            row_number += 1
+        chunk = list(islice(rows, PARSE_CHUNK_SIZE))
+
+
 # ── Confirm import ───────────────────────────────────────────────────────────
 
+_INSERT_CHUNK_SIZE = 1000
+# Imports with at least this many rows go through COPY into a staging table;
+# below it the round trips of creating/merging the staging table cost more
+# than multi-row INSERTs.
+COPY_THRESHOLD = 2000
+_COPY_CHUNK_SIZE = 10_000
+_STAGING_TABLE = "_import_staging"
+
+# Order of the columns in the row dicts built by confirm_import, the COPY
+# stream and the staging merge.
+_IMPORT_COLUMNS = (
+    "id", "user_id", "category_id", "type", "amount", "description", "transacted_at",
+    "payment_type", "user_card_id", "dedup_key", "created_at", "updated_at",
+)
+_COPY_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+def _insert_ignoring_duplicates(db: Session, rows: list[dict]) -> int:
+    """Insert rows, skipping those whose dedup key the user already has.
+
+    Uses INSERT ... ON CONFLICT (user_id, dedup_key) DO NOTHING RETURNING, so
+    duplicate detection happens in the database; the returned rows are the
+    ones actually inserted and feed the card spending ledger.
+    """
+    stmt = (
+        pg_insert(Transaction)
+        .values(rows)
+        .on_conflict_do_nothing(index_elements=[Transaction.user_id, Transaction.dedup_key])
+        .returning(Transaction.user_card_id, Transaction.type, Transaction.transacted_at, Transaction.amount)
+    )
+    inserted = [card_spending.Spend(*r) for r in db.execute(stmt)]
+    card_spending.apply(db, added=inserted)
+    return len(inserted)
+
+
+# ── COPY bulk path ──
+
+
+def _supports_copy(db: Session) -> bool:
+    return db.get_bind().dialect.driver == "psycopg2"
+
+
+def _copy_value(value) -> str:
+    """Render one value in COPY text format."""
+    if value is None:
+        return "\\N"
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value).translate(_COPY_ESCAPES)
+
+
+def _create_staging(db: Session) -> None:
+    db.execute(text(
+        f"CREATE TEMP TABLE IF NOT EXISTS {_STAGING_TABLE} "
+        f"(LIKE transactions INCLUDING DEFAULTS) ON COMMIT DROP"
+    ))
+
+
+def _copy_to_staging(db: Session, rows: list[dict]) -> None:
+    """Stream rows into the staging table with COPY FROM STDIN."""
+    buf = StringIO()
+    for row in rows:
+        buf.write("\t".join(_copy_value(row[col]) for col in _IMPORT_COLUMNS))
+        buf.write("\n")
+    buf.seek(0)
+    cursor = db.connection().connection.cursor()
+    try:
+        cursor.copy_expert(
+            f"COPY {_STAGING_TABLE} ({', '.join(_IMPORT_COLUMNS)}) FROM STDIN",
+            buf,
+        )
+    finally:
+        cursor.close()
+
+
+def _merge_staging(db: Session) -> int:
+    """Move staged rows into transactions, skipping duplicates; drop staging.
+
+    Returns the number of rows actually inserted.
+    """
+    columns = ", ".join(_IMPORT_COLUMNS)
+    result = db.execute(text(
+        f"INSERT INTO transactions ({columns}) "
+        f"SELECT {columns} FROM {_STAGING_TABLE} "
+        f"ON CONFLICT (user_id, dedup_key) DO NOTHING "
+        f"RETURNING user_card_id, type, transacted_at, amount"
+    ))
+    inserted = [card_spending.Spend(*r) for r in result]
+    db.execute(text(f"DROP TABLE {_STAGING_TABLE}"))
+    card_spending.apply(db, added=inserted)
+    return len(inserted)
+
+
+def _import_rows(
+    db: Session,
+    user_id: uuid.UUID,
+    rows: Iterable[list],
+    row_count: int | None,
+    mapping: ColumnMapping,
+    default_type: str,
+    progress: Callable[[int, ImportConfirmResponse], None] | None = None,
+) -> ImportConfirmResponse:
+    """Parse data rows with `mapping` and insert them, skipping duplicates (caller commits).
+
+    `row_count` (data rows, None if unknown) only selects the insert path.
+    """
+    # Build name→id lookups
+    categories = list_categories(db, user_id)
+    cat_map = {c.name.lower(): c.id for c in categories}
+
+    cards = list(db.scalars(select(UserCard).where(UserCard.user_id == user_id)).all())
+    card_map = {c.name.lower(): c.id for c in cards}
+
+    created_count = 0
+    candidate_count = 0
+    error_count = 0
+    errors: list[dict] = []
+    pending: list[dict] = []
+    now = datetime.now(timezone.utc)
+
+    # Large files are streamed into a staging table with COPY and merged in
+    # one statement; small ones (or non-psycopg2 drivers) use multi-row INSERT.
+    use_copy = (row_count is None or row_count >= COPY_THRESHOLD) and _supports_copy(db)
+    chunk_size = _COPY_CHUNK_SIZE if use_copy else _INSERT_CHUNK_SIZE
+    if use_copy:
+        _create_staging(db)
+
+    # Candidates whose insert outcome is known; on the COPY path that is only
+    # after the final merge.
+    settled_count = 0
+
+    def _result() -> ImportConfirmResponse:
+        return ImportConfirmResponse(
+            created_count=created_count,
+            duplicate_count=settled_count - created_count,
+            error_count=error_count,
+            errors=errors,
+        )
+
+    def _flush_pending(processed: int) -> None:
+        nonlocal created_count, candidate_count, settled_count
+        candidate_count += len(pending)
+        if use_copy:
+            _copy_to_staging(db, pending)
+        else:
+            created_count += _insert_ignoring_duplicates(db, pending)
+            settled_count = candidate_count
+        pending.clear()
+        if progress is not None:
+            progress(processed, _result())
+
+    # Rows are streamed (from the cache or the upload, decoded lazily) through the
+    # compiled column parsers, and inserted chunk by chunk.
+    processed_count = 0
+    for row_number, parsed in _parse_rows(rows, mapping, default_type, cat_map, card_map):
+        processed_count = row_number - 1
+        if isinstance(parsed, str):
+            errors.append({"row": row_number, "message": parsed})
+            error_count += 1
+            continue
+
+        dt, amount, description = parsed["transacted_at"], parsed["amount"], parsed["description"]
+        # Duplicates (against existing rows and earlier rows of this file)
+        # are skipped by the database via the unique dedup key.
+        pending.append({
+            "id": uuid.uuid4(),
+            "user_id": user_id,
+            **parsed,
+            "dedup_key": compute_dedup_key(dt, amount, description),
+            "created_at": now,
+            "updated_at": now,
+        })
+        if len(pending) >= chunk_size:
+            _flush_pending(processed_count)
+
+    if pending:
+        _flush_pending(processed_count)
+    if use_copy:
+        created_count = _merge_staging(db)
+        settled_count = candidate_count
+
+    result = _result()
+    if progress is not None:
+        progress(processed_count, result)
+    return result
+
+
+def _check_mapping(mapping: ColumnMapping) -> None:
+    if mapping.transacted_at is None or mapping.amount is None:
+        raise HTTPException(status_code=400, detail="날짜와 금액 컬럼은 필수입니다.")
+
 
 def confirm_import(
     db: Session,
@@ -212,208 +604,492 @@ def confirm_import(
     import_id: str,
     mapping: ColumnMapping,
     default_type: str = "expense",
+    progress: Callable[[int, ImportConfirmResponse], None] | None = None,
 ) -> ImportConfirmResponse:
-    """Validate mapping, create transactions from cached data."""
+    """Validate mapping, create transactions from cached data.
+
+    `progress`, if given, is called after every inserted chunk with the number
+    of rows processed so far and the counts known at that point (background
+    import jobs use it for polling).  The mapping is saved as the user's
+    profile for this header row, enabling import_with_profile next time.
+    """
     cached = import_cache.retrieve(import_id)
     if cached is None:
         raise HTTPException(status_code=404, detail="미리보기가 만료되었습니다. 다시 업로드해 주세요.")
 
-    if mapping.transacted_at is None or mapping.amount is None:
-        raise HTTPException(status_code=400, detail="날짜와 금액 컬럼은 필수입니다.")
+    _check_mapping(mapping)
 
     rows = cached["rows"]
+    result = _import_rows(db, user_id, rows, len(rows), mapping, default_type, progress)
+    import_profile.save_profile(db, user_id, cached["headers"], mapping, default_type)
+    if result.created_count:
+        data_version.bump(db, user_id)
+    db.commit()
 
-    # Build name→id lookups
-    categories = list_categories(db, user_id)
-    cat_map = {c.name.lower(): c.id for c in categories}
+    import_cache.remove(import_id)
+    return result
 
-    cards = list(db.scalars(select(UserCard).where(UserCard.user_id == user_id)).all())
-    card_map = {c.name.lower(): c.id for c in cards}
 
-    # Existing transaction dedup keys (normalize amount to int for comparison)
-    existing_txs = list_transactions(db, user_id)
-    dedup_keys: set[str] = set()
-    for tx in existing_txs:
-        date_str = tx.transacted_at.strftime("%Y-%m-%d") if tx.transacted_at else ""
-        amt_normalized = str(int(tx.amount)) if tx.amount == int(tx.amount) else str(tx.amount)
-        dedup_keys.add(f"{date_str}:{amt_normalized}:{tx.description or ''}")
+def _import_with_profile(
+    db: Session, user_id: uuid.UUID, file_bytes: bytes, filename: str
+) -> ImportConfirmResponse:
+    fmt = sheet_reader.detect_format(filename)
+    invalid = HTTPException(status_code=400, detail=f"올바른 {fmt} 파일이 아닙니다.")
 
-    created_count = 0
-    duplicate_count = 0
-    error_count = 0
-    errors: list[dict] = []
-    new_transactions: list[Transaction] = []
+    try:
+        row_count, rows = sheet_reader.open_rows(file_bytes, fmt)
+        header = next(rows, None)
+    except sheet_reader.READ_ERRORS:
+        raise invalid
 
-    def _cell(row: list, idx: int | None):
-        if idx is None or idx >= len(row):
-            return None
-        return row[idx]
+    if header is None:
+        raise HTTPException(status_code=400, detail="빈 엑셀 파일입니다.")
 
-    for row_idx, row in enumerate(rows):
-        try:
-            # Parse date
-            dt = _parse_date(_cell(row, mapping.transacted_at))
-            if dt is None:
-                errors.append({"row": row_idx + 2, "message": "날짜를 파싱할 수 없습니다."})
-                error_count += 1
-                continue
+    headers = [str(v) if v is not None else "" for v in header]
+    profile = import_profile.get_profile(db, user_id, headers)
+    if profile is None:
+        rows.close()
+        raise HTTPException(status_code=404, detail="저장된 컬럼 매핑이 없습니다. 미리보기 후 가져오기를 진행해 주세요.")
 
-            # Parse amount
-            amount = _parse_amount(_cell(row, mapping.amount))
-            if amount is None or amount == 0:
-                errors.append({"row": row_idx + 2, "message": "금액을 파싱할 수 없습니다."})
-                error_count += 1
-                continue
+    mapping = ColumnMapping.model_validate(profile.mapping)
+    _check_mapping(mapping)
 
-            # Parse other fields
-            description = str(_cell(row, mapping.description)) if mapping.description is not None and _cell(row, mapping.description) is not None else None
-            tx_type = _parse_type(_cell(row, mapping.type), default_type)
-            payment_type = str(_cell(row, mapping.payment_type)).strip() if mapping.payment_type is not None and _cell(row, mapping.payment_type) is not None else None
-            category_name = str(_cell(row, mapping.category_name)).strip().lower() if mapping.category_name is not None and _cell(row, mapping.category_name) is not None else None
-            card_name_val = str(_cell(row, mapping.card_name)).strip().lower() if mapping.card_name is not None and _cell(row, mapping.card_name) is not None else None
-
-            # Map payment_type to valid values
-            payment_type_map = {
-                "현금": "cash", "cash": "cash",
-                "신용카드": "credit_card", "credit_card": "credit_card", "credit": "credit_card",
-                "체크카드": "debit_card", "debit_card": "debit_card", "debit": "debit_card",
-                "계좌이체": "bank", "bank": "bank", "이체": "bank",
-            }
-            if payment_type:
-                payment_type = payment_type_map.get(payment_type.lower())
-
-            # Lookup category/card IDs
-            category_id = cat_map.get(category_name) if category_name else None
-            user_card_id = card_map.get(card_name_val) if card_name_val else None
-
-            # Dedup check
-            date_str = dt.strftime("%Y-%m-%d")
-            amt_normalized = str(int(amount)) if amount == int(amount) else str(amount)
-            dedup_key = f"{date_str}:{amt_normalized}:{description or ''}"
-            if dedup_key in dedup_keys:
-                duplicate_count += 1
-                continue
+    data_rows = row_count - 1 if row_count is not None else None
+    try:
+        result = _import_rows(db, user_id, rows, data_rows, mapping, profile.default_type)
+    except sheet_reader.READ_ERRORS:
+        # The reader failed mid-stream: nothing of the file is kept.
+        db.rollback()
+        raise invalid
+    if result.created_count:
+        data_version.bump(db, user_id)
+    db.commit()
+    return result
+
+
+async def import_with_profile(
+    db: Session, user_id: uuid.UUID, file_bytes: bytes, filename: str = ""
+) -> ImportConfirmResponse:
+    """Import a file whose header row matches a saved profile, in one streaming pass.
 
-            dedup_keys.add(dedup_key)
-            new_transactions.append(Transaction(
-                user_id=user_id,
-                category_id=category_id,
-                type=tx_type,
-                amount=amount,
-                description=description,
-                transacted_at=dt,
-                payment_type=payment_type,
-                user_card_id=user_card_id,
-            ))
-            created_count += 1
-        except Exception as e:
-            errors.append({"row": row_idx + 2, "message": str(e)})
-            error_count += 1
+    Rows go straight from the file through the parsers into the database in
+    COPY/INSERT chunks, on the thread pool; nothing is staged in import_cache
+    and the parsed rows are never held whole.  404 if the header row has no
+    saved profile; a reader error at any point of the file is a 400.
+    """
+    return await run_in_threadpool(_import_with_profile, db, user_id, file_bytes, filename)
 
-    if new_transactions:
-        db.add_all(new_transactions)
-        db.commit()
 
-    import_cache.remove(import_id)
+# ── Batch import ─────────────────────────────────────────────────────────────
+
+
+class _ParsedFile(NamedTuple):
+    filename: str
+    total_rows: int
+    rows: list[dict]      # parsed fields + dedup_key
+    errors: list[dict]    # [{row, message}]
+    detail: str | None
+
+
+def _parse_statement(
+    filename: str,
+    file_bytes: bytes,
+    profiles: dict[str, tuple[ColumnMapping, str]],
+    cat_map: dict[str, uuid.UUID],
+    card_map: dict[str, uuid.UUID],
+) -> _ParsedFile:
+    """Decode and parse one statement of a batch (runs in the parse pool).
 
-    return ImportConfirmResponse(
-        created_count=created_count,
-        duplicate_count=duplicate_count,
-        error_count=error_count,
-        errors=errors,
+    The mapping is the user's saved profile for the header row, else the
+    auto-detected one.  Problems with the file as a whole, including reader
+    errors mid-stream, are reported in `detail` rather than raised, so one
+    bad file does not sink the batch.
+    """
+    fmt = sheet_reader.detect_format(filename)
+    invalid = _ParsedFile(filename, 0, [], [], f"올바른 {fmt} 파일이 아닙니다.")
+
+    try:
+        _, rows = sheet_reader.open_rows(file_bytes, fmt)
+        header = next(rows, None)
+    except sheet_reader.READ_ERRORS:
+        return invalid
+    if header is None:
+        return _ParsedFile(filename, 0, [], [], "빈 엑셀 파일입니다.")
+
+    headers = [str(v) if v is not None else "" for v in header]
+    mapping, default_type = profiles.get(
+        import_profile.header_fingerprint(headers), (auto_detect_mapping(headers), "expense")
     )
+    if mapping.transacted_at is None or mapping.amount is None:
+        rows.close()
+        return _ParsedFile(filename, 0, [], [], "날짜와 금액 컬럼을 찾을 수 없습니다.")
+
+    parsed: list[dict] = []
+    errors: list[dict] = []
+    total_rows = 0
+    try:
+        for row_number, fields in _parse_rows(rows, mapping, default_type, cat_map, card_map):
+            total_rows += 1
+            if isinstance(fields, str):
+                errors.append({"row": row_number, "message": fields})
+                continue
+            fields["dedup_key"] = compute_dedup_key(fields["transacted_at"], fields["amount"], fields["description"])
+            parsed.append(fields)
+    except sheet_reader.READ_ERRORS:
+        return invalid
+    return _ParsedFile(filename, total_rows, parsed, errors, None)
+
+
+def _batch_context(
+    db: Session, user_id: uuid.UUID
+) -> tuple[dict[str, tuple[ColumnMapping, str]], dict[str, uuid.UUID], dict[str, uuid.UUID]]:
+    """Everything the pool workers need from the database: profiles and name lookups."""
+    profiles = {
+        p.header_hash: (ColumnMapping.model_validate(p.mapping), p.default_type)
+        for p in import_profile.list_profiles(db, user_id)
+    }
+    cat_map = {c.name.lower(): c.id for c in list_categories(db, user_id)}
+    cards = db.scalars(select(UserCard).where(UserCard.user_id == user_id)).all()
+    card_map = {c.name.lower(): c.id for c in cards}
+    return profiles, cat_map, card_map
+
+
+class _BatchWriter:
+    """Inserts a batch file by file, as each finishes parsing, in one transaction.
+
+    With COPY every file's rows go to the staging table right away and one
+    merge at the end moves them all; otherwise they are inserted in chunks.
+    Either way duplicates across files and against existing rows are dropped
+    by the unique dedup key, and nothing is committed until finish().
+    """
+
+    def __init__(self, db: Session, user_id: uuid.UUID) -> None:
+        self.db = db
+        self.user_id = user_id
+        self.use_copy = _supports_copy(db)
+        self.staged = False
+        self.candidate_count = 0
+        self.created_count = 0
+
+    def add(self, parsed_rows: list[dict]) -> None:
+        now = datetime.now(timezone.utc)
+        rows = [
+            {"id": uuid.uuid4(), "user_id": self.user_id, **fields, "created_at": now, "updated_at": now}
+            for fields in parsed_rows
+        ]
+        self.candidate_count += len(rows)
+        if not self.use_copy:
+            self.created_count += sum(
+                _insert_ignoring_duplicates(self.db, rows[i:i + _INSERT_CHUNK_SIZE])
+                for i in range(0, len(rows), _INSERT_CHUNK_SIZE)
+            )
+            return
+        if not self.staged and rows:
+            _create_staging(self.db)
+            self.staged = True
+        for i in range(0, len(rows), _COPY_CHUNK_SIZE):
+            _copy_to_staging(self.db, rows[i:i + _COPY_CHUNK_SIZE])
+
+    def finish(self, files: list[_ParsedFile]) -> ImportBatchResponse:
+        if self.staged:
+            self.created_count = _merge_staging(self.db)
+        if self.created_count:
+            data_version.bump(self.db, self.user_id)
+        self.db.commit()
+
+        errors = [{"file": f.filename, **e} for f in files for e in f.errors]
+        return ImportBatchResponse(
+            created_count=self.created_count,
+            duplicate_count=self.candidate_count - self.created_count,
+            error_count=len(errors),
+            errors=errors,
+            files=[
+                ImportBatchFileResult(
+                    filename=f.filename, total_rows=f.total_rows, error_count=len(f.errors), detail=f.detail
+                )
+                for f in files
+            ],
+        )
+
+
+async def import_batch(db: Session, user_id: uuid.UUID, uploads: list[tuple[str, bytes]]) -> ImportBatchResponse:
+    """Import several statements (files and/or zip archives) in one request.
+
+    Files are decoded and parsed in parallel in the parse process pool; each
+    file's rows are written to the database as soon as it is parsed, and the
+    whole batch is committed at the end.  Only the files in flight in the
+    pool are held as parsed rows at any time.
+    """
+    try:
+        files = sheet_reader.expand_uploads(
+            uploads,
+            settings.IMPORT_BATCH_MAX_FILES,
+            settings.IMPORT_MAX_FILE_MB * 1024 * 1024,
+            settings.IMPORT_BATCH_MAX_TOTAL_MB * 1024 * 1024,
+        )
+    except sheet_reader.SheetError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    profiles, cat_map, card_map = await run_in_threadpool(_batch_context, db, user_id)
+    writer = _BatchWriter(db, user_id)
+    results: dict[int, _ParsedFile] = {}
+    arg_list = [(name, data, profiles, cat_map, card_map) for name, data in files]
+    async with aclosing(parse_pool.run_each(_parse_statement, arg_list)) as parsed_files:
+        async for i, parsed in parsed_files:
+            await run_in_threadpool(writer.add, parsed.rows)
+            results[i] = parsed._replace(rows=[])
+    return await run_in_threadpool(writer.finish, [results[i] for i in range(len(files))])
 
 
 # ── Export ───────────────────────────────────────────────────────────────────
 
+EXPORT_HEADERS = ["날짜", "유형", "금액", "내역", "카테고리", "결제수단", "카드명"]
+EXPORT_COLUMN_WIDTHS = [14, 8, 14, 30, 12, 12, 16]
+EXPORT_CHUNK_SIZE = 64 * 1024
+_EXPORT_YIELD_PER = 1000
 
-def export_transactions(
-    db: Session,
-    user_id: uuid.UUID,
-    period: str = "month",
-    year: int | None = None,
-    month: int | None = None,
-) -> BytesIO:
-    """Export transactions to an xlsx file."""
-    from datetime import date
+TYPE_DISPLAY: dict[str, str] = {"income": "수입", "expense": "지출", "transfer": "이체"}
+PAYMENT_DISPLAY: dict[str, str] = {
+    "cash": "현금", "credit_card": "신용카드",
+    "debit_card": "체크카드", "bank": "계좌이체",
+}
 
+
+def _resolve_period(period: str, year: int | None, month: int | None) -> tuple[date | None, date | None]:
+    """Return the inclusive (from_date, to_date) range for an export period."""
     now = datetime.now(timezone.utc)
     if year is None:
         year = now.year
     if month is None:
         month = now.month
 
-    # Calculate date range
     if period == "month":
         from_date = date(year, month, 1)
         if month == 12:
             to_date = date(year + 1, 1, 1)
         else:
             to_date = date(year, month + 1, 1)
-        # to_date should be last day of month (list_transactions uses < next_day)
-        from datetime import timedelta
-        to_date = to_date - timedelta(days=1)
-    elif period == "year":
-        from_date = date(year, 1, 1)
-        to_date = date(year, 12, 31)
-    else:  # "all"
-        from_date = None
-        to_date = None
-
-    transactions = list_transactions(db, user_id, from_date=from_date, to_date=to_date)
-
-    # Build id→name lookups
+        # to_date should be last day of month (the filter uses < next_day)
+        return from_date, to_date - timedelta(days=1)
+    if period == "year":
+        return date(year, 1, 1), date(year, 12, 31)
+    return None, None  # "all"
+
+
+def _export_name_maps(db: Session, user_id: uuid.UUID) -> tuple[dict[uuid.UUID, str], dict[uuid.UUID, str]]:
+    """id→name lookups for categories and cards."""
     categories = list_categories(db, user_id)
     cat_id_map = {c.id: c.name for c in categories}
 
     cards = list(db.scalars(select(UserCard).where(UserCard.user_id == user_id)).all())
     card_id_map = {c.id: c.name for c in cards}
+    return cat_id_map, card_id_map
+
+
+def _export_query(user_id: uuid.UUID, from_date: date | None, to_date: date | None):
+    """Exported columns, newest first, fetched through a server-side cursor."""
+    return (
+        transactions_query(user_id, from_date=from_date, to_date=to_date)
+        .with_only_columns(
+            Transaction.transacted_at,
+            Transaction.type,
+            Transaction.amount,
+            Transaction.description,
+            Transaction.category_id,
+            Transaction.payment_type,
+            Transaction.user_card_id,
+        )
+        .order_by(Transaction.transacted_at.desc(), Transaction.id.desc())
+        .execution_options(yield_per=_EXPORT_YIELD_PER)
+    )
 
-    type_display = {"income": "수입", "expense": "지출", "transfer": "이체"}
 
-    # Create workbook
-    wb = openpyxl.Workbook()
-    ws = wb.active
-    ws.title = "거래내역"
+def _iter_export_rows(
+    db: Session,
+    user_id: uuid.UUID,
+    from_date: date | None,
+    to_date: date | None,
+) -> Iterator[list]:
+    """Yield display rows from a server-side cursor, never holding the full result."""
+    cat_id_map, card_id_map = _export_name_maps(db, user_id)
+    query = _export_query(user_id, from_date, to_date)
+    for transacted_at, tx_type, amount, description, category_id, payment_type, card_id in db.execute(query):
+        yield [
+            transacted_at.strftime("%Y-%m-%d") if transacted_at else "",
+            TYPE_DISPLAY.get(tx_type, tx_type),
+            float(amount),
+            description or "",
+            cat_id_map.get(category_id, "") if category_id else "",
+            PAYMENT_DISPLAY.get(payment_type, payment_type or ""),
+            card_id_map.get(card_id, "") if card_id else "",
+        ]
+
+
+def _write_xlsx(rows: Iterable[list], fh: IO[bytes]) -> None:
+    """Write rows into fh as an xlsx file using openpyxl's write-only mode.
+
+    Write-only worksheets spool rows to a temporary file as they are appended,
+    so memory stays bounded no matter how many rows are written.
+    """
+    wb = openpyxl.Workbook(write_only=True)
+    ws = wb.create_sheet("거래내역")
+
+    # Column widths
+    for i, w in enumerate(EXPORT_COLUMN_WIDTHS, 1):
+        ws.column_dimensions[openpyxl.utils.get_column_letter(i)].width = w
 
-    headers = ["날짜", "유형", "금액", "내역", "카테고리", "결제수단", "카드명"]
     header_fill = PatternFill(start_color="3182F6", end_color="3182F6", fill_type="solid")
     header_font = Font(bold=True, color="FFFFFF", size=11)
-
-    for col_idx, header in enumerate(headers, 1):
-        cell = ws.cell(row=1, column=col_idx, value=header)
+    header_cells = []
+    for header in EXPORT_HEADERS:
+        cell = WriteOnlyCell(ws, value=header)
         cell.fill = header_fill
         cell.font = header_font
         cell.alignment = Alignment(horizontal="center")
+        header_cells.append(cell)
+    ws.append(header_cells)
 
-    # Column widths
-    widths = [14, 8, 14, 30, 12, 12, 16]
-    for i, w in enumerate(widths, 1):
-        ws.column_dimensions[openpyxl.utils.get_column_letter(i)].width = w
+    # Format amount column as number while appending, no second pass needed
+    for row in rows:
+        amount_cell = WriteOnlyCell(ws, value=row[2])
+        amount_cell.number_format = "#,##0"
+        row[2] = amount_cell
+        ws.append(row)
 
-    # Data rows
-    payment_display = {
-        "cash": "현금", "credit_card": "신용카드",
-        "debit_card": "체크카드", "bank": "계좌이체",
-    }
+    wb.save(fh)
 
-    for tx in transactions:
-        ws.append([
-            tx.transacted_at.strftime("%Y-%m-%d") if tx.transacted_at else "",
-            type_display.get(tx.type, tx.type),
-            float(tx.amount),
-            tx.description or "",
-            cat_id_map.get(tx.category_id, "") if tx.category_id else "",
-            payment_display.get(tx.payment_type, tx.payment_type or ""),
-            card_id_map.get(tx.user_card_id, "") if tx.user_card_id else "",
-        ])
-
-    # Format amount column as number
-    for row in ws.iter_rows(min_row=2, min_col=3, max_col=3):
-        for cell in row:
-            cell.number_format = "#,##0"
-
-    buf = BytesIO()
-    wb.save(buf)
-    buf.seek(0)
-    return buf
+
+def iter_file_chunks(fh: IO[bytes], chunk_size: int = EXPORT_CHUNK_SIZE) -> Iterator[bytes]:
+    """Stream an open file in chunks and close it afterwards."""
+    try:
+        while chunk := fh.read(chunk_size):
+            yield chunk
+    finally:
+        fh.close()
+
+
+def export_transactions(
+    db: Session,
+    user_id: uuid.UUID,
+    period: str = "month",
+    year: int | None = None,
+    month: int | None = None,
+) -> IO[bytes]:
+    """Export transactions to an xlsx file.
+
+    Returns an open file positioned at the start; the caller streams it (see
+    iter_file_chunks) and closes it.  xlsx is a zip archive whose directory
+    is written last, so the workbook is spooled to disk rather than emitted
+    straight into the response.  Workbooks are kept in the export cache under
+    the user's data version, so a repeated download with no change to the
+    data in between is a file read.
+    """
+    from_date, to_date = _resolve_period(period, year, month)
+    if not export_cache.enabled():
+        fh = tempfile.TemporaryFile()
+        try:
+            _write_xlsx(_iter_export_rows(db, user_id, from_date, to_date), fh)
+        except Exception:
+            fh.close()
+            raise
+        fh.seek(0)
+        return fh
+
+    # Read before the rows: the cached file is then at least as new as its key.
+    version = data_version.current(db, user_id)
+    cached = export_cache.get(user_id, from_date, to_date, version)
+    if cached is not None:
+        return cached
+
+    fh = export_cache.new_file()
+    try:
+        _write_xlsx(_iter_export_rows(db, user_id, from_date, to_date), fh)
+        fh.flush()
+    except Exception:
+        export_cache.discard(fh)
+        raise
+    export_cache.put(fh, user_id, from_date, to_date, version)
+    fh.seek(0)
+    return fh
+
+
+# ── Streaming export formats ─────────────────────────────────────────────────
+#
+# Unlike xlsx, CSV and the columnar format can be written front to back, so
+# they are streamed straight from the database cursor into the response.  The
+# generators open their own session: the body is produced after the endpoint
+# (and its request-scoped session) has returned.
+
+EXPORT_FORMATS = ("xlsx", "csv", "columnar")
+_COLUMNAR_ROW_GROUP = 8192
+COLUMNAR_SCHEMA = [
+    ("transacted_at", columnar.TIMESTAMP),
+    ("type", columnar.DICT),
+    ("amount", columnar.DECIMAL, 2),
+    ("description", columnar.STRING),
+    ("category", columnar.DICT),
+    ("payment_type", columnar.DICT),
+    ("card", columnar.DICT),
+]
+
+
+def _csv_amount(amount: float) -> str:
+    return f"{amount:.2f}".rstrip("0").rstrip(".")
+
+
+def iter_csv_export(
+    user_id: uuid.UUID,
+    period: str = "month",
+    year: int | None = None,
+    month: int | None = None,
+) -> Iterator[bytes]:
+    """Stream transactions as CSV with the xlsx export's columns.
+
+    UTF-8 with a BOM, so Excel opens the Korean text correctly.
+    """
+    from_date, to_date = _resolve_period(period, year, month)
+    buf = StringIO()
+    writer = csv.writer(buf)
+    buf.write("\ufeff")
+    writer.writerow(EXPORT_HEADERS)
+    with SessionLocal() as db:
+        for row in _iter_export_rows(db, user_id, from_date, to_date):
+            row[2] = _csv_amount(row[2])
+            writer.writerow(row)
+            if buf.tell() >= EXPORT_CHUNK_SIZE:
+                yield buf.getvalue().encode("utf-8")
+                buf.seek(0)
+                buf.truncate()
+    yield buf.getvalue().encode("utf-8")
+
+
+def iter_columnar_export(
+    user_id: uuid.UUID,
+    period: str = "month",
+    year: int | None = None,
+    month: int | None = None,
+) -> Iterator[bytes]:
+    """Stream transactions in the columnar binary format (see app/services/columnar.py).
+
+    Values are typed and raw (UTC timestamps, exact amounts, income/expense
+    codes); type, payment type, category and card names are dictionary
+    encoded.  One row group per cursor partition.
+    """
+    from_date, to_date = _resolve_period(period, year, month)
+    writer = columnar.Writer(COLUMNAR_SCHEMA)
+    yield writer.header()
+    with SessionLocal() as db:
+        cat_id_map, card_id_map = _export_name_maps(db, user_id)
+        result = db.execute(_export_query(user_id, from_date, to_date))
+        for rows in result.partitions(_COLUMNAR_ROW_GROUP):
+            transacted_at, tx_type, amount, description, category_id, payment_type, card_id = zip(*rows)
+            yield writer.row_group([
+                transacted_at,
+                tx_type,
+                amount,
+                description,
+                [cat_id_map.get(c) for c in category_id],
+                payment_type,
+                [card_id_map.get(c) for c in card_id],
+            ])
+    yield writer.footer()
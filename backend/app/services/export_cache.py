@@ -0,0 +1,113 @@
+# backend/app/services/export_cache.py
+"""Local-disk cache of generated export files.
+
+Entries are keyed by (user, date range, user data version): any write to the
+user's data bumps the version, so a stale entry is never served and simply
+ages out.  Total size is bounded by EXPORT_CACHE_MAX_MB with least-recently-
+used eviction (file mtime is refreshed on every hit).  The directory may be
+shared by several worker processes on the host; files are published with an
+atomic rename and readers keep working on a file evicted under them.
+"""
+import os
+import tempfile
+import threading
+import uuid
+from datetime import date
+from typing import IO
+
+from app.core.config import settings
+
+_SUFFIX = ".xlsx"
+_lock = threading.Lock()
+
+
+def enabled() -> bool:
+    return settings.EXPORT_CACHE_MAX_MB > 0
+
+
+def _directory() -> str:
+    path = settings.EXPORT_CACHE_DIR or os.path.join(tempfile.gettempdir(), "benefit_butler_exports")
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def _prefix(user_id: uuid.UUID, from_date: date | None, to_date: date | None) -> str:
+    return f"{user_id.hex}_{from_date or 'all'}_{to_date or 'all'}_"
+
+
+def get(user_id: uuid.UUID, from_date: date | None, to_date: date | None, version: int) -> IO[bytes] | None:
+    """Open the cached export for this version, or None."""
+    path = os.path.join(_directory(), f"{_prefix(user_id, from_date, to_date)}{version}{_SUFFIX}")
+    try:
+        fh = open(path, "rb")
+    except FileNotFoundError:
+        return None
+    try:
+        os.utime(path)  # LRU: mark as recently used
+    except FileNotFoundError:
+        pass  # evicted meanwhile; the open handle still reads it
+    return fh
+
+
+def new_file() -> IO[bytes]:
+    """A temporary file inside the cache directory to write an export into (then put())."""
+    return tempfile.NamedTemporaryFile(dir=_directory(), prefix=".tmp_", suffix=_SUFFIX, delete=False)
+
+
+def put(fh: IO[bytes], user_id: uuid.UUID, from_date: date | None, to_date: date | None, version: int) -> None:
+    """Publish a file from new_file() as the entry for this version.
+
+    Older versions of the same export are dropped right away, then the cache
+    is trimmed to its size limit.  `fh` stays open and readable.
+    """
+    directory = _directory()
+    prefix = _prefix(user_id, from_date, to_date)
+    os.replace(fh.name, os.path.join(directory, f"{prefix}{version}{_SUFFIX}"))
+
+    with _lock:
+        for name in os.listdir(directory):
+            if name.startswith(prefix) and name != f"{prefix}{version}{_SUFFIX}":
+                _remove(os.path.join(directory, name))
+        _evict(directory, settings.EXPORT_CACHE_MAX_MB * 1024 * 1024)
+
+
+def discard(fh: IO[bytes]) -> None:
+    """Remove a new_file() that will not be published (failed export)."""
+    fh.close()
+    _remove(fh.name)
+
+
+def _remove(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def _evict(directory: str, max_bytes: int) -> None:
+    entries = []
+    total = 0
+    for entry in os.scandir(directory):
+        if entry.name.startswith(".") or not entry.name.endswith(_SUFFIX):
+            continue  # in-progress files of other requests
+        try:
+            stat = entry.stat()
+        except FileNotFoundError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, entry.path))
+        total += stat.st_size
+
+    for _mtime, size, path in sorted(entries):
+        if total <= max_bytes:
+            break
+        _remove(path)
+        total -= size
+
+
+def clear() -> None:
+    """Remove every cached export (tests)."""
+    directory = _directory()
+    with _lock:
+        for name in os.listdir(directory):
+            if name.endswith(_SUFFIX):
+                _remove(os.path.join(directory, name))
@@ -0,0 +1,66 @@
+# backend/app/services/import_cache/__init__.py
+"""Staging store for Excel import preview data with 5-minute TTL.
+
+/import/preview stores the upload and /import/confirm (or an import
+job) retrieves them, possibly in another worker process.  The backend is
+chosen by settings.IMPORT_STAGING_BACKEND: "memory" (default, single process)
+or "postgres" (UNLOGGED import_staging table shared by all workers).
+"""
+import uuid
+
+from app.core.config import settings
+from app.services.import_cache.base import StagingBackend
+from app.services.import_cache.memory import MemoryBackend
+from app.services.import_cache.postgres import PostgresBackend
+from app.services.import_cache.workbook import WorkbookRows
+
+_TTL_SECONDS = 300  # 5 minutes
+
+_BACKENDS: dict[str, type[StagingBackend]] = {
+    "memory": MemoryBackend,
+    "postgres": PostgresBackend,
+}
+_backend: StagingBackend | None = None
+
+
+def get_backend() -> StagingBackend:
+    global _backend
+    if _backend is None:
+        try:
+            _backend = _BACKENDS[settings.IMPORT_STAGING_BACKEND]()
+        except KeyError:
+            raise RuntimeError(f"Unknown IMPORT_STAGING_BACKEND: {settings.IMPORT_STAGING_BACKEND!r}")
+    return _backend
+
+
+def set_backend(backend: StagingBackend | None) -> None:
+    """Replace the active backend; None re-reads the setting (for testing)."""
+    global _backend
+    _backend = backend
+
+
+def store(headers: list[str], rows: WorkbookRows) -> str:
+    """Store a previewed upload (header row + the file's data rows) and return a unique import_id."""
+    import_id = str(uuid.uuid4())
+    get_backend().put(import_id, {"headers": headers, "rows": rows}, _TTL_SECONDS)
+    return import_id
+
+
+def retrieve(import_id: str) -> dict | None:
+    """Retrieve cached data. Returns None if not found or expired."""
+    return get_backend().get(import_id)
+
+
+def remove(import_id: str) -> None:
+    """Remove an entry from the cache."""
+    get_backend().delete(import_id)
+
+
+def stats() -> dict:
+    """Backend counters (entries, bytes, hits, misses, evictions, ...)."""
+    return get_backend().stats()
+
+
+def clear() -> None:
+    """Clear all entries (for testing)."""
+    get_backend().clear()
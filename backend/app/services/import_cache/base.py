@@ -0,0 +1,29 @@
+from abc import ABC, abstractmethod
+
+
+class StagingBackend(ABC):
+    """Where parsed import previews wait for /import/confirm."""
+
+    @abstractmethod
+    def put(self, import_id: str, entry: dict, ttl_seconds: int) -> None:
+        ...
+
+    @abstractmethod
+    def get(self, import_id: str) -> dict | None:
+        """Return the entry, or None if missing or expired."""
+        ...
+
+    @abstractmethod
+    def delete(self, import_id: str) -> None:
+        ...
+
+    @abstractmethod
+    def clear(self) -> None:
+        ...
+
+    def stats(self) -> dict:
+        """Counters for monitoring; backends without any return an empty dict."""
+        return {}
+
+    def close(self) -> None:
+        """Release background resources, if any."""
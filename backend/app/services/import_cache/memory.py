@@ -0,0 +1,126 @@
+import sys
+import time
+from collections import OrderedDict
+from threading import Event, Lock, Thread
+
+from app.core.config import settings
+from app.services.import_cache.base import StagingBackend
+
+
+def estimate_bytes(entry: dict) -> int:
+    """Approximate heap size of a cached preview (headers + rows)."""
+    return sum(sys.getsizeof(h) for h in entry["headers"]) + entry["rows"].nbytes
+
+
+class MemoryBackend(StagingBackend):
+    """Process-local LRU bounded by entry count and approximate bytes.
+
+    Preview and confirm must hit the same worker.  Expired entries are dropped
+    on access and by a daemon sweeper thread, so abandoned previews do not
+    pin memory until the process exits.
+    """
+
+    def __init__(
+        self,
+        max_bytes: int | None = None,
+        max_entries: int | None = None,
+        sweep_interval: float | None = None,
+    ) -> None:
+        self.max_bytes = max_bytes if max_bytes is not None else settings.IMPORT_CACHE_MAX_BYTES
+        self.max_entries = max_entries if max_entries is not None else settings.IMPORT_CACHE_MAX_ENTRIES
+        self.sweep_interval = sweep_interval if sweep_interval is not None else settings.IMPORT_CACHE_SWEEP_SECONDS
+        self._store: OrderedDict[str, dict] = OrderedDict()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._lock = Lock()
+        self._stop = Event()
+        self._sweeper: Thread | None = None
+
+    # ── StagingBackend ──
+
+    def put(self, import_id: str, entry: dict, ttl_seconds: int) -> None:
+        self._ensure_sweeper()
+        size = estimate_bytes(entry)
+        with self._lock:
+            self._pop_locked(import_id)
+            self._store[import_id] = {**entry, "expires_at": time.time() + ttl_seconds, "nbytes": size}
+            self._bytes += size
+            # Least recently used first; the entry just stored is never evicted.
+            while len(self._store) > 1 and (len(self._store) > self.max_entries or self._bytes > self.max_bytes):
+                oldest = next(iter(self._store))
+                self._pop_locked(oldest)
+                self._evictions += 1
+
+    def get(self, import_id: str) -> dict | None:
+        with self._lock:
+            entry = self._store.get(import_id)
+            if entry is None:
+                self._misses += 1
+                return None
+            if time.time() > entry["expires_at"]:
+                self._pop_locked(import_id)
+                self._expirations += 1
+                self._misses += 1
+                return None
+            self._store.move_to_end(import_id)
+            self._hits += 1
+            return entry
+
+    def delete(self, import_id: str) -> None:
+        with self._lock:
+            self._pop_locked(import_id)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._store.clear()
+            self._bytes = 0
+            self._hits = self._misses = self._evictions = self._expirations = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "entries": len(self._store),
+                "bytes": self._bytes,
+                "max_entries": self.max_entries,
+                "max_bytes": self.max_bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+            }
+
+    # ── Expiry ──
+
+    def sweep(self) -> int:
+        """Drop every expired entry; returns how many were removed."""
+        now = time.time()
+        with self._lock:
+            expired = [k for k, e in self._store.items() if now > e["expires_at"]]
+            for import_id in expired:
+                self._pop_locked(import_id)
+            self._expirations += len(expired)
+        return len(expired)
+
+    def close(self) -> None:
+        """Stop the sweeper thread."""
+        self._stop.set()
+
+    def _pop_locked(self, import_id: str) -> None:
+        entry = self._store.pop(import_id, None)
+        if entry is not None:
+            self._bytes -= entry["nbytes"]
+
+    def _ensure_sweeper(self) -> None:
+        if self._sweeper is not None or self.sweep_interval <= 0:
+            return
+        with self._lock:
+            if self._sweeper is None:
+                self._sweeper = Thread(target=self._sweep_loop, name="import-cache-sweeper", daemon=True)
+                self._sweeper.start()
+
+    def _sweep_loop(self) -> None:
+        while not self._stop.wait(self.sweep_interval):
+            self.sweep()
@@ -0,0 +1,70 @@
+import json
+import struct
+import zlib
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+from app.core.database import engine
+from app.models.import_staging import ImportStaging
+from app.services.import_cache.base import StagingBackend
+from app.services.import_cache.workbook import WorkbookRows
+
+_HEADERS_LEN = struct.Struct("<I")
+# CSV and xls uploads shrink several times; level 1 keeps the preview fast.
+_COMPRESS_LEVEL = 1
+
+
+def dumps(entry: dict) -> bytes:
+    """payload = len(headers JSON) + headers JSON + zlib(WorkbookRows bytes)."""
+    headers = json.dumps(entry["headers"], ensure_ascii=False).encode()
+    rows = zlib.compress(entry["rows"].to_bytes(), _COMPRESS_LEVEL)
+    return _HEADERS_LEN.pack(len(headers)) + headers + rows
+
+
+def loads(payload: bytes) -> dict:
+    (length,) = _HEADERS_LEN.unpack_from(payload, 0)
+    start = _HEADERS_LEN.size
+    return {
+        "headers": json.loads(payload[start:start + length]),
+        "rows": WorkbookRows.from_bytes(zlib.decompress(payload[start + length:])),
+    }
+
+
+class PostgresBackend(StagingBackend):
+    """UNLOGGED import_staging table; lets any API worker confirm any preview."""
+
+    def put(self, import_id: str, entry: dict, ttl_seconds: int) -> None:
+        now = datetime.now(timezone.utc)
+        with engine.begin() as conn:
+            # Opportunistic sweep of abandoned previews (indexed on expires_at).
+            conn.execute(delete(ImportStaging).where(ImportStaging.expires_at < now))
+            conn.execute(
+                pg_insert(ImportStaging)
+                .values(
+                    import_id=import_id,
+                    payload=dumps(entry),
+                    expires_at=now + timedelta(seconds=ttl_seconds),
+                    created_at=now,
+                )
+                .on_conflict_do_nothing(index_elements=[ImportStaging.import_id])
+            )
+
+    def get(self, import_id: str) -> dict | None:
+        with engine.connect() as conn:
+            payload = conn.scalar(
+                select(ImportStaging.payload).where(
+                    ImportStaging.import_id == import_id,
+                    ImportStaging.expires_at > datetime.now(timezone.utc),
+                )
+            )
+        return None if payload is None else loads(payload)
+
+    def delete(self, import_id: str) -> None:
+        with engine.begin() as conn:
+            conn.execute(delete(ImportStaging).where(ImportStaging.import_id == import_id))
+
+    def clear(self) -> None:
+        with engine.begin() as conn:
+            conn.execute(delete(ImportStaging))
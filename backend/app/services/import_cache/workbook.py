@@ -0,0 +1,47 @@
+"""Compact storage for cached import rows.
+
+A preview used to keep every row as a Python list of boxed cell objects,
+roughly ten times the size of the uploaded file.  The uploaded file is
+already a compact encoding of its cells, so the preview caches the file
+itself (WorkbookRows) and confirm_import streams rows straight from it.
+"""
+import struct
+from typing import Iterator
+
+_HEADER = struct.Struct("<II")  # row count, format length
+
+
+class WorkbookRows:
+    """Data rows of an uploaded workbook, parsed on demand from the file bytes."""
+
+    __slots__ = ("_data", "_fmt", "_count")
+
+    def __init__(self, data: bytes, fmt: str, count: int) -> None:
+        self._data = data
+        self._fmt = fmt
+        self._count = count
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[list]:
+        from app.services.sheet_reader import open_rows
+
+        _, rows = open_rows(self._data, self._fmt)
+        next(rows, None)  # header
+        yield from rows
+
+    @property
+    def nbytes(self) -> int:
+        return len(self._data)
+
+    def to_bytes(self) -> bytes:
+        fmt = self._fmt.encode()
+        return _HEADER.pack(self._count, len(fmt)) + fmt + self._data
+
+    @classmethod
+    def from_bytes(cls, data: bytes | memoryview) -> "WorkbookRows":
+        data = bytes(data)
+        count, fmt_len = _HEADER.unpack_from(data, 0)
+        start = _HEADER.size
+        return cls(data[start + fmt_len:], data[start:start + fmt_len].decode(), count)
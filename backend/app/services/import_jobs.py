@@ -0,0 +1,177 @@
+# backend/app/services/import_jobs.py
+"""Background import jobs: confirm_import on a bounded worker pool.
+
+The job runs on a thread of the API process that accepted it, but its status
+and progress live in the import_jobs table, so any worker can answer a poll
+(the preview data it imports is shared the same way with the postgres staging
+backend).  A running job refreshes updated_at with every progress report; one
+that has not done so for IMPORT_JOB_STALE_SECONDS lost its process (restart,
+crash) and is reported as failed.  Finished jobs are kept for an hour.
+"""
+import logging
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from threading import Lock
+
+from fastapi import HTTPException
+from sqlalchemy import Row, delete, func, insert, select, update
+
+from app.core.config import settings
+from app.core.database import SessionLocal, engine
+from app.models.import_job import ImportJob
+from app.schemas.excel_io import ColumnMapping, ImportConfirmResponse, ImportJobResponse
+from app.services import excel_io, import_cache
+
+logger = logging.getLogger(__name__)
+
+_JOB_TTL = timedelta(hours=1)  # finished jobs are kept for 1 hour
+
+PENDING = "pending"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+_ACTIVE = (PENDING, RUNNING)
+
+_INTERRUPTED = "가져오기 작업이 중단되었습니다. 다시 시도해 주세요."
+
+_lock = Lock()
+_executor: ThreadPoolExecutor | None = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(max_workers=settings.IMPORT_WORKERS, thread_name_prefix="import-job")
+        return _executor
+
+
+def _now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+def _stale_before() -> datetime:
+    return _now() - timedelta(seconds=settings.IMPORT_JOB_STALE_SECONDS)
+
+
+def _to_response(job: Row) -> ImportJobResponse:
+    return ImportJobResponse(
+        job_id=job.id,
+        status=job.status,
+        total_rows=job.total_rows,
+        processed_rows=job.processed_rows,
+        detail=job.detail,
+        **job.result,
+    )
+
+
+def _empty_result() -> dict:
+    return ImportConfirmResponse(created_count=0, duplicate_count=0, error_count=0, errors=[]).model_dump()
+
+
+def submit(
+    user_id: uuid.UUID,
+    import_id: str,
+    mapping: ColumnMapping,
+    default_type: str = "expense",
+) -> ImportJobResponse:
+    """Validate the request, record the job and queue confirm_import on the worker pool."""
+    cached = import_cache.retrieve(import_id)
+    if cached is None:
+        raise HTTPException(status_code=404, detail="미리보기가 만료되었습니다. 다시 업로드해 주세요.")
+    if mapping.transacted_at is None or mapping.amount is None:
+        raise HTTPException(status_code=400, detail="날짜와 금액 컬럼은 필수입니다.")
+
+    now = _now()
+    job_id = str(uuid.uuid4())
+    with engine.begin() as conn:
+        # Opportunistic sweep of finished jobs (indexed on status, updated_at).
+        conn.execute(
+            delete(ImportJob).where(ImportJob.status.in_((DONE, FAILED)), ImportJob.updated_at < now - _JOB_TTL)
+        )
+        # Serialize the capacity check across API workers.
+        conn.execute(select(func.pg_advisory_xact_lock(func.hashtext("import_jobs"))))
+        active = conn.scalar(
+            select(func.count())
+            .select_from(ImportJob)
+            .where(ImportJob.status.in_(_ACTIVE), ImportJob.updated_at >= _stale_before())
+        )
+        if active >= settings.IMPORT_MAX_PENDING_JOBS:
+            raise HTTPException(status_code=503, detail="가져오기 작업이 많습니다. 잠시 후 다시 시도해 주세요.")
+        job = conn.execute(
+            insert(ImportJob)
+            .values(
+                id=job_id,
+                user_id=user_id,
+                status=PENDING,
+                total_rows=len(cached["rows"]),
+                processed_rows=0,
+                result=_empty_result(),
+                created_at=now,
+                updated_at=now,
+            )
+            .returning(ImportJob)
+        ).one()
+
+    _get_executor().submit(_run, job_id, user_id, import_id, mapping, default_type)
+    return _to_response(job)
+
+
+def get(user_id: uuid.UUID, job_id: str) -> ImportJobResponse:
+    """Return the caller's job; other users' jobs are reported as missing."""
+    now = _now()
+    with engine.begin() as conn:
+        # A job whose process died stops reporting progress: record it as failed.
+        conn.execute(
+            update(ImportJob)
+            .where(
+                ImportJob.id == job_id,
+                ImportJob.user_id == user_id,
+                ImportJob.status.in_(_ACTIVE),
+                ImportJob.updated_at < _stale_before(),
+            )
+            .values(status=FAILED, detail=_INTERRUPTED, updated_at=now, finished_at=now)
+        )
+        job = conn.execute(select(ImportJob).where(ImportJob.id == job_id, ImportJob.user_id == user_id)).one_or_none()
+    if job is None or (job.finished_at is not None and now - job.finished_at > _JOB_TTL):
+        raise HTTPException(status_code=404, detail="가져오기 작업을 찾을 수 없습니다.")
+    return _to_response(job)
+
+
+def _update(job_id: str, *conditions, **values) -> bool:
+    """Update the job row (refreshing its heartbeat); False if no row matched."""
+    with engine.begin() as conn:
+        result = conn.execute(
+            update(ImportJob).where(ImportJob.id == job_id, *conditions).values(updated_at=_now(), **values)
+        )
+    return result.rowcount > 0
+
+
+def _run(job_id: str, user_id: uuid.UUID, import_id: str, mapping: ColumnMapping, default_type: str) -> None:
+    def _progress(processed: int, result: ImportConfirmResponse) -> None:
+        _update(job_id, processed_rows=processed, result=result.model_dump())
+
+    # Skipped if the job was declared interrupted while it waited in the queue.
+    if not _update(job_id, ImportJob.status == PENDING, status=RUNNING):
+        return
+    db = SessionLocal()
+    try:
+        excel_io.confirm_import(db, user_id, import_id, mapping, default_type, progress=_progress)
+        status, detail = DONE, None
+    except HTTPException as e:
+        db.rollback()
+        status, detail = FAILED, e.detail
+    except Exception:
+        logger.exception("import job %s failed", job_id)
+        db.rollback()
+        status, detail = FAILED, "가져오기 중 오류가 발생했습니다."
+    finally:
+        db.close()
+    _update(job_id, status=status, detail=detail, finished_at=_now())
+
+
+def clear() -> None:
+    """Forget all jobs (for testing)."""
+    with engine.begin() as conn:
+        conn.execute(delete(ImportJob))
@@ -0,0 +1,65 @@
+# backend/app/services/import_profile.py
+"""Saved column mappings per statement layout.
+
+A layout is identified by the fingerprint of its header row.  confirm_import
+records the mapping the user confirmed; the one-request import endpoint looks
+it up so a re-import of the same bank/card statement skips the preview step.
+"""
+import hashlib
+import uuid
+from datetime import datetime, timezone
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+
+from app.models.import_profile import ImportProfile
+from app.schemas.excel_io import ColumnMapping
+
+
+def header_fingerprint(headers: list[str]) -> str:
+    """sha256 of the header row; cell positions matter since mappings are by index."""
+    joined = "\x1f".join(h.strip() for h in headers)
+    return hashlib.sha256(joined.encode("utf-8")).hexdigest()
+
+
+def get_profile(db: Session, user_id: uuid.UUID, headers: list[str]) -> ImportProfile | None:
+    return db.scalar(
+        select(ImportProfile).where(
+            ImportProfile.user_id == user_id,
+            ImportProfile.header_hash == header_fingerprint(headers),
+        )
+    )
+
+
+def list_profiles(db: Session, user_id: uuid.UUID) -> list[ImportProfile]:
+    return list(db.scalars(select(ImportProfile).where(ImportProfile.user_id == user_id)).all())
+
+
+def save_profile(
+    db: Session,
+    user_id: uuid.UUID,
+    headers: list[str],
+    mapping: ColumnMapping,
+    default_type: str,
+) -> None:
+    """Insert or replace the profile for this header row (caller commits)."""
+    now = datetime.now(timezone.utc)
+    stmt = pg_insert(ImportProfile).values(
+        user_id=user_id,
+        header_hash=header_fingerprint(headers),
+        mapping=mapping.model_dump(),
+        default_type=default_type,
+        created_at=now,
+        updated_at=now,
+    )
+    db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[ImportProfile.user_id, ImportProfile.header_hash],
+            set_={
+                "mapping": stmt.excluded.mapping,
+                "default_type": stmt.excluded.default_type,
+                "updated_at": now,
+            },
+        )
+    )
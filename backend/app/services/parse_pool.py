@@ -0,0 +1,133 @@
+# backend/app/services/parse_pool.py
+"""Process pool for CPU-bound spreadsheet decoding.
+
+openpyxl/xlrd parsing holds the GIL, so running it on the event loop (or a
+thread) stalls every other request on the worker.  Callers await run(), which
+executes the function in a separate process.  The number of submitted but
+unfinished tasks is capped; past the cap the request fails fast with 503
+instead of queueing without bound.  A worker dying mid-task (OOM, crash)
+breaks the pool: the request gets a 503 and the next call starts a new pool.
+"""
+import asyncio
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import islice
+from threading import Lock
+from typing import Any, AsyncIterator, Callable
+
+from fastapi import HTTPException
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import settings
+
+_executor: Executor | None = None
+_pending = 0
+_lock = Lock()
+
+
+def _get_executor() -> Executor:
+    global _executor
+    with _lock:
+        if _executor is None:
+            # spawn: forking a process that already runs threads (the event
+            # loop's thread pool, cache sweeper, import jobs) can deadlock.
+            _executor = ProcessPoolExecutor(
+                max_workers=settings.IMPORT_PARSE_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _executor
+
+
+def _discard_broken(executor: Executor) -> HTTPException:
+    """Forget a broken pool (unless already replaced) and return the 503 to raise."""
+    global _executor
+    with _lock:
+        if _executor is executor:
+            _executor = None
+    executor.shutdown(wait=False, cancel_futures=True)
+    return HTTPException(status_code=503, detail="파일 처리 중 작업자가 중단되었습니다. 잠시 후 다시 시도해 주세요.")
+
+
+def _release() -> None:
+    global _pending
+    with _lock:
+        _pending -= 1
+
+
+def _reserve() -> None:
+    global _pending
+    with _lock:
+        if _pending >= settings.IMPORT_PARSE_MAX_PENDING:
+            raise HTTPException(status_code=503, detail="파일 처리 요청이 많습니다. 잠시 후 다시 시도해 주세요.")
+        _pending += 1
+
+
+async def run(fn: Callable[..., Any], *args: Any) -> Any:
+    """Run fn(*args) in the parse pool; 503 when IMPORT_PARSE_MAX_PENDING tasks are in flight.
+
+    With IMPORT_PARSE_WORKERS=0 the call runs in the thread pool instead (still
+    off the event loop, but sharing the GIL).
+    """
+    _reserve()
+    try:
+        if settings.IMPORT_PARSE_WORKERS <= 0:
+            return await run_in_threadpool(fn, *args)
+        loop = asyncio.get_running_loop()
+        executor = _get_executor()
+        try:
+            return await loop.run_in_executor(executor, fn, *args)
+        except BrokenProcessPool:
+            raise _discard_broken(executor)
+    finally:
+        _release()
+
+
+async def run_each(fn: Callable[..., Any], arg_list: list[tuple]) -> AsyncIterator[tuple[int, Any]]:
+    """fn(*args) for every args tuple, spread over the pool; yields (index, result) as each finishes.
+
+    The whole batch takes one pending slot: it is one request, and its tasks
+    queue behind each other rather than being refused.  Only as many tasks as
+    there are workers are submitted at a time, so results wait for the
+    consumer at most one round deep instead of piling up.  Consume with
+    contextlib.aclosing so the slot is released if the consumer stops early.
+    """
+    _reserve()
+    try:
+        if settings.IMPORT_PARSE_WORKERS <= 0:
+            for i, args in enumerate(arg_list):
+                yield i, await run_in_threadpool(fn, *args)
+            return
+        loop = asyncio.get_running_loop()
+        executor = _get_executor()
+        todo = iter(enumerate(arg_list))
+        running: dict[asyncio.Future, int] = {}
+
+        def submit() -> None:
+            for i, args in islice(todo, settings.IMPORT_PARSE_WORKERS - len(running)):
+                running[loop.run_in_executor(executor, fn, *args)] = i
+
+        try:
+            submit()
+            while running:
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                finished = [(running.pop(future), future.result()) for future in done]
+                submit()
+                for item in finished:
+                    yield item
+        except BrokenProcessPool:
+            raise _discard_broken(executor)
+        finally:
+            for future in running:
+                future.cancel()
+    finally:
+        _release()
+
+
+def shutdown() -> None:
+    """Stop the worker processes (app shutdown / tests)."""
+    global _executor
+    with _lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=True, cancel_futures=True)
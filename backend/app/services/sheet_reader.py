@@ -0,0 +1,309 @@
+# backend/app/services/sheet_reader.py
+"""Streaming row readers for uploaded xlsx/xls/csv files.
+
+Rows are yielded one at a time (header row first) so callers can stop after a
+sample, as the import preview does, or feed validation and insertion without
+materializing the sheet.
+"""
+import csv
+import io
+import posixpath
+import re
+import zipfile
+import zlib
+from datetime import datetime, timezone
+from io import BytesIO
+from itertools import islice
+from typing import Iterator, NamedTuple
+
+import openpyxl
+import xlrd
+from openpyxl.utils.exceptions import InvalidFileException
+
+XLSX = "xlsx"
+XLS = "xls"
+CSV = "csv"
+
+SUPPORTED_EXTENSIONS = (".xlsx", ".xls", ".csv")
+
+# Korean bank/card exports are cp949 (a superset of euc-kr) unless UTF-8.
+_CSV_ENCODINGS = ("utf-8-sig", "cp949")
+_CSV_SNIFF_BYTES = 16 * 1024
+_CSV_DELIMITERS = ",\t;|"
+
+
+def _no_rows() -> Iterator[list]:
+    yield from ()
+
+
+def detect_format(filename: str) -> str:
+    lower = filename.lower()
+    if lower.endswith(".csv"):
+        return CSV
+    return XLS if lower.endswith(".xls") and not lower.endswith(".xlsx") else XLSX
+
+
+_ROW_TAG = re.compile(rb"<(?:[A-Za-z_][\w.-]*:)?row\b([^>]*)>")
+_ROW_INDEX = re.compile(rb'\br="(\d+)"')
+_SCAN_CHUNK = 1 << 20
+
+
+def _scan_row_count(ws) -> int:
+    """Last row number of a read-only sheet, from a regex scan of its XML.
+
+    Much cheaper than parsing cells; used when <dimension> is unusable.
+    """
+    last = 0
+    carry = b""
+    with ws._get_source() as src:  # read-only worksheet XML stream
+        while True:
+            chunk = src.read(_SCAN_CHUNK)
+            buf = carry + chunk
+            # A tag never contains a raw "<", so everything before the last
+            # one is complete.
+            cut = len(buf) if not chunk else buf.rfind(b"<")
+            if cut <= 0:
+                cut = len(buf) if not chunk else 0
+            for m in _ROW_TAG.finditer(buf, 0, cut):
+                r = _ROW_INDEX.search(m.group(1))
+                last = int(r.group(1)) if r else last + 1
+            carry = buf[cut:]
+            if not chunk:
+                return last
+
+
+def _iter_xlsx(file_bytes: bytes) -> tuple[int | None, Iterator[list]]:
+    wb = openpyxl.load_workbook(BytesIO(file_bytes), read_only=True, data_only=True)
+    ws = wb.active
+    if ws is None:
+        wb.close()
+        return 0, _no_rows()
+
+    # max_row/max_column come from the sheet's <dimension> tag, which some
+    # writers omit (openpyxl write-only) or leave at "A1".  Keep them as hints,
+    # but read every row in the file (iter_rows would otherwise stop at
+    # max_row) and pad rows to the declared width as before.
+    count, width = ws.max_row, ws.max_column or 0
+    if count is None or count <= 1:
+        count = _scan_row_count(ws)
+    ws.reset_dimensions()
+
+    def rows() -> Iterator[list]:
+        try:
+            for values in ws.iter_rows(values_only=True):
+                row = list(values)
+                if len(row) < width:
+                    row.extend([None] * (width - len(row)))
+                yield row
+        finally:
+            wb.close()
+
+    return count, rows()
+
+
+def _iter_xls(file_bytes: bytes) -> tuple[int | None, Iterator[list]]:
+    wb = xlrd.open_workbook(file_contents=file_bytes)
+    if wb.nsheets == 0:
+        return 0, _no_rows()
+    ws = wb.sheet_by_index(0)
+
+    def rows() -> Iterator[list]:
+        for row_idx in range(ws.nrows):
+            row_values: list = []
+            for col_idx in range(ws.ncols):
+                cell = ws.cell(row_idx, col_idx)
+                if cell.ctype == xlrd.XL_CELL_DATE:
+                    # Convert xlrd date tuple to datetime
+                    dt_tuple = xlrd.xldate_as_tuple(cell.value, wb.datemode)
+                    row_values.append(datetime(*dt_tuple[:6], tzinfo=timezone.utc))
+                else:
+                    row_values.append(cell.value)
+            yield row_values
+
+    return ws.nrows, rows()
+
+
+def detect_encoding(file_bytes: bytes) -> str:
+    """First of _CSV_ENCODINGS that decodes the whole file (C-speed check)."""
+    for encoding in _CSV_ENCODINGS:
+        try:
+            file_bytes.decode(encoding)
+        except UnicodeDecodeError:
+            continue
+        return encoding
+    raise ValueError("unsupported CSV encoding")
+
+
+def _iter_csv(file_bytes: bytes) -> tuple[int | None, Iterator[list]]:
+    encoding = detect_encoding(file_bytes)
+    sample = file_bytes[:_CSV_SNIFF_BYTES].decode(encoding, errors="ignore")
+    try:
+        dialect = csv.Sniffer().sniff(sample, delimiters=_CSV_DELIMITERS)
+    except csv.Error:
+        dialect = csv.excel
+
+    def rows() -> Iterator[list]:
+        text = io.TextIOWrapper(BytesIO(file_bytes), encoding=encoding, newline="")
+        for record in csv.reader(text, dialect):
+            if not record:
+                continue  # blank line
+            # Empty fields read as None, like empty spreadsheet cells.
+            yield [v if v != "" else None for v in record]
+
+    # Quoted fields may span lines, so the count needs a parse; left to the caller.
+    return None, rows()
+
+
+def open_rows(file_bytes: bytes, fmt: str) -> tuple[int | None, Iterator[list]]:
+    """Open a sheet and return (row count incl. header if known, row iterator).
+
+    Raises whatever the underlying reader raises for a corrupt file; the
+    iterator closes the workbook once exhausted.
+    """
+    if fmt == CSV:
+        return _iter_csv(file_bytes)
+    if fmt == XLS:
+        return _iter_xls(file_bytes)
+    return _iter_xlsx(file_bytes)
+
+
+# ── Preview inspection ──
+#
+# inspect() is what the import preview runs in the parse process pool, so its
+# arguments, result and exception must be picklable and it must not touch the
+# database or the import cache.
+
+
+class SheetError(Exception):
+    """Unreadable or empty upload; str(e) is the user-facing message."""
+
+
+# What open_rows() and its iterators raise for a corrupt or unsupported file,
+# on opening or mid-stream.  ParseError of the XML parsers is a SyntaxError;
+# the rest of the non-obvious ones (KeyError for a missing workbook part,
+# zlib.error, EOFError) come from damaged xlsx archives.  Anything else is a
+# bug and should surface as one.
+READ_ERRORS = (
+    SheetError,
+    InvalidFileException,
+    zipfile.BadZipFile,
+    zlib.error,
+    SyntaxError,
+    xlrd.XLRDError,
+    csv.Error,
+    ValueError,
+    KeyError,
+    EOFError,
+    NotImplementedError,
+)
+
+
+class SheetSample(NamedTuple):
+    fmt: str
+    headers: list[str]
+    preview_rows: list[list[str | None]]  # cell values as strings
+    total_rows: int                        # data rows (header excluded)
+
+
+def inspect(file_bytes: bytes, filename: str, sample_rows: int) -> SheetSample:
+    """Read the header and up to `sample_rows` data rows, plus the row count."""
+    fmt = detect_format(filename)
+
+    try:
+        row_count, rows = open_rows(file_bytes, fmt)
+        sample = list(islice(rows, sample_rows + 1))
+        if row_count is None or row_count < len(sample):
+            # Missing or bogus <dimension> in the sheet: count the rest
+            # (still without keeping the rows).
+            row_count = len(sample) + sum(1 for _ in rows)
+        else:
+            rows.close()
+    except Exception:
+        raise SheetError(f"올바른 {fmt} 파일이 아닙니다.")
+
+    if len(sample) == 0:
+        raise SheetError("빈 엑셀 파일입니다.")
+
+    headers = [str(v) if v is not None else "" for v in sample[0]]
+    total_rows = row_count - 1
+
+    if total_rows <= 0:
+        raise SheetError("데이터 행이 없습니다.")
+
+    # Convert all cell values to strings for preview
+    preview_rows = [[str(v) if v is not None else None for v in row] for row in sample[1:]]
+    return SheetSample(fmt, headers, preview_rows, total_rows)
+
+
+# ── Batch uploads ──
+
+ZIP_EXTENSION = ".zip"
+
+
+def _zip_member_name(info: zipfile.ZipInfo) -> str:
+    # Archives made by Windows Explorer store cp949 names without the UTF-8
+    # flag; zipfile then decodes them as cp437.
+    if info.flag_bits & 0x800:
+        return info.filename
+    try:
+        return info.filename.encode("cp437").decode("cp949")
+    except (UnicodeEncodeError, UnicodeDecodeError):
+        return info.filename
+
+
+def expand_uploads(
+    uploads: list[tuple[str, bytes]],
+    max_files: int,
+    max_file_size: int,
+    max_total_size: int,
+) -> list[tuple[str, bytes]]:
+    """Flatten uploaded files and .zip archives into (filename, bytes) statements.
+
+    Archive members that are not xlsx/xls/csv (folders, __MACOSX metadata,
+    readme files, ...) are skipped.  Raises SheetError for unsupported
+    uploads, broken archives, oversized members, too many files or more than
+    `max_total_size` bytes of statements in all (uncompressed).
+    """
+    files: list[tuple[str, bytes]] = []
+    total_size = 0
+
+    def _reserve(size: int) -> None:
+        nonlocal total_size
+        if len(files) >= max_files:
+            raise SheetError(f"한 번에 최대 {max_files}개 파일까지 가져올 수 있습니다.")
+        if total_size + size > max_total_size:
+            raise SheetError(f"한 번에 가져올 파일의 전체 크기가 {max_total_size // (1024 * 1024)}MB를 초과합니다.")
+        total_size += size
+
+    for filename, data in uploads:
+        lower = filename.lower()
+        if lower.endswith(SUPPORTED_EXTENSIONS):
+            _reserve(len(data))
+            files.append((filename, data))
+            continue
+        if not lower.endswith(ZIP_EXTENSION):
+            raise SheetError(".xlsx, .xls, .csv 또는 .zip 파일만 지원합니다.")
+
+        try:
+            with zipfile.ZipFile(BytesIO(data)) as archive:
+                for info in archive.infolist():
+                    name = _zip_member_name(info)
+                    base = posixpath.basename(name)
+                    if info.is_dir() or name.startswith("__MACOSX/") or base.startswith("."):
+                        continue
+                    if not base.lower().endswith(SUPPORTED_EXTENSIONS):
+                        continue
+                    # Checked before decompressing (declared size; zipfile
+                    # also stops reading past it).
+                    if info.file_size > max_file_size:
+                        raise SheetError(f"{base}: 파일 크기가 {max_file_size // (1024 * 1024)}MB를 초과합니다.")
+                    _reserve(info.file_size)
+                    files.append((base, archive.read(info)))
+        # Encrypted members raise RuntimeError, unsupported compression
+        # methods NotImplementedError, damaged deflate streams zlib.error.
+        except (zipfile.BadZipFile, RuntimeError, NotImplementedError, zlib.error, EOFError):
+            raise SheetError(f"{filename}: 올바른 zip 파일이 아닙니다.")
+
+    if not files:
+        raise SheetError("가져올 파일이 없습니다.")
+    return files
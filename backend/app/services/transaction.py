@@ -1,22 +1,28 @@
 # backend/app/services/transaction.py
+import base64
+import hashlib
+import json
 import uuid
 from datetime import date, datetime, timedelta, timezone
+from decimal import ROUND_HALF_UP, Decimal
 
 from fastapi import HTTPException
-from sqlalchemy import select
+from sqlalchemy import Text, case, cast, func, literal_column, select, tuple_
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from app.models.transaction import Transaction
 from app.schemas.transaction import TransactionCreate, TransactionUpdate
+from app.services import card_spending, data_version
 
 
-def list_transactions(
-    db: Session,
+def transactions_query(
     user_id: uuid.UUID,
     card_id: uuid.UUID | None = None,
     from_date: date | None = None,
     to_date: date | None = None,
-) -> list[Transaction]:
+):
+    """SELECT of a user's transactions with the optional card / date-range filters applied."""
     query = select(Transaction).where(Transaction.user_id == user_id)
     if card_id is not None:
         query = query.where(Transaction.user_card_id == card_id)
@@ -27,9 +33,165 @@ def list_transactions(
         next_day = to_date + timedelta(days=1)
         end_dt = datetime(next_day.year, next_day.month, next_day.day, tzinfo=timezone.utc)
         query = query.where(Transaction.transacted_at < end_dt)
+    return query
+
+
+def list_transactions(
+    db: Session,
+    user_id: uuid.UUID,
+    card_id: uuid.UUID | None = None,
+    from_date: date | None = None,
+    to_date: date | None = None,
+) -> list[Transaction]:
+    query = transactions_query(user_id, card_id, from_date, to_date)
     return list(
-        db.scalars(query.order_by(Transaction.transacted_at.desc())).all()
+        db.scalars(query.order_by(Transaction.transacted_at.desc(), Transaction.id.desc())).all()
+    )
+
+
+# ── Keyset pagination ─────────────────────────────────────────────────────────
+
+
+def encode_cursor(tx: Transaction) -> str:
+    """Opaque cursor pointing just after `tx` in (transacted_at DESC, id DESC) order."""
+    raw = json.dumps({"t": tx.transacted_at.isoformat(), "id": str(tx.id)})
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, uuid.UUID]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        data = json.loads(raw)
+        return datetime.fromisoformat(data["t"]), uuid.UUID(data["id"])
+    except (ValueError, KeyError, TypeError):
+        raise HTTPException(status_code=400, detail="잘못된 커서입니다.")
+
+
+def list_transactions_page(
+    db: Session,
+    user_id: uuid.UUID,
+    card_id: uuid.UUID | None = None,
+    from_date: date | None = None,
+    to_date: date | None = None,
+    limit: int = 50,
+    cursor: str | None = None,
+) -> tuple[list[Transaction], str | None]:
+    """Return one page of transactions and the cursor of the next page (None at the end).
+
+    Pages are ordered by (transacted_at DESC, id DESC) and the cursor seeks past
+    the last row of the previous page, so each page is an index range scan
+    regardless of how deep the client has scrolled.
+    """
+    query = transactions_query(user_id, card_id, from_date, to_date)
+    if cursor is not None:
+        after_at, after_id = decode_cursor(cursor)
+        query = query.where(tuple_(Transaction.transacted_at, Transaction.id) < tuple_(after_at, after_id))
+    rows = list(
+        db.scalars(
+            query.order_by(Transaction.transacted_at.desc(), Transaction.id.desc()).limit(limit + 1)
+        ).all()
+    )
+    if len(rows) > limit:
+        rows = rows[:limit]
+        return rows, encode_cursor(rows[-1])
+    return rows, None
+
+
+# ── Dedup key ─────────────────────────────────────────────────────────────────
+#
+# Every transaction carries md5("YYYY-MM-DD:amount:description") in dedup_key,
+# unique per user, so imports can skip rows that already exist with
+# INSERT ... ON CONFLICT DO NOTHING.  Manually entered transactions may
+# legitimately repeat (two identical coffees); only the first one holds the
+# key and the others keep NULL.  When the holder changes or is deleted, the key
+# is handed over to one of its identical siblings.
+
+
+def _normalize_amount(amount) -> str:
+    q = Decimal(amount).quantize(Decimal("0.01"), rounding=ROUND_HALF_UP)
+    return str(int(q)) if q == q.to_integral_value() else str(q)
+
+
+def compute_dedup_key(transacted_at: datetime, amount, description: str | None) -> str:
+    """Python side of the dedup key; must match dedup_key_sql()."""
+    raw = f"{card_spending.utc_date(transacted_at):%Y-%m-%d}:{_normalize_amount(amount)}:{description or ''}"
+    return hashlib.md5(raw.encode()).hexdigest()
+
+
+def dedup_key_sql():
+    """SQL side of the dedup key, computed from the transactions columns."""
+    day = func.to_char(
+        Transaction.transacted_at.op("AT TIME ZONE")(literal_column("'UTC'")),
+        literal_column("'YYYY-MM-DD'"),
     )
+    amount = case(
+        (Transaction.amount == func.trunc(Transaction.amount), cast(func.trunc(Transaction.amount), Text)),
+        else_=cast(Transaction.amount, Text),
+    )
+    return func.md5(
+        day.concat(literal_column("':'")).concat(amount).concat(literal_column("':'"))
+        .concat(func.coalesce(Transaction.description, literal_column("''")))
+    )
+
+
+def _dedup_key_taken(db: Session, user_id: uuid.UUID, key: str) -> bool:
+    return db.scalar(
+        select(Transaction.id).where(Transaction.user_id == user_id, Transaction.dedup_key == key).limit(1)
+    ) is not None
+
+
+def _claim_dedup_key(db: Session, transaction: Transaction, key: str) -> None:
+    """Give the transaction `key` unless another transaction of the user holds it.
+
+    The check alone is racy: a concurrent write can claim the same key between
+    it and our flush.  The assignment is therefore flushed in a savepoint, and
+    losing the race on uq_transactions_user_dedup_key just leaves this
+    transaction without a key (as if the check had said taken).
+    """
+    if _dedup_key_taken(db, transaction.user_id, key):
+        return
+    db.flush()  # pending changes go out first: the savepoint rollback must only undo the claim
+    try:
+        with db.begin_nested():
+            transaction.dedup_key = key
+    except IntegrityError:
+        pass  # the rollback expired the row; it reloads with dedup_key NULL
+
+
+def _hand_over_dedup_key(
+    db: Session, user_id: uuid.UUID, key: str, transacted_at: datetime, exclude_id: uuid.UUID
+) -> None:
+    """Give a released key to an identical transaction that does not hold one."""
+    day = card_spending.utc_date(transacted_at)
+    start_dt = datetime(day.year, day.month, day.day, tzinfo=timezone.utc)
+    sibling = db.scalar(
+        select(Transaction)
+        .where(
+            Transaction.user_id == user_id,
+            Transaction.dedup_key.is_(None),
+            Transaction.transacted_at >= start_dt,
+            Transaction.transacted_at < start_dt + timedelta(days=1),
+            Transaction.id != exclude_id,
+            dedup_key_sql() == key,
+        )
+        .order_by(Transaction.created_at.asc(), Transaction.id.asc())
+        .limit(1)
+    )
+    if sibling is not None:
+        _claim_dedup_key(db, sibling, key)
+
+
+def _refresh_dedup_key(db: Session, transaction: Transaction, previous_at: datetime | None = None) -> None:
+    """Claim the key of the transaction's current content, releasing the old one."""
+    key = compute_dedup_key(transaction.transacted_at, transaction.amount, transaction.description)
+    if transaction.dedup_key == key:
+        return
+    released = transaction.dedup_key
+    if released is not None:
+        transaction.dedup_key = None
+        db.flush()
+        _hand_over_dedup_key(db, transaction.user_id, released, previous_at, transaction.id)
+    _claim_dedup_key(db, transaction, key)
 
 
 def create_transaction(db: Session, user_id: uuid.UUID, data: TransactionCreate) -> Transaction:
@@ -44,6 +206,9 @@ def create_transaction(db: Session, user_id: uuid.UUID, data: TransactionCreate)
         user_card_id=data.user_card_id,
     )
     db.add(transaction)
+    _refresh_dedup_key(db, transaction)
+    card_spending.apply(db, added=[transaction])
+    data_version.bump(db, user_id)
     db.commit()
     db.refresh(transaction)
     return transaction
@@ -62,8 +227,12 @@ def update_transaction(
     db: Session, user_id: uuid.UUID, tx_id: uuid.UUID, data: TransactionUpdate
 ) -> Transaction:
     transaction = get_transaction(db, user_id, tx_id)
+    before = card_spending.Spend.of(transaction)
     for field, value in data.model_dump(exclude_unset=True).items():
         setattr(transaction, field, value)
+    _refresh_dedup_key(db, transaction, previous_at=before.transacted_at)
+    card_spending.apply(db, added=[transaction], removed=[before])
+    data_version.bump(db, user_id)
     db.commit()
     db.refresh(transaction)
     return transaction
@@ -71,7 +240,13 @@ def update_transaction(
 
 def delete_transaction(db: Session, user_id: uuid.UUID, tx_id: uuid.UUID) -> None:
     transaction = get_transaction(db, user_id, tx_id)
+    card_spending.apply(db, removed=[transaction])
+    released = transaction.dedup_key
     db.delete(transaction)
+    if released is not None:
+        db.flush()
+        _hand_over_dedup_key(db, user_id, released, transaction.transacted_at, transaction.id)
+    data_version.bump(db, user_id)
     db.commit()
 
 
@@ -1,12 +1,19 @@
 import uuid
-from datetime import date, datetime, timedelta, timezone
+from datetime import date, timedelta
 
 from fastapi import HTTPException
-from sqlalchemy import func, select
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 
 from app.models.user_card import UserCard
-from app.schemas.user_card import CardPerformanceItem, UserCardCreate, UserCardUpdate
+from app.schemas.user_card import (
+    CardPerformanceHistoryItem,
+    CardPerformanceItem,
+    CardPeriodSpendingItem,
+    UserCardCreate,
+    UserCardUpdate,
+)
+from app.services import benefit_index, card_spending, data_version
 
 
 # ── Period helpers ────────────────────────────────────────────────────────────
@@ -72,7 +79,9 @@ def create_card(db: Session, user_id: uuid.UUID, data: UserCardCreate) -> UserCa
         billing_day=data.billing_day,
     )
     db.add(card)
+    data_version.bump(db, user_id)
     db.commit()
+    benefit_index.invalidate(user_id)
     db.refresh(card)
     return card
 
@@ -83,9 +92,14 @@ def update_card(db: Session, user_id: uuid.UUID, card_id: uuid.UUID, data: UserC
     )
     if card is None:
         raise HTTPException(status_code=404, detail="Card not found")
+    billing_day_changed = card.billing_day != data.billing_day
     card.monthly_target = data.monthly_target
     card.billing_day = data.billing_day
+    if billing_day_changed:
+        card_spending.rebuild_card(db, card)
+    data_version.bump(db, user_id)
     db.commit()
+    benefit_index.invalidate(user_id)
     db.refresh(card)
     return card
 
@@ -97,40 +111,24 @@ def delete_card(db: Session, user_id: uuid.UUID, card_id: uuid.UUID) -> None:
     if card is None:
         raise HTTPException(status_code=404, detail="Card not found")
     db.delete(card)
+    data_version.bump(db, user_id)
     db.commit()
+    benefit_index.invalidate(user_id)
 
 
 # ── Performance ───────────────────────────────────────────────────────────────
 
 
-def get_cards_performance(db: Session, user_id: uuid.UUID) -> list[CardPerformanceItem]:
-    from app.models.transaction import Transaction  # avoid circular import
+def _achievement_percent(spending: int, target: int | None) -> float | None:
+    return round(min(spending / target, 1.0) * 100, 1) if target else None
+
 
-    cards = list_cards(db, user_id)
+def get_cards_performance(db: Session, user_id: uuid.UUID) -> list[CardPerformanceItem]:
     today = date.today()
     result: list[CardPerformanceItem] = []
 
-    for card in cards:
+    for card, spending in card_spending.get_cards_with_spending(db, user_id, today):
         start, end = get_performance_period(card.billing_day, today)
-
-        # Convert date range to UTC datetime boundaries
-        start_dt = datetime(start.year, start.month, start.day, tzinfo=timezone.utc)
-        end_dt = datetime(
-            (end + timedelta(days=1)).year,
-            (end + timedelta(days=1)).month,
-            (end + timedelta(days=1)).day,
-            tzinfo=timezone.utc,
-        )
-
-        raw = db.scalar(
-            select(func.sum(Transaction.amount)).where(
-                Transaction.user_card_id == card.id,
-                Transaction.type == "expense",
-                Transaction.transacted_at >= start_dt,
-                Transaction.transacted_at < end_dt,
-            )
-        )
-        spending = int(raw or 0)
         target = card.monthly_target
 
         result.append(
@@ -144,10 +142,32 @@ def get_cards_performance(db: Session, user_id: uuid.UUID) -> list[CardPerforman
                 period_end=end,
                 current_spending=spending,
                 remaining=max(0, target - spending) if target is not None else None,
-                achievement_percent=(
-                    round(min(spending / target, 1.0) * 100, 1) if target else None
-                ),
+                achievement_percent=_achievement_percent(spending, target),
             )
         )
 
     return result
+
+
+def get_cards_performance_history(db: Session, user_id: uuid.UUID, periods: int) -> list[CardPerformanceHistoryItem]:
+    """Spending per card over its last `periods` performance periods (current one first)."""
+    today = date.today()
+    return [
+        CardPerformanceHistoryItem(
+            card_id=str(card.id),
+            card_name=card.name,
+            card_type=card.type,
+            monthly_target=card.monthly_target,
+            billing_day=card.billing_day,
+            periods=[
+                CardPeriodSpendingItem(
+                    period_start=start,
+                    period_end=get_performance_period(card.billing_day, start)[1],
+                    spending=spending,
+                    achievement_percent=_achievement_percent(spending, card.monthly_target),
+                )
+                for start, spending in history
+            ],
+        )
+        for card, history in card_spending.get_spending_history(db, user_id, today, periods)
+    ]
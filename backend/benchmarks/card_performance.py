@@ -0,0 +1,84 @@
+# backend/benchmarks/card_performance.py
+"""Latency of the card performance reads: current period and N-period history.
+
+Needs a reachable PostgreSQL (DATABASE_URL); tables are created if missing.
+A throw-away user gets `--cards` cards with mixed billing days and a year of
+expenses on each (the ledger is filled through card_spending.rebuild_card),
+then get_cards_performance / get_cards_performance_history are timed.  The
+user and its rows are deleted afterwards.
+
+Usage (from backend/):
+    DATABASE_URL=postgresql://... python -m benchmarks.card_performance
+    python -m benchmarks.card_performance --cards 20 --periods 12 --repeat 50
+"""
+import argparse
+import statistics
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--cards", type=int, default=20)
+    parser.add_argument("--periods", type=int, default=12)
+    parser.add_argument("--tx-per-card", type=int, default=365)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    from app.core.database import Base, SessionLocal, engine
+    from app.models.transaction import Transaction
+    from app.models.user import User
+    from app.models.user_card import UserCard
+    from app.services import card_spending
+    from app.services.user_card import get_cards_performance, get_cards_performance_history
+
+    Base.metadata.create_all(bind=engine)
+
+    with SessionLocal() as db:
+        user = User(email=f"bench-{uuid.uuid4().hex[:8]}@example.com", hashed_password="x", name="bench")
+        db.add(user)
+        db.flush()
+        today = datetime.now(timezone.utc)
+        for c in range(args.cards):
+            card = UserCard(user_id=user.id, type="credit_card", name=f"카드{c}", monthly_target=300000,
+                            billing_day=None if c % 5 == 0 else (c % 28) + 1)
+            db.add(card)
+            db.flush()
+            db.add_all(
+                Transaction(user_id=user.id, user_card_id=card.id, type="expense", amount=Decimal(1000 + i),
+                            transacted_at=today - timedelta(days=i))
+                for i in range(args.tx_per_card)
+            )
+            db.flush()
+            card_spending.rebuild_card(db, card)
+        db.commit()
+        user_id = user.id
+
+    try:
+        print("query\tcards\tperiods\tmedian_ms\tp95_ms")
+        for name, call in (
+            ("performance", lambda db: get_cards_performance(db, user_id)),
+            ("history", lambda db: get_cards_performance_history(db, user_id, args.periods)),
+        ):
+            timings = []
+            with SessionLocal() as db:
+                call(db)  # warm up (connection, plan cache)
+                for _ in range(args.repeat):
+                    start = time.perf_counter()
+                    call(db)
+                    timings.append((time.perf_counter() - start) * 1000)
+                    db.expunge_all()
+            timings.sort()
+            p95 = timings[int(len(timings) * 0.95) - 1]
+            periods = args.periods if name == "history" else 1
+            print(f"{name}\t{args.cards}\t{periods}\t{statistics.median(timings):.2f}\t{p95:.2f}")
+    finally:
+        with SessionLocal() as cleanup:
+            cleanup.execute(User.__table__.delete().where(User.id == user_id))
+            cleanup.commit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+# backend/benchmarks/import_insert.py
+"""Rows/sec of the import confirm insert step: ORM vs multi-row INSERT vs COPY.
+
+Needs a reachable PostgreSQL (DATABASE_URL); tables are created if missing.
+Each mode inserts the same synthetic rows for a throw-away user inside a
+transaction that is rolled back, so runs do not affect each other.  Roughly
+one row in ten repeats an earlier one to exercise duplicate skipping.
+
+    orm     one Transaction object per row, add_all + flush (the original path)
+    insert  INSERT ... ON CONFLICT DO NOTHING in chunks (small-import path)
+    copy    COPY FROM STDIN into a staging table + one merge (large-import path)
+
+Usage (from backend/):
+    DATABASE_URL=postgresql://... python -m benchmarks.import_insert
+    python -m benchmarks.import_insert --rows 20000 100000 --modes insert copy
+"""
+import argparse
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+DEFAULT_ROWS = [2_000, 20_000, 100_000]
+MODES = ["orm", "insert", "copy"]
+
+
+def _synthetic_rows(user_id: uuid.UUID, n: int) -> list[dict]:
+    from app.services.transaction import compute_dedup_key
+
+    base = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    now = datetime.now(timezone.utc)
+    rows = []
+    for i in range(n):
+        j = i - 7 if i % 10 == 9 else i  # every tenth row duplicates an earlier one
+        transacted_at = base + timedelta(minutes=j * 37)
+        amount = Decimal((j % 500) * 100 + 1000)
+        description = f"가맹점 {j % 997} 결제 #{j}"
+        rows.append({
+            "id": uuid.uuid4(),
+            "user_id": user_id,
+            "category_id": None,
+            "type": "expense",
+            "amount": amount,
+            "description": description,
+            "transacted_at": transacted_at,
+            "payment_type": "credit_card",
+            "user_card_id": None,
+            "dedup_key": compute_dedup_key(transacted_at, amount, description),
+            "created_at": now,
+            "updated_at": now,
+        })
+    return rows
+
+
+def _run_orm(db, rows: list[dict]) -> int:
+    """The original confirm_import: Python-side dedup set + ORM objects."""
+    from app.models.transaction import Transaction
+
+    seen: set[str] = set()
+    objects = []
+    for row in rows:
+        if row["dedup_key"] in seen:
+            continue
+        seen.add(row["dedup_key"])
+        objects.append(Transaction(**{k: v for k, v in row.items() if k != "dedup_key"}))
+    db.add_all(objects)
+    db.flush()
+    return len(objects)
+
+
+def _run_insert(db, rows: list[dict]) -> int:
+    from app.services.excel_io import _INSERT_CHUNK_SIZE, _insert_ignoring_duplicates
+
+    return sum(
+        _insert_ignoring_duplicates(db, rows[i:i + _INSERT_CHUNK_SIZE])
+        for i in range(0, len(rows), _INSERT_CHUNK_SIZE)
+    )
+
+
+def _run_copy(db, rows: list[dict]) -> int:
+    from app.services.excel_io import _COPY_CHUNK_SIZE, _copy_to_staging, _create_staging, _merge_staging
+
+    _create_staging(db)
+    for i in range(0, len(rows), _COPY_CHUNK_SIZE):
+        _copy_to_staging(db, rows[i:i + _COPY_CHUNK_SIZE])
+    return _merge_staging(db)
+
+
+RUNNERS = {"orm": _run_orm, "insert": _run_insert, "copy": _run_copy}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=DEFAULT_ROWS)
+    parser.add_argument("--modes", nargs="+", default=MODES, choices=MODES)
+    args = parser.parse_args()
+
+    from app.core.database import Base, SessionLocal, engine
+    from app.models.user import User
+
+    Base.metadata.create_all(bind=engine)
+
+    with SessionLocal() as setup:
+        user = User(email=f"bench-{uuid.uuid4().hex[:8]}@example.com", hashed_password="x", name="bench")
+        setup.add(user)
+        setup.commit()
+        user_id = user.id
+
+    try:
+        print("rows\tmode\tinserted\tseconds\trows_per_sec\tvs_orm")
+        for n in args.rows:
+            rows = _synthetic_rows(user_id, n)
+            baseline = None
+            for mode in args.modes:
+                with SessionLocal() as db:
+                    start = time.perf_counter()
+                    inserted = RUNNERS[mode](db, rows)
+                    elapsed = time.perf_counter() - start
+                    db.rollback()
+                rate = n / elapsed
+                if mode == "orm":
+                    baseline = rate
+                speedup = f"{rate / baseline:.1f}x" if baseline else "-"
+                print(f"{n}\t{mode}\t{inserted}\t{elapsed:.2f}\t{rate:,.0f}\t{speedup}")
+    finally:
+        with SessionLocal() as cleanup:
+            cleanup.execute(User.__table__.delete().where(User.id == user_id))
+            cleanup.commit()
+
+
+if __name__ == "__main__":
+    main()
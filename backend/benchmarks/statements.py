@@ -0,0 +1,105 @@
+# backend/benchmarks/statements.py
+"""Synthetic card/bank statements in xlsx, xls and CSV for the import benchmarks.
+
+Headers are the Korean column names banks use, chosen so auto_detect_mapping
+(FIELD_PATTERNS) maps every field.  Rows are deterministic for a given count:
+dates spread over a year, a few hundred merchants, mixed expense/income, and
+repeated category/card names as in real exports.  Every row is distinct
+(no dedup hits) up to millions of rows.
+
+Usage (from backend/), writes files for manual testing:
+    python -m benchmarks.statements --rows 1000 200000 --formats xlsx csv -o /tmp/statements
+"""
+import argparse
+import csv
+import io
+import os
+from typing import Iterator
+
+HEADERS = ["거래일", "가맹점", "이용금액", "구분", "카테고리", "결제수단", "카드명"]
+# Mapping auto_detect_mapping produces for HEADERS (indices into the row)
+MAPPING = {
+    "transacted_at": 0, "description": 1, "amount": 2, "type": 3,
+    "category_name": 4, "payment_type": 5, "card_name": 6,
+}
+FORMATS = ["xlsx", "xls", "csv"]
+# The BIFF (xls) format stops at 65,536 rows including the header.
+XLS_MAX_ROWS = 65_535
+
+_CATEGORIES = ["식비", "교통", "쇼핑", "카페", "생활", "의료", "여가"]
+_CARDS = ["신한카드", "국민카드", "현대카드"]
+_PAYMENT_TYPES = ["신용카드", "체크카드", "현금"]
+
+
+def rows(n: int) -> Iterator[list]:
+    """Data rows of an n-row statement (amounts as text with thousands separators, as banks export)."""
+    for i in range(n):
+        income = i % 20 == 0
+        yield [
+            f"2024.{(i % 12) + 1:02d}.{(i % 28) + 1:02d}",
+            f"가맹점 {i % 997} {'급여' if income else '결제'}",
+            f"{(i % 500) * 100 + 1000:,}",
+            "입금" if income else "지출",
+            _CATEGORIES[i % len(_CATEGORIES)],
+            _PAYMENT_TYPES[i % len(_PAYMENT_TYPES)],
+            _CARDS[i % len(_CARDS)],
+        ]
+
+
+def make(fmt: str, n: int) -> bytes:
+    """An n-row statement file in `fmt` (header row included)."""
+    if fmt == "csv":
+        text = io.StringIO(newline="")
+        writer = csv.writer(text)
+        writer.writerow(HEADERS)
+        writer.writerows(rows(n))
+        return text.getvalue().encode("cp949")
+    if fmt == "xlsx":
+        import openpyxl
+
+        # A regular workbook writes <dimension> like Excel and bank exports do;
+        # write-only mode omits it.
+        wb = openpyxl.Workbook()
+        ws = wb.active
+        ws.append(HEADERS)
+        for row in rows(n):
+            ws.append(row)
+        buf = io.BytesIO()
+        wb.save(buf)
+        return buf.getvalue()
+    if fmt == "xls":
+        if n > XLS_MAX_ROWS:
+            raise ValueError(f"xls holds at most {XLS_MAX_ROWS} data rows")
+        import xlwt
+
+        wb = xlwt.Workbook()
+        ws = wb.add_sheet("Sheet1")
+        for r, row in enumerate([HEADERS, *rows(n)]):
+            for c, value in enumerate(row):
+                ws.write(r, c, value)
+        buf = io.BytesIO()
+        wb.save(buf)
+        return buf.getvalue()
+    raise ValueError(f"unknown format: {fmt}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[1_000, 10_000, 200_000])
+    parser.add_argument("--formats", nargs="+", default=FORMATS, choices=FORMATS)
+    parser.add_argument("-o", "--output-dir", default=".")
+    args = parser.parse_args()
+
+    os.makedirs(args.output_dir, exist_ok=True)
+    for n in args.rows:
+        for fmt in args.formats:
+            if fmt == "xls" and n > XLS_MAX_ROWS:
+                continue
+            path = os.path.join(args.output_dir, f"statement_{n}.{fmt}")
+            with open(path, "wb") as fh:
+                fh.write(make(fmt, n))
+            print(path)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,7 +5,9 @@
 # is required – the only prerequisite is a running Docker daemon.
 import atexit
 import os
+from contextlib import contextmanager
 from pathlib import Path
+from typing import NamedTuple
 
 import pytest
 
@@ -43,11 +45,14 @@ os.environ.setdefault("SMTP_PORT", "587")
 os.environ.setdefault("SMTP_USER", "")
 os.environ.setdefault("SMTP_PASSWORD", "")
 os.environ.setdefault("SMTP_FROM", "test@example.com")
+# Tests edit the catalog with raw SQL; see each change on the next read.
+os.environ.setdefault("CATALOG_VERSION_CHECK_SECONDS", "0")
 
 atexit.register(_pg.stop)
 
 # ── App import (after DATABASE_URL is in the environment) ─────────────────────
 from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import event  # noqa: E402
 
 from app.main import app  # noqa: E402
 from app.core.database import Base, engine  # noqa: E402
@@ -72,6 +77,40 @@ def clean_tables():
             conn.execute(table.delete())
 
 
+# ── SQL capture ───────────────────────────────────────────────────────────────
+
+
+class ExecutedStatement(NamedTuple):
+    statement: str
+    parameters: object
+    executemany: bool
+
+
+@pytest.fixture
+def capture_sql():
+    """Return a context manager collecting every statement sent to the database in its block.
+
+        with capture_sql() as executed:
+            ...
+        assert len(executed) == 1
+    """
+
+    @contextmanager
+    def _capture():
+        executed: list[ExecutedStatement] = []
+
+        def _on_execute(conn, cursor, statement, parameters, context, executemany):
+            executed.append(ExecutedStatement(statement, parameters, executemany))
+
+        event.listen(engine, "before_cursor_execute", _on_execute)
+        try:
+            yield executed
+        finally:
+            event.remove(engine, "before_cursor_execute", _on_execute)
+
+    return _capture
+
+
 # ── HTTP client ───────────────────────────────────────────────────────────────
 
 
@@ -3,6 +3,7 @@
 Tests for:
   GET  /api/v1/cards/catalog/           — list (empty DB when no seeds, with search)
   GET  /api/v1/cards/catalog/{id}/      — detail + 404
+  (served from the in-memory snapshot: ETag / 304, reload on version bump)
 
   GET    /api/v1/cards/{id}/benefits    — list benefits
   POST   /api/v1/cards/{id}/benefits    — create benefit
@@ -11,6 +12,7 @@ Tests for:
   (auth/isolation errors for benefit endpoints)
 """
 
+from app.services import catalog_snapshot
 from tests.conftest import register_and_login
 
 
@@ -31,6 +33,7 @@ def _create_catalog_card(client):
             ),
             {"id": catalog_id, "name": "테스트 카드", "issuer": "테스트카드사", "card_type": "credit_card", "is_active": True},
         )
+        catalog_snapshot.bump(conn)
     return catalog_id
 
 
@@ -84,6 +87,7 @@ def test_catalog_list_inactive_card_excluded(client):
             ),
             {"id": inactive_id},
         )
+        catalog_snapshot.bump(conn)
     resp = client.get("/api/v1/cards/catalog/?q=inactive_card_xyz")
     assert resp.status_code == 200
     assert resp.json() == []
@@ -108,6 +112,80 @@ def test_catalog_detail_not_found_returns_404(client):
     assert resp.status_code == 404
 
 
+# ── snapshot / ETag ───────────────────────────────────────────────────────────
+
+
+def test_catalog_list_etag_not_modified(client):
+    _create_catalog_card(client)
+    resp = client.get("/api/v1/cards/catalog/")
+    etag = resp.headers["etag"]
+    assert etag.startswith('"')
+
+    again = client.get("/api/v1/cards/catalog/", headers={"If-None-Match": etag})
+    assert again.status_code == 304
+    assert again.headers["etag"] == etag
+    assert again.content == b""
+
+
+def test_catalog_detail_etag_not_modified(client):
+    catalog_id = _create_catalog_card(client)
+    etag = client.get(f"/api/v1/cards/catalog/{catalog_id}").headers["etag"]
+    resp = client.get(f"/api/v1/cards/catalog/{catalog_id}", headers={"If-None-Match": f'"other", W/{etag}'})
+    assert resp.status_code == 304
+
+
+def test_catalog_etag_changes_after_version_bump(client):
+    _create_catalog_card(client)
+    first = client.get("/api/v1/cards/catalog/")
+    _create_catalog_card(client)
+    second = client.get("/api/v1/cards/catalog/", headers={"If-None-Match": first.headers["etag"]})
+    assert second.status_code == 200
+    assert len(second.json()) == len(first.json()) + 1
+    assert second.headers["etag"] != first.headers["etag"]
+
+
+def test_catalog_served_from_memory(client, monkeypatch):
+    """Between version checks catalog reads do not touch the database."""
+    import sqlalchemy as sa
+    from app.core.config import settings
+    from app.core.database import engine
+
+    catalog_id = _create_catalog_card(client)
+    client.get("/api/v1/cards/catalog/")
+    monkeypatch.setattr(settings, "CATALOG_VERSION_CHECK_SECONDS", 3600)
+
+    executed = []
+
+    def _on_execute(conn, cursor, statement, *_args):
+        executed.append(statement)
+
+    sa.event.listen(engine, "before_cursor_execute", _on_execute)
+    try:
+        assert client.get("/api/v1/cards/catalog/?q=테스트").status_code == 200
+        assert client.get(f"/api/v1/cards/catalog/{catalog_id}").status_code == 200
+    finally:
+        sa.event.remove(engine, "before_cursor_execute", _on_execute)
+    assert executed == []
+
+
+def test_catalog_search_is_case_insensitive(client):
+    from app.core.database import engine
+    import sqlalchemy as sa
+    import uuid
+
+    with engine.begin() as conn:
+        conn.execute(
+            sa.text(
+                "INSERT INTO card_catalog (id, name, issuer, card_type, is_active, created_at) "
+                "VALUES (:id, 'Deep Dream', 'SHINHAN', 'credit_card', true, NOW())"
+            ),
+            {"id": str(uuid.uuid4())},
+        )
+        catalog_snapshot.bump(conn)
+    assert [c["name"] for c in client.get("/api/v1/cards/catalog/?q=shinhan").json()] == ["Deep Dream"]
+    assert [c["name"] for c in client.get("/api/v1/cards/catalog/?q=dream").json()] == ["Deep Dream"]
+
+
 # ── benefit CRUD ──────────────────────────────────────────────────────────────
 
 
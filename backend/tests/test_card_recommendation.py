@@ -14,6 +14,10 @@ Coverage:
   - higher score card ranked first
   - user isolation
   - 401 without auth
+  - query count independent of the number of cards
+  - repeat recommendations reuse the compiled benefit index
+  - benefit / card writes invalidate it, also when made by another worker
+  - POST /recommend/batch: same results as single calls, constant queries, validation
 """
 
 import uuid as _uuid
@@ -21,6 +25,7 @@ import uuid as _uuid
 import sqlalchemy as sa
 
 from app.core.database import engine
+from app.services import catalog_snapshot
 from tests.conftest import register_and_login
 
 
@@ -58,6 +63,7 @@ def _insert_catalog_card(name="카탈로그카드", issuer="카탈로그카드
             ),
             {"id": catalog_id, "name": name, "issuer": issuer},
         )
+        catalog_snapshot.bump(conn)
     return catalog_id
 
 
@@ -81,6 +87,7 @@ def _insert_catalog_benefit(catalog_id, category="전체", benefit_type="cashbac
                 "min_amount": min_amount,
             },
         )
+        catalog_snapshot.bump(conn)
     return benefit_id
 
 
@@ -413,3 +420,202 @@ def test_recommend_best_benefit_selected_per_card(client, auth_headers):
     assert len(results) == 1
     # Should pick 식비 5% = 500, not 전체 1% = 100
     assert results[0]["effective_value"] == 500
+
+
+# ── query count ──────────────────────────────────────────────────────────────
+
+
+def _add_cards_of_each_kind(client, headers, catalog_id, n):
+    """Create n cards with user benefits and n cards falling back to the catalog."""
+    for i in range(n):
+        card = _create_user_card(client, headers, {
+            "type": "credit_card", "name": f"사용자혜택{i}", "monthly_target": 100000,
+        })
+        _add_benefit(client, headers, card["id"], {
+            "category": "전체", "benefit_type": "cashback", "rate": 1.0 + i,
+        })
+        linked = _create_user_card(client, headers, {"type": "credit_card", "name": f"카탈로그{i}"})
+        _link_card_to_catalog(linked["id"], catalog_id)
+
+
+def test_recommend_query_count_does_not_grow_with_cards(client, auth_headers, capture_sql):
+    """Benefits and spending are fetched in batches, not once per card."""
+    catalog_id = _insert_catalog_card()
+    _insert_catalog_benefit(catalog_id, category="전체", benefit_type="cashback", rate=2.0)
+    client.get("/api/v1/cards/catalog/")  # reload the catalog snapshot outside the counts
+
+    _add_cards_of_each_kind(client, auth_headers, catalog_id, 1)
+    with capture_sql() as few:
+        assert len(_recommend(client, auth_headers, amount=10000)) == 2
+
+    _add_cards_of_each_kind(client, auth_headers, catalog_id, 7)
+    with capture_sql() as many:
+        assert len(_recommend(client, auth_headers, amount=10000)) == 16
+
+    assert len(many) == len(few)
+
+
+# ── compiled benefit index ───────────────────────────────────────────────────
+
+
+def test_recommend_repeat_only_reads_spending(client, auth_headers, monkeypatch, capture_sql):
+    """A warm benefit index leaves the data version check and the spending lookup as the only queries."""
+    from app.core.config import settings
+    from app.core.database import SessionLocal
+    from app.models.user import User
+    from app.services.card_recommendation import recommend_cards
+    from tests.conftest import USER_PAYLOAD
+
+    catalog_id = _insert_catalog_card()
+    _insert_catalog_benefit(catalog_id, category="전체", benefit_type="cashback", rate=2.0)
+    _add_cards_of_each_kind(client, auth_headers, catalog_id, 3)
+
+    with SessionLocal() as db:
+        user_id = db.scalar(sa.select(User.id).where(User.email == USER_PAYLOAD["email"]))
+        first = recommend_cards(db, user_id, "식비", 10000)
+        monkeypatch.setattr(settings, "CATALOG_VERSION_CHECK_SECONDS", 3600)
+        with capture_sql() as warm:
+            second = recommend_cards(db, user_id, "식비", 10000)
+
+    assert second == first
+    assert len(warm) == 2
+
+
+def test_recommend_sees_writes_from_another_worker(client, auth_headers):
+    """A write that bumps data_version elsewhere (no local invalidate) rebuilds the index."""
+    card = _create_user_card(client, auth_headers, {"type": "credit_card", "name": "다른워커카드"})
+    benefit = _add_benefit(client, auth_headers, card["id"], {
+        "category": "식비", "benefit_type": "cashback", "rate": 1.0,
+    })
+    assert _recommend(client, auth_headers, amount=10000, category="식비")[0]["effective_value"] == 100
+
+    with engine.begin() as conn:
+        conn.execute(sa.text("UPDATE user_card_benefits SET rate = 3.0 WHERE id = :id"), {"id": benefit["id"]})
+        conn.execute(
+            sa.text("UPDATE user_data_versions SET version = version + 1 WHERE user_id = "
+                    "(SELECT user_id FROM user_cards WHERE id = :id)"),
+            {"id": card["id"]},
+        )
+
+    assert _recommend(client, auth_headers, amount=10000, category="식비")[0]["effective_value"] == 300
+
+
+def test_recommend_reflects_benefit_update_and_delete(client, auth_headers):
+    card = _create_user_card(client, auth_headers, {"type": "credit_card", "name": "변경카드"})
+    benefit = _add_benefit(client, auth_headers, card["id"], {
+        "category": "식비", "benefit_type": "cashback", "rate": 1.0,
+    })
+    assert _recommend(client, auth_headers, amount=10000, category="식비")[0]["effective_value"] == 100
+
+    resp = client.patch(
+        f"/api/v1/cards/{card['id']}/benefits/{benefit['id']}", headers=auth_headers, json={"rate": 4.0}
+    )
+    assert resp.status_code == 200, resp.text
+    assert _recommend(client, auth_headers, amount=10000, category="식비")[0]["effective_value"] == 400
+
+    _add_benefit(client, auth_headers, card["id"], {
+        "category": "전체", "benefit_type": "cashback", "rate": 6.0, "min_amount": 5000,
+    })
+    assert _recommend(client, auth_headers, amount=10000, category="식비")[0]["effective_value"] == 600
+    assert _recommend(client, auth_headers, amount=4000, category="식비")[0]["effective_value"] == 160
+
+    resp = client.delete(f"/api/v1/cards/{card['id']}/benefits/{benefit['id']}", headers=auth_headers)
+    assert resp.status_code == 204
+    assert _recommend(client, auth_headers, amount=4000, category="식비") == []
+
+
+def test_recommend_reflects_card_update_and_delete(client, auth_headers):
+    from datetime import date
+
+    card = _create_user_card(client, auth_headers, {
+        "type": "credit_card", "name": "목표변경카드", "monthly_target": 1000000, "billing_day": None,
+    })
+    _add_benefit(client, auth_headers, card["id"], {"category": "전체", "benefit_type": "cashback", "rate": 1.0})
+    mid = date.today().replace(day=min(date.today().day, 15))
+    client.post("/api/v1/transactions/", headers=auth_headers, json={
+        "type": "expense", "amount": 95000,
+        "transacted_at": f"{mid}T10:00:00+00:00", "user_card_id": card["id"],
+    })
+    assert _recommend(client, auth_headers)[0]["is_near_target"] is False
+
+    resp = client.patch(f"/api/v1/cards/{card['id']}", headers=auth_headers, json={
+        "monthly_target": 100000, "billing_day": None,
+    })
+    assert resp.status_code == 200, resp.text
+    assert _recommend(client, auth_headers)[0]["is_near_target"] is True
+
+    assert client.delete(f"/api/v1/cards/{card['id']}", headers=auth_headers).status_code == 204
+    assert _recommend(client, auth_headers) == []
+
+
+# ── batch ────────────────────────────────────────────────────────────────────
+
+
+def _recommend_batch(client, headers, items):
+    resp = client.post("/api/v1/cards/recommend/batch", headers=headers, json={"items": items})
+    assert resp.status_code == 200, resp.text
+    return resp.json()
+
+
+def test_recommend_batch_matches_single_calls(client, auth_headers):
+    food = _create_user_card(client, auth_headers, {"type": "credit_card", "name": "식비카드"})
+    _add_benefit(client, auth_headers, food["id"], {"category": "식비", "benefit_type": "cashback", "rate": 5.0})
+    _add_benefit(client, auth_headers, food["id"], {
+        "category": "전체", "benefit_type": "discount", "flat_amount": 300, "min_amount": 20000,
+    })
+    capped = _create_user_card(client, auth_headers, {"type": "credit_card", "name": "한도카드"})
+    _add_benefit(client, auth_headers, capped["id"], {
+        "category": "전체", "benefit_type": "cashback", "rate": 3.0, "monthly_cap": 400,
+    })
+
+    items = [
+        {"category": "식비", "amount": 10000},
+        {"category": "교통", "amount": 30000},
+        {"amount": 1000},
+        {"category": "식비", "amount": 10000},
+        {"category": "쇼핑"},
+    ]
+    batch = _recommend_batch(client, auth_headers, items)
+
+    assert [(r["category"], r["amount"]) for r in batch] == [
+        ("식비", 10000), ("교통", 30000), (None, 1000), ("식비", 10000), ("쇼핑", 10000),
+    ]
+    for item, result in zip(items, batch):
+        single = _recommend(client, auth_headers, amount=item.get("amount", 10000), category=item.get("category"))
+        assert result["results"] == single
+    assert [r["card_name"] for r in batch[0]["results"]] == ["식비카드", "한도카드"]
+    assert batch[1]["results"][0]["effective_value"] == 400  # 30000 * 3% capped
+
+
+def test_recommend_batch_query_count_does_not_grow_with_items(client, auth_headers, capture_sql):
+    catalog_id = _insert_catalog_card()
+    _insert_catalog_benefit(catalog_id, category="전체", benefit_type="cashback", rate=2.0)
+    client.get("/api/v1/cards/catalog/")  # reload the catalog snapshot outside the counts
+    _add_cards_of_each_kind(client, auth_headers, catalog_id, 3)
+    _recommend_batch(client, auth_headers, [{"amount": 1000}])  # build the benefit index
+
+    with capture_sql() as one:
+        _recommend_batch(client, auth_headers, [{"category": "식비", "amount": 10000}])
+    with capture_sql() as many:
+        batch = _recommend_batch(client, auth_headers, [
+            {"category": category, "amount": amount}
+            for category in ("식비", "교통", "쇼핑", None) for amount in (1000, 10000, 50000)
+        ])
+
+    assert len(batch) == 12
+    assert all(len(r["results"]) == 6 for r in batch)
+    assert len(many) == len(one)
+
+
+def test_recommend_batch_validates_items(client, auth_headers):
+    resp = client.post("/api/v1/cards/recommend/batch", headers=auth_headers, json={"items": []})
+    assert resp.status_code == 422
+    resp = client.post(
+        "/api/v1/cards/recommend/batch", headers=auth_headers, json={"items": [{"amount": 1000}] * 101}
+    )
+    assert resp.status_code == 422
+
+
+def test_recommend_batch_requires_auth(client):
+    resp = client.post("/api/v1/cards/recommend/batch", json={"items": [{"amount": 1000}]})
+    assert resp.status_code in (401, 403)
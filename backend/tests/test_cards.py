@@ -8,6 +8,7 @@ Coverage:
   PATCH  /cards/{id}          – set monthly_target, billing_day, clear to None
   DELETE /cards/{id}          – success, not found, user isolation
   GET    /cards/performance   – no cards, billing_day null, billing_day set, target null
+                                 spending ledger kept in sync on transaction/card writes
 """
 
 from tests.conftest import register_and_login
@@ -277,6 +278,82 @@ def test_performance_user_isolation(client, auth_headers):
     assert resp.json() == []
 
 
+def _current_spending(client, headers):
+    items = client.get("/api/v1/cards/performance", headers=headers).json()
+    return {item["card_id"]: item["current_spending"] for item in items}
+
+
+def test_performance_ledger_follows_transaction_edits(client, auth_headers):
+    """Updating amount, card, type and deleting a transaction keeps spending exact."""
+    from datetime import date
+
+    card_a = create_card(client, auth_headers, {"type": "credit_card", "name": "카드A"})
+    card_b = create_card(client, auth_headers, {"type": "credit_card", "name": "카드B"})
+    today = date.today()
+    tx = create_tx(client, auth_headers, card_a["id"], "30000", f"{today}T10:00:00+00:00")
+    assert _current_spending(client, auth_headers) == {card_a["id"]: 30000, card_b["id"]: 0}
+
+    client.put(f"/api/v1/transactions/{tx['id']}", headers=auth_headers, json={"amount": "50000"})
+    assert _current_spending(client, auth_headers) == {card_a["id"]: 50000, card_b["id"]: 0}
+
+    client.put(f"/api/v1/transactions/{tx['id']}", headers=auth_headers, json={"user_card_id": card_b["id"]})
+    assert _current_spending(client, auth_headers) == {card_a["id"]: 0, card_b["id"]: 50000}
+
+    client.put(f"/api/v1/transactions/{tx['id']}", headers=auth_headers, json={"type": "income"})
+    assert _current_spending(client, auth_headers) == {card_a["id"]: 0, card_b["id"]: 0}
+
+    client.put(f"/api/v1/transactions/{tx['id']}", headers=auth_headers, json={"type": "expense"})
+    client.delete(f"/api/v1/transactions/{tx['id']}", headers=auth_headers)
+    assert _current_spending(client, auth_headers) == {card_a["id"]: 0, card_b["id"]: 0}
+
+
+def test_performance_ledger_moves_amount_between_periods(client, auth_headers):
+    """Moving a transaction into a past period removes it from the current one."""
+    from datetime import date, timedelta
+
+    card = create_card(client, auth_headers)
+    today = date.today()
+    tx = create_tx(client, auth_headers, card["id"], "40000", f"{today}T10:00:00+00:00")
+    assert _current_spending(client, auth_headers)[card["id"]] == 40000
+
+    past = today - timedelta(days=70)
+    client.put(
+        f"/api/v1/transactions/{tx['id']}",
+        headers=auth_headers,
+        json={"transacted_at": f"{past}T10:00:00+00:00"},
+    )
+    assert _current_spending(client, auth_headers)[card["id"]] == 0
+
+
+def test_performance_ledger_rebuilt_on_billing_day_change(client, auth_headers):
+    """Changing billing_day regroups the ledger under the new period boundaries."""
+    from datetime import date, timedelta
+
+    import sqlalchemy as sa
+    from app.core.database import engine
+    from app.services.user_card import get_performance_period
+
+    card = create_card(client, auth_headers)
+    today = date.today()
+    days = [today, today - timedelta(days=20), today - timedelta(days=45)]
+    for d in days:
+        create_tx(client, auth_headers, card["id"], "10000", f"{d}T10:00:00+00:00")
+
+    client.patch(f"/api/v1/cards/{card['id']}", headers=auth_headers, json={"billing_day": 3})
+
+    expected: dict[date, int] = {}
+    for d in days:
+        start = get_performance_period(3, d)[0]
+        expected[start] = expected.get(start, 0) + 10000
+    with engine.connect() as conn:
+        rows = conn.execute(
+            sa.text("SELECT period_start, amount FROM card_period_spendings WHERE user_card_id = :id"),
+            {"id": card["id"]},
+        ).all()
+    assert {start: int(amount) for start, amount in rows} == expected
+    assert _current_spending(client, auth_headers)[card["id"]] == expected[get_performance_period(3, today)[0]]
+
+
 # ── edge cases (documents current behavior) ─────────────────────────────────
 
 
@@ -353,3 +430,92 @@ def test_performance_boundary_billing_days(client, auth_headers):
     assert len(items) == 2
     billing_days = {item["billing_day"] for item in items}
     assert billing_days == {1, 28}
+
+
+def test_performance_many_cards_in_one_query(client, auth_headers, capture_sql):
+    """Each card gets its own billing window, all aggregated by a single statement."""
+    import sqlalchemy as sa
+    from datetime import date, timedelta
+
+    from app.core.database import SessionLocal
+    from app.models.user import User
+    from app.services.user_card import get_cards_performance, get_performance_period
+    from tests.conftest import USER_PAYLOAD
+
+    today = date.today()
+    cards = []
+    for billing_day in (None, 1, 10, 14, 25, 28):
+        card = client.post(
+            "/api/v1/cards/",
+            headers=auth_headers,
+            json={"type": "credit_card", "name": f"카드{billing_day}", "monthly_target": 100000, "billing_day": billing_day},
+        ).json()
+        start, _ = get_performance_period(billing_day, today)
+        create_tx(client, auth_headers, card["id"], "10000", f"{start}T00:30:00+00:00")  # first day of the period
+        create_tx(client, auth_headers, card["id"], "7000", f"{start - timedelta(days=1)}T23:30:00+00:00")  # previous period
+        cards.append((card["id"], start))
+
+    db = SessionLocal()
+    try:
+        user = db.scalar(sa.select(User).where(User.email == USER_PAYLOAD["email"]))
+        with capture_sql() as executed:
+            items = get_cards_performance(db, user.id)
+    finally:
+        db.close()
+
+    assert len(executed) == 1
+    assert [item.card_id for item in items] == [card_id for card_id, _ in cards]
+    for item, (_, start) in zip(items, cards):
+        assert item.period_start == start
+        assert item.current_spending == 10000
+
+
+def test_performance_history(client, auth_headers):
+    """Last N periods per card, newest first, each window shifted by billing_day."""
+    from datetime import date, timedelta
+
+    from app.services.user_card import get_performance_period
+
+    today = date.today()
+    card = client.post(
+        "/api/v1/cards/",
+        headers=auth_headers,
+        json={"type": "credit_card", "name": "히스토리카드", "monthly_target": 100000, "billing_day": 5},
+    ).json()
+    plain = create_card(client, auth_headers, {"type": "debit_card", "name": "체크카드"})
+
+    current_start, _ = get_performance_period(5, today)
+    previous_start, previous_end = get_performance_period(5, current_start - timedelta(days=1))
+    create_tx(client, auth_headers, card["id"], "30000", f"{current_start}T10:00:00+00:00")
+    create_tx(client, auth_headers, card["id"], "50000", f"{previous_start}T10:00:00+00:00")
+    create_tx(client, auth_headers, card["id"], "70000", f"{previous_end}T10:00:00+00:00")
+
+    resp = client.get("/api/v1/cards/performance/history?periods=3", headers=auth_headers)
+    assert resp.status_code == 200
+    items = resp.json()
+    assert [item["card_id"] for item in items] == [card["id"], plain["id"]]
+
+    periods = items[0]["periods"]
+    assert len(periods) == 3
+    assert periods[0]["period_start"] == str(current_start)
+    assert periods[1]["period_start"] == str(previous_start)
+    assert periods[1]["period_end"] == str(previous_end)
+    assert [p["spending"] for p in periods] == [30000, 100000, 0]  # 100000 = 전월 실적
+    assert [p["achievement_percent"] for p in periods] == [30.0, 100.0, 0.0]
+
+    assert len(items[1]["periods"]) == 3
+    assert {p["spending"] for p in items[1]["periods"]} == {0}
+    assert items[1]["periods"][0]["achievement_percent"] is None
+
+
+def test_performance_history_validates_periods(client, auth_headers):
+    assert client.get("/api/v1/cards/performance/history?periods=0", headers=auth_headers).status_code == 422
+    assert client.get("/api/v1/cards/performance/history?periods=37", headers=auth_headers).status_code == 422
+
+
+def test_performance_history_user_isolation(client, auth_headers):
+    create_card(client, auth_headers)
+    other = register_and_login(client, "history-other@example.com")
+    resp = client.get("/api/v1/cards/performance/history", headers=other)
+    assert resp.status_code == 200
+    assert resp.json() == []
@@ -1,13 +1,18 @@
 # backend/tests/test_excel_io.py
 """Tests for Excel import/export endpoints."""
+import csv
+import re
+import time
+import zipfile
 from datetime import datetime, timezone
-from io import BytesIO
+from io import BytesIO, StringIO
 
 import openpyxl
 import xlwt
 import pytest
 
-from app.services import import_cache
+from app.services import export_cache, import_cache, import_jobs
+from tests.conftest import register_and_login
 
 
 def make_xlsx(headers: list[str], rows: list[list]) -> BytesIO:
@@ -38,14 +43,29 @@ def make_xls(headers: list[str], rows: list[list]) -> BytesIO:
     return buf
 
 
+def upload_preview(client, auth_headers, headers: list[str], rows: list[list]) -> str:
+    """Upload an xlsx preview and return its import_id."""
+    resp = client.post(
+        "/api/v1/transactions/import/preview",
+        files={"file": ("test.xlsx", make_xlsx(headers, rows), "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet")},
+        headers=auth_headers,
+    )
+    assert resp.status_code == 200
+    return resp.json()["import_id"]
+
+
 # ── Fixtures ─────────────────────────────────────────────────────────────────
 
 @pytest.fixture(autouse=True)
 def _clear_import_cache():
     """Ensure import cache is clean for every test."""
     import_cache.clear()
+    import_jobs.clear()
+    export_cache.clear()
     yield
     import_cache.clear()
+    import_jobs.clear()
+    export_cache.clear()
 
 
 def _create_card(client, auth_headers, name="테스트카드"):
@@ -122,6 +142,35 @@ class TestImportPreview:
         assert len(data["preview_rows"]) == 10
         assert data["total_rows"] == 20
 
+    def test_missing_sheet_dimension_counts_rows(self, client, auth_headers):
+        """Writers that omit or truncate <dimension> still get a correct total_rows."""
+        rows = [[f"2024-01-{i+1:02d}", 1000 * (i + 1), f"Item {i}"] for i in range(25)]
+        src = make_xlsx(["날짜", "금액", "내역"], rows)
+        out = BytesIO()
+        with zipfile.ZipFile(src) as zin, zipfile.ZipFile(out, "w") as zout:
+            for item in zin.infolist():
+                data = zin.read(item.filename)
+                if item.filename == "xl/worksheets/sheet1.xml":
+                    data = re.sub(rb'<dimension ref="[^"]*"\s*/>', b'<dimension ref="A1"/>', data)
+                zout.writestr(item, data)
+        out.seek(0)
+
+        resp = client.post(
+            "/api/v1/transactions/import/preview",
+            files={"file": ("test.xlsx", out, "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet")},
+            headers=auth_headers,
+        )
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["total_rows"] == 25
+
+        resp = client.post(
+            "/api/v1/transactions/import/confirm",
+            json={"import_id": data["import_id"], "mapping": {"transacted_at": 0, "amount": 1, "description": 2}},
+            headers=auth_headers,
+        )
+        assert resp.json()["created_count"] == 25
+
     def test_xls_korean_headers_auto_detected(self, client, auth_headers):
         xls = make_xls(
             ["날짜", "금액", "내역", "구분"],
@@ -167,7 +216,7 @@ class TestImportPreview:
         buf = BytesIO(b"not an xlsx file")
         resp = client.post(
             "/api/v1/transactions/import/preview",
-            files={"file": ("test.csv", buf, "text/csv")},
+            files={"file": ("test.txt", buf, "text/plain")},
             headers=auth_headers,
         )
         assert resp.status_code == 400
@@ -198,6 +247,97 @@ class TestImportPreview:
         )
         assert resp.status_code == 403
 
+    def test_rejects_when_parse_pool_saturated(self, client, auth_headers, monkeypatch):
+        from app.core.config import settings
+
+        monkeypatch.setattr(settings, "IMPORT_PARSE_MAX_PENDING", 0)
+        xlsx = make_xlsx(["날짜", "금액"], [["2024-01-01", 1000]])
+        resp = client.post(
+            "/api/v1/transactions/import/preview",
+            files={"file": ("test.xlsx", xlsx, "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet")},
+            headers=auth_headers,
+        )
+        assert resp.status_code == 503
+
+    def test_parse_pool_recovers_after_worker_crash(self):
+        import asyncio
+        import os
+
+        from fastapi import HTTPException
+
+        from app.services import parse_pool
+
+        with pytest.raises(HTTPException) as exc:
+            asyncio.run(parse_pool.run(os._exit, 1))  # the worker process dies
+        assert exc.value.status_code == 503
+        assert asyncio.run(parse_pool.run(len, "abc")) == 3
+
+    def test_preview_without_process_pool(self, client, auth_headers, monkeypatch):
+        from app.core.config import settings
+
+        monkeypatch.setattr(settings, "IMPORT_PARSE_WORKERS", 0)
+        xlsx = make_xlsx(["날짜", "금액", "내역"], [["2024-01-15", 15000, "스타벅스"]])
+        resp = client.post(
+            "/api/v1/transactions/import/preview",
+            files={"file": ("test.xlsx", xlsx, "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet")},
+            headers=auth_headers,
+        )
+        assert resp.status_code == 200
+        assert resp.json()["total_rows"] == 1
+        assert resp.json()["preview_rows"] == [["2024-01-15", "15000", "스타벅스"]]
+
+
+class TestImportCsv:
+    CSV_TEXT = (
+        "거래일,가맹점명,이용금액\r\n"
+        "2024-01-15,\"스타벅스, 강남점\",\"15,000\"\r\n"
+        "2024.01.16,편의점,2500\r\n"
+    )
+
+    def _preview(self, client, auth_headers, content: bytes, filename="statement.csv"):
+        return client.post(
+            "/api/v1/transactions/import/preview",
+            files={"file": (filename, BytesIO(content), "text/csv")},
+            headers=auth_headers,
+        )
+
+    @pytest.mark.parametrize("encoding", ["cp949", "euc-kr", "utf-8", "utf-8-sig"])
+    def test_preview_detects_encoding(self, client, auth_headers, encoding):
+        resp = self._preview(client, auth_headers, self.CSV_TEXT.encode(encoding))
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["headers"] == ["거래일", "가맹점명", "이용금액"]
+        assert data["auto_mapping"]["transacted_at"] == 0
+        assert data["auto_mapping"]["amount"] == 2
+        assert data["auto_mapping"]["description"] == 1
+        assert data["preview_rows"][0] == ["2024-01-15", "스타벅스, 강남점", "15,000"]
+        assert data["total_rows"] == 2
+
+    def test_confirm_creates_transactions(self, client, auth_headers):
+        import_id = self._preview(client, auth_headers, self.CSV_TEXT.encode("cp949")).json()["import_id"]
+        resp = client.post(
+            "/api/v1/transactions/import/confirm",
+            json={"import_id": import_id, "mapping": {"transacted_at": 0, "amount": 2, "description": 1}},
+            headers=auth_headers,
+        )
+        assert resp.status_code == 201
+        assert resp.json()["created_count"] == 2
+
+        txs = client.get("/api/v1/transactions/", headers=auth_headers).json()
+        assert sorted(float(t["amount"]) for t in txs) == [2500.0, 15000.0]
+        assert {t["description"] for t in txs} == {"스타벅스, 강남점", "편의점"}
+
+    def test_tab_separated(self, client, auth_headers):
+        content = "날짜\t금액\t내역\n2024-01-15\t15000\t스타벅스\n".encode("cp949")
+        resp = self._preview(client, auth_headers, content)
+        assert resp.status_code == 200
+        assert resp.json()["preview_rows"] == [["2024-01-15", "15000", "스타벅스"]]
+
+    def test_reject_undecodable(self, client, auth_headers):
+        resp = self._preview(client, auth_headers, b"\xff\xfe\x00\x81\x00")
+        assert resp.status_code == 400
+        assert resp.json()["detail"] == "올바른 csv 파일이 아닙니다."
+
 
 # ── Import Confirm Tests ────────────────────────────────────────────────────
 
@@ -275,6 +415,74 @@ class TestImportConfirm:
         assert data["created_count"] == 1
         assert data["duplicate_count"] == 1
 
+    def _confirm(self, client, auth_headers, import_id):
+        resp = client.post(
+            "/api/v1/transactions/import/confirm",
+            json={
+                "import_id": import_id,
+                "mapping": {"transacted_at": 0, "amount": 1, "description": 2},
+            },
+            headers=auth_headers,
+        )
+        assert resp.status_code == 201
+        return resp.json()
+
+    def _create_manual(self, client, auth_headers, amount, description, transacted_at="2024-01-15T00:00:00Z"):
+        resp = client.post(
+            "/api/v1/transactions/",
+            json={
+                "type": "expense",
+                "amount": amount,
+                "description": description,
+                "transacted_at": transacted_at,
+            },
+            headers=auth_headers,
+        )
+        assert resp.status_code == 201
+        return resp.json()["id"]
+
+    def test_skip_duplicates_within_file(self, client, auth_headers):
+        import_id = self._preview(
+            client, auth_headers,
+            ["날짜", "금액", "내역"],
+            [
+                ["2024-01-15", 15000, "스타벅스"],
+                ["2024-01-15", 15000, "스타벅스"],
+                ["2024-01-15", 15000.5, "스타벅스"],
+            ],
+        )
+        data = self._confirm(client, auth_headers, import_id)
+        assert data["created_count"] == 2
+        assert data["duplicate_count"] == 1
+
+    def test_duplicate_key_survives_deleting_one_of_identical_manual_rows(self, client, auth_headers):
+        first = self._create_manual(client, auth_headers, 15000, "스타벅스")
+        self._create_manual(client, auth_headers, 15000, "스타벅스")
+        assert client.delete(f"/api/v1/transactions/{first}", headers=auth_headers).status_code == 204
+
+        import_id = self._preview(client, auth_headers, ["날짜", "금액", "내역"], [["2024-01-15", 15000, "스타벅스"]])
+        data = self._confirm(client, auth_headers, import_id)
+        assert data["created_count"] == 0
+        assert data["duplicate_count"] == 1
+
+    def test_duplicate_key_follows_edited_transaction(self, client, auth_headers):
+        tx_id = self._create_manual(client, auth_headers, 15000, "스타벅스")
+        resp = client.put(
+            f"/api/v1/transactions/{tx_id}",
+            json={"amount": 18000, "description": "투썸"},
+            headers=auth_headers,
+        )
+        assert resp.status_code == 200
+
+        import_id = self._preview(
+            client, auth_headers,
+            ["날짜", "금액", "내역"],
+            [["2024-01-15", 15000, "스타벅스"], ["2024-01-15", 18000, "투썸"]],
+        )
+        data = self._confirm(client, auth_headers, import_id)
+        assert data["created_count"] == 1
+        assert data["duplicate_count"] == 1
+
     def test_category_name_matching(self, client, auth_headers):
         _create_category(client, auth_headers, "식비", "expense")
         import_id = self._preview(
@@ -317,6 +525,69 @@ class TestImportConfirm:
         txs = client.get("/api/v1/transactions/", headers=auth_headers).json()
         assert txs[0]["user_card_id"] is not None
 
+    def test_import_updates_card_performance(self, client, auth_headers):
+        from datetime import date
+
+        card_id = _create_card(client, auth_headers, "신한카드")
+        today = date.today().isoformat()
+        import_id = self._preview(
+            client, auth_headers,
+            ["날짜", "금액", "내역", "카드명"],
+            [[today, 15000, "스타벅스", "신한카드"], [today, 5000, "편의점", "신한카드"]],
+        )
+        resp = client.post(
+            "/api/v1/transactions/import/confirm",
+            json={
+                "import_id": import_id,
+                "mapping": {"transacted_at": 0, "amount": 1, "description": 2, "card_name": 3},
+            },
+            headers=auth_headers,
+        )
+        assert resp.status_code == 201
+
+        items = client.get("/api/v1/cards/performance", headers=auth_headers).json()
+        assert items[0]["card_id"] == card_id
+        assert items[0]["current_spending"] == 20000
+
+    def test_copy_path_skips_duplicates_and_updates_card_performance(self, client, auth_headers, monkeypatch):
+        from datetime import date
+
+        from app.services import excel_io
+
+        monkeypatch.setattr(excel_io, "COPY_THRESHOLD", 2)
+        card_id = _create_card(client, auth_headers, "신한카드")
+        today = date.today().isoformat()
+        self._create_manual(client, auth_headers, 15000, "스타벅스", f"{today}T00:00:00Z")
+
+        import_id = self._preview(
+            client, auth_headers,
+            ["날짜", "금액", "내역", "카드명"],
+            [
+                [today, 15000, "스타벅스", None],       # existing
+                [today, 5000, "편의점\t24시", "신한카드"],
+                [today, 5000, "편의점\t24시", "신한카드"],  # within-file duplicate
+                [today, 7000, "서점", "신한카드"],
+            ],
+        )
+        resp = client.post(
+            "/api/v1/transactions/import/confirm",
+            json={
+                "import_id": import_id,
+                "mapping": {"transacted_at": 0, "amount": 1, "description": 2, "card_name": 3},
+            },
+            headers=auth_headers,
+        )
+        assert resp.status_code == 201
+        data = resp.json()
+        assert data["created_count"] == 2
+        assert data["duplicate_count"] == 2
+
+        descriptions = sorted(t["description"] for t in client.get("/api/v1/transactions/", headers=auth_headers).json())
+        assert descriptions == ["서점", "스타벅스", "편의점\t24시"]
+        items = client.get("/api/v1/cards/performance", headers=auth_headers).json()
+        assert items[0]["card_id"] == card_id
+        assert items[0]["current_spending"] == 12000
+
     def test_expired_import_id_404(self, client, auth_headers):
         resp = client.post(
             "/api/v1/transactions/import/confirm",
@@ -366,6 +637,64 @@ class TestImportConfirm:
         assert resp.status_code == 201
         assert resp.json()["created_count"] == 3
 
+    def test_compiled_parsers_fall_back_on_unexpected_shapes(self, client, auth_headers, monkeypatch):
+        """Column parsers are picked from a sample; rows of another shape still parse."""
+        from app.services import excel_io
+
+        monkeypatch.setattr(excel_io, "_COMPILE_SAMPLE_ROWS", 1)
+        import_id = self._preview(
+            client, auth_headers,
+            ["날짜", "금액", "내역", "결제수단"],
+            [
+                ["2024-01-15", "15,000", "ISO", "현금"],
+                ["24.01.16", "₩2,500원", "short", "신용카드"],
+                ["2024/1/7", 3000, "loose", "계좌이체"],
+                [datetime(2024, 1, 8, 9, 30), 4000.5, "native", "기타"],
+            ],
+        )
+        resp = client.post(
+            "/api/v1/transactions/import/confirm",
+            json={
+                "import_id": import_id,
+                "mapping": {"transacted_at": 0, "amount": 1, "description": 2, "payment_type": 3},
+            },
+            headers=auth_headers,
+        )
+        assert resp.status_code == 201
+        assert resp.json()["created_count"] == 4
+
+        txs = {t["description"]: t for t in client.get("/api/v1/transactions/", headers=auth_headers).json()}
+        assert txs["ISO"]["transacted_at"].startswith("2024-01-15")
+        assert txs["short"]["transacted_at"].startswith("2024-01-16")
+        assert txs["loose"]["transacted_at"].startswith("2024-01-07")
+        assert txs["native"]["transacted_at"].startswith("2024-01-08")
+        assert float(txs["short"]["amount"]) == 2500
+        assert float(txs["native"]["amount"]) == 4000.5
+        assert txs["ISO"]["payment_type"] == "cash"
+        assert txs["loose"]["payment_type"] == "bank"
+        assert txs["native"]["payment_type"] is None
+
+    def test_non_ascii_digits_in_dates_do_not_fail_import(self, client, auth_headers):
+        """"²" passes str.isdigit() but not int(); such cells are skipped, not a 500."""
+        from app.services import excel_io
+
+        assert excel_io._date_iso("²０２４-01-05") is None
+        assert excel_io._date_short("²4.01.05") is None
+        assert excel_io._date_iso("２０２４-01-05") == datetime(2024, 1, 5, tzinfo=timezone.utc)
+
+        import_id = self._preview(
+            client, auth_headers,
+            ["날짜", "금액"],
+            [["2024-01-15", 1000], ["²０２４-01-05", 2000], ["2024-01-16", 3000]],
+        )
+        resp = client.post(
+            "/api/v1/transactions/import/confirm",
+            json={"import_id": import_id, "mapping": {"transacted_at": 0, "amount": 1}},
+            headers=auth_headers,
+        )
+        assert resp.status_code == 201
+        assert resp.json()["created_count"] == 2
+
     def test_korean_type_mapping(self, client, auth_headers):
         import_id = self._preview(
             client, auth_headers,
@@ -421,38 +750,23 @@ class TestImportConfirm:
         )
         assert resp.status_code == 403
 
-    def test_reject_oversized_file(self, client, auth_headers):
-        """Files > 5MB should be rejected."""
-        # Create a >5MB xlsx by writing many rows
-        import openpyxl
-        from io import BytesIO
-        wb = openpyxl.Workbook()
-        ws = wb.active
-        ws.append(["날짜", "금액", "내역"])
-        # ~5.1MB of data (each row ~50 bytes, need ~100K rows)
-        for i in range(100000):
-            ws.append([f"2024-01-{(i%28)+1:02d}", i * 1000, f"Item {i} " + "x" * 30])
-        buf = BytesIO()
-        wb.save(buf)
-        buf.seek(0)
-        content = buf.read()
-        if len(content) < 5 * 1024 * 1024:
-            # If still under 5MB, this test documents that large files are accepted
-            buf = BytesIO(content)
-            resp = client.post(
-                "/api/v1/transactions/import/preview",
-                files={"file": ("big.xlsx", buf, "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet")},
-                headers=auth_headers,
-            )
-            assert resp.status_code in (200, 400, 413)
-        else:
-            buf = BytesIO(content)
-            resp = client.post(
-                "/api/v1/transactions/import/preview",
-                files={"file": ("big.xlsx", buf, "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet")},
-                headers=auth_headers,
-            )
-            assert resp.status_code in (400, 413)
+    def test_reject_oversized_file(self, client, auth_headers, monkeypatch):
+        """Files over MAX_FILE_SIZE (settings.IMPORT_MAX_FILE_MB) are rejected."""
+        from app.api.v1.endpoints import excel_io as excel_endpoint
+
+        monkeypatch.setattr(excel_endpoint, "MAX_FILE_SIZE", 1024 * 1024)
+        xlsx = make_xlsx(
+            ["날짜", "금액", "내역"],
+            [[f"2024-01-{(i % 28) + 1:02d}", i * 1000, f"Item {i} " + "x" * 30] for i in range(60000)],
+        )
+        assert len(xlsx.getvalue()) > 1024 * 1024
+        resp = client.post(
+            "/api/v1/transactions/import/preview",
+            files={"file": ("big.xlsx", xlsx, "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet")},
+            headers=auth_headers,
+        )
+        assert resp.status_code == 400
+        assert resp.json()["detail"] == "파일 크기가 1MB를 초과합니다."
 
     def test_negative_amount_becomes_absolute(self, client, auth_headers):
         """Negative amount like '-15,000' is converted to abs()."""
@@ -554,6 +868,254 @@ class TestImportConfirm:
         assert txs[0]["payment_type"] is None
 
 
+# ── One-request Import (saved profile) Tests ─────────────────────────────────
+
+
+class TestImportWithProfile:
+    HEADERS = ["이용일자", "이용금액", "가맹점명"]
+    MAPPING = {"transacted_at": 0, "amount": 1, "description": 2}
+
+    def _import(self, client, auth_headers, headers, rows):
+        xlsx = make_xlsx(headers, rows)
+        return client.post(
+            "/api/v1/transactions/import",
+            files={"file": ("test.xlsx", xlsx, "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet")},
+            headers=auth_headers,
+        )
+
+    def _confirm_once(self, client, auth_headers, default_type="expense"):
+        import_id = upload_preview(client, auth_headers, self.HEADERS, [["2024-01-15", 15000, "스타벅스"]])
+        resp = client.post(
+            "/api/v1/transactions/import/confirm",
+            json={"import_id": import_id, "mapping": self.MAPPING, "default_type": default_type},
+            headers=auth_headers,
+        )
+        assert resp.status_code == 201
+
+    def test_unknown_layout_requires_preview(self, client, auth_headers):
+        resp = self._import(client, auth_headers, self.HEADERS, [["2024-01-15", 15000, "스타벅스"]])
+        assert resp.status_code == 404
+
+    def test_imports_with_saved_mapping(self, client, auth_headers):
+        self._confirm_once(client, auth_headers)
+
+        resp = self._import(client, auth_headers, self.HEADERS, [
+            ["2024-01-15", 15000, "스타벅스"],   # already imported
+            ["2024-02-15", 4500, "편의점"],
+            ["invalid", 1000, "오류"],
+        ])
+        assert resp.status_code == 201
+        data = resp.json()
+        assert data["created_count"] == 1
+        assert data["duplicate_count"] == 1
+        assert data["error_count"] == 1
+        assert data["errors"][0]["row"] == 4
+
+        txs = client.get("/api/v1/transactions/", headers=auth_headers).json()
+        assert {t["description"] for t in txs} == {"스타벅스", "편의점"}
+        assert {t["type"] for t in txs} == {"expense"}
+
+    def test_does_not_stage_file(self, client, auth_headers):
+        self._confirm_once(client, auth_headers)
+        before = import_cache.stats()
+
+        resp = self._import(client, auth_headers, self.HEADERS, [["2024-02-15", 4500, "편의점"]])
+        assert resp.status_code == 201
+        assert import_cache.stats() == before
+
+    def test_latest_confirm_replaces_profile(self, client, auth_headers):
+        self._confirm_once(client, auth_headers)
+        self._confirm_once(client, auth_headers, default_type="income")
+
+        resp = self._import(client, auth_headers, self.HEADERS, [["2024-03-15", 30000, "급여"]])
+        assert resp.status_code == 201
+        txs = client.get("/api/v1/transactions/", headers=auth_headers).json()
+        assert next(t for t in txs if t["description"] == "급여")["type"] == "income"
+
+    def test_profile_is_per_user(self, client, auth_headers):
+        self._confirm_once(client, auth_headers)
+        other = register_and_login(client, email="other-profile@example.com")
+
+        resp = self._import(client, other, self.HEADERS, [["2024-02-15", 4500, "편의점"]])
+        assert resp.status_code == 404
+
+    def test_different_header_row_requires_preview(self, client, auth_headers):
+        self._confirm_once(client, auth_headers)
+
+        resp = self._import(client, auth_headers, ["거래일", "금액", "내용"], [["2024-02-15", 4500, "편의점"]])
+        assert resp.status_code == 404
+
+    def test_corrupt_rows_after_header_return_400(self, client, auth_headers):
+        """A reader error mid-stream (truncated sheet XML) is a bad file, not a server error."""
+        self._confirm_once(client, auth_headers)
+        rows = [[f"2024-01-{i % 28 + 1:02d}", 1000 + i, "가맹점" * 10] for i in range(3000)]
+        src = make_xlsx(self.HEADERS, rows)
+        out = BytesIO()
+        with zipfile.ZipFile(src) as zin, zipfile.ZipFile(out, "w") as zout:
+            for item in zin.infolist():
+                data = zin.read(item.filename)
+                if item.filename == "xl/worksheets/sheet1.xml":
+                    data = data[: len(data) // 2]
+                zout.writestr(item, data)
+        out.seek(0)
+
+        resp = client.post(
+            "/api/v1/transactions/import",
+            files={"file": ("test.xlsx", out, "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet")},
+            headers=auth_headers,
+        )
+        assert resp.status_code == 400
+        assert resp.json()["detail"] == "올바른 xlsx 파일이 아닙니다."
+
+    def test_requires_auth(self, client):
+        xlsx = make_xlsx(self.HEADERS, [["2024-01-15", 15000, "스타벅스"]])
+        resp = client.post(
+            "/api/v1/transactions/import",
+            files={"file": ("test.xlsx", xlsx, "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet")},
+        )
+        assert resp.status_code == 403
+
+
+# ── Batch Import Tests ──────────────────────────────────────────────────────
+
+
+class TestImportBatch:
+    HEADERS = ["날짜", "금액", "내역"]
+    XLSX_TYPE = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+
+    def _batch(self, client, auth_headers, files):
+        return client.post("/api/v1/transactions/import/batch", files=files, headers=auth_headers)
+
+    def _zip(self, members: dict[str, bytes]) -> BytesIO:
+        buf = BytesIO()
+        with zipfile.ZipFile(buf, "w") as zf:
+            for name, data in members.items():
+                zf.writestr(name, data)
+        buf.seek(0)
+        return buf
+
+    def test_multiple_files_dedup_across_files(self, client, auth_headers):
+        jan = make_xlsx(self.HEADERS, [["2024-01-15", 15000, "스타벅스"], ["2024-01-20", 4500, "편의점"]])
+        # Overlapping statement period: the 01-20 row appears in both files
+        feb = make_xlsx(self.HEADERS, [["2024-01-20", 4500, "편의점"], ["2024-02-03", 32000, "마트"]])
+        resp = self._batch(client, auth_headers, [
+            ("files", ("2024-01.xlsx", jan, self.XLSX_TYPE)),
+            ("files", ("2024-02.xlsx", feb, self.XLSX_TYPE)),
+        ])
+        assert resp.status_code == 201
+        data = resp.json()
+        assert data["created_count"] == 3
+        assert data["duplicate_count"] == 1
+        assert [f["total_rows"] for f in data["files"]] == [2, 2]
+
+        txs = client.get("/api/v1/transactions/", headers=auth_headers).json()
+        assert len(txs) == 3
+
+    def test_dedup_against_existing_data(self, client, auth_headers):
+        import_id = upload_preview(client, auth_headers, self.HEADERS, [["2024-01-15", 15000, "스타벅스"]])
+        client.post(
+            "/api/v1/transactions/import/confirm",
+            json={"import_id": import_id, "mapping": {"transacted_at": 0, "amount": 1, "description": 2}},
+            headers=auth_headers,
+        )
+
+        xlsx = make_xlsx(self.HEADERS, [["2024-01-15", 15000, "스타벅스"], ["2024-01-16", 3000, "빵집"]])
+        resp = self._batch(client, auth_headers, [("files", ("jan.xlsx", xlsx, self.XLSX_TYPE))])
+        assert resp.status_code == 201
+        assert resp.json()["created_count"] == 1
+        assert resp.json()["duplicate_count"] == 1
+
+    def test_zip_archive(self, client, auth_headers):
+        archive = self._zip({
+            "statements/1월.xlsx": make_xlsx(self.HEADERS, [["2024-01-15", 15000, "스타벅스"]]).getvalue(),
+            "statements/2월.csv": "날짜,금액,내역\n2024-02-15,2500,편의점\n".encode("cp949"),
+            "__MACOSX/statements/._1월.xlsx": b"\x00\x05",
+            "statements/readme.txt": b"ignored",
+        })
+        resp = self._batch(client, auth_headers, [("files", ("statements.zip", archive, "application/zip"))])
+        assert resp.status_code == 201
+        data = resp.json()
+        assert data["created_count"] == 2
+        assert [f["filename"] for f in data["files"]] == ["1월.xlsx", "2월.csv"]
+
+    def test_bad_file_does_not_sink_batch(self, client, auth_headers):
+        good = make_xlsx(self.HEADERS, [["2024-01-15", 15000, "스타벅스"], ["invalid", 1000, "오류"]])
+        resp = self._batch(client, auth_headers, [
+            ("files", ("good.xlsx", good, self.XLSX_TYPE)),
+            ("files", ("broken.xlsx", BytesIO(b"not xlsx"), self.XLSX_TYPE)),
+        ])
+        assert resp.status_code == 201
+        data = resp.json()
+        assert data["created_count"] == 1
+        assert data["errors"] == [{"file": "good.xlsx", "row": 3, "message": "날짜를 파싱할 수 없습니다."}]
+        assert data["files"][1]["detail"] == "올바른 xlsx 파일이 아닙니다."
+
+    def test_uses_saved_profile(self, client, auth_headers):
+        headers = ["A", "B", "C"]  # not auto-detectable
+        import_id = upload_preview(client, auth_headers, headers, [["2024-01-15", 15000, "스타벅스"]])
+        client.post(
+            "/api/v1/transactions/import/confirm",
+            json={"import_id": import_id, "mapping": {"transacted_at": 0, "amount": 1, "description": 2}},
+            headers=auth_headers,
+        )
+
+        xlsx = make_xlsx(headers, [["2024-02-15", 2500, "편의점"]])
+        other = make_xlsx(["X", "Y"], [["2024-02-15", 2500]])
+        resp = self._batch(client, auth_headers, [
+            ("files", ("known.xlsx", xlsx, self.XLSX_TYPE)),
+            ("files", ("unknown.xlsx", other, self.XLSX_TYPE)),
+        ])
+        assert resp.status_code == 201
+        data = resp.json()
+        assert data["created_count"] == 1
+        assert data["files"][1]["detail"] == "날짜와 금액 컬럼을 찾을 수 없습니다."
+
+    def test_reject_too_many_files(self, client, auth_headers, monkeypatch):
+        from app.core.config import settings
+
+        monkeypatch.setattr(settings, "IMPORT_BATCH_MAX_FILES", 1)
+        files = [
+            ("files", (f"{m}.xlsx", make_xlsx(self.HEADERS, [["2024-01-15", 1000 * m, "x"]]), self.XLSX_TYPE))
+            for m in (1, 2)
+        ]
+        resp = self._batch(client, auth_headers, files)
+        assert resp.status_code == 400
+
+    def test_reject_batch_over_total_size(self, client, auth_headers, monkeypatch):
+        """The cap counts uncompressed zip members, so a small archive cannot smuggle in a huge batch."""
+        from app.core.config import settings
+
+        monkeypatch.setattr(settings, "IMPORT_BATCH_MAX_TOTAL_MB", 1)
+        statement = "날짜,금액,내역\n2024-01-15,1000,{}\n".format("가" * 200_000).encode("utf-8")
+        archive = BytesIO()
+        with zipfile.ZipFile(archive, "w", zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("1월.csv", statement)
+            zf.writestr("2월.csv", statement)
+        assert len(archive.getvalue()) < 100_000
+        archive.seek(0)
+        resp = self._batch(client, auth_headers, [("files", ("statements.zip", archive, "application/zip"))])
+        assert resp.status_code == 400
+        assert "전체 크기" in resp.json()["detail"]
+
+    def test_reject_encrypted_zip_member(self, client, auth_headers):
+        data = bytearray(self._zip({"1월.csv": "날짜,금액,내역\n2024-01-15,1000,x\n".encode()}).getvalue())
+        # Mark the member encrypted (general purpose flag bit 0, local + central header)
+        data[data.find(b"PK\x03\x04") + 6] |= 1
+        data[data.find(b"PK\x01\x02") + 8] |= 1
+        resp = self._batch(client, auth_headers, [("files", ("statements.zip", BytesIO(bytes(data)), "application/zip"))])
+        assert resp.status_code == 400
+        assert resp.json()["detail"] == "statements.zip: 올바른 zip 파일이 아닙니다."
+
+    def test_reject_unsupported_file(self, client, auth_headers):
+        resp = self._batch(client, auth_headers, [("files", ("statement.pdf", BytesIO(b"%PDF"), "application/pdf"))])
+        assert resp.status_code == 400
+
+    def test_requires_auth(self, client):
+        xlsx = make_xlsx(self.HEADERS, [["2024-01-15", 15000, "스타벅스"]])
+        resp = client.post("/api/v1/transactions/import/batch", files=[("files", ("a.xlsx", xlsx, self.XLSX_TYPE))])
+        assert resp.status_code == 403
+
+
 # ── Export Tests ─────────────────────────────────────────────────────────────
 
 
@@ -660,6 +1222,288 @@ class TestExport:
         assert "신한카드" in str(data_row)
         assert "신용카드" in str(data_row)
 
+    def test_export_streams_formatted_amounts(self, client, auth_headers):
+        for day in range(1, 4):
+            client.post(
+                "/api/v1/transactions/",
+                json={
+                    "type": "expense",
+                    "amount": 1234567,
+                    "description": f"항목{day}",
+                    "transacted_at": f"2024-01-{day:02d}T00:00:00Z",
+                },
+                headers=auth_headers,
+            )
+        resp = client.get("/api/v1/transactions/export?period=all", headers=auth_headers)
+        assert resp.status_code == 200
+        assert int(resp.headers["content-length"]) == len(resp.content)
+        ws = openpyxl.load_workbook(BytesIO(resp.content)).active
+        rows = list(ws.iter_rows(values_only=True))
+        assert [r[3] for r in rows[1:]] == ["항목3", "항목2", "항목1"]
+        assert ws["C2"].value == 1234567
+        assert ws["C2"].number_format == "#,##0"
+
+    def _count_builds(self, monkeypatch) -> list:
+        from app.services import excel_io
+
+        builds = []
+        write = excel_io._write_xlsx
+
+        def _counting_write(rows, fh):
+            builds.append(1)
+            write(rows, fh)
+
+        monkeypatch.setattr(excel_io, "_write_xlsx", _counting_write)
+        return builds
+
+    def _add(self, client, auth_headers, description):
+        resp = client.post(
+            "/api/v1/transactions/",
+            json={"type": "expense", "amount": 1000, "description": description, "transacted_at": "2024-01-15T00:00:00Z"},
+            headers=auth_headers,
+        )
+        assert resp.status_code == 201
+        return resp.json()["id"]
+
+    def test_repeat_export_served_from_cache(self, client, auth_headers, monkeypatch):
+        builds = self._count_builds(monkeypatch)
+        self._add(client, auth_headers, "점심")
+
+        first = client.get("/api/v1/transactions/export?period=all", headers=auth_headers)
+        second = client.get("/api/v1/transactions/export?period=all", headers=auth_headers)
+        assert first.status_code == second.status_code == 200
+        assert second.content == first.content
+        assert int(second.headers["content-length"]) == len(second.content)
+        assert len(builds) == 1
+
+        # Different period: separate entry
+        client.get("/api/v1/transactions/export?period=year&year=2024", headers=auth_headers)
+        assert len(builds) == 2
+
+    def test_writes_invalidate_cached_export(self, client, auth_headers, monkeypatch):
+        builds = self._count_builds(monkeypatch)
+        tx_id = self._add(client, auth_headers, "점심")
+        client.get("/api/v1/transactions/export?period=all", headers=auth_headers)
+
+        self._add(client, auth_headers, "저녁")
+        resp = client.get("/api/v1/transactions/export?period=all", headers=auth_headers)
+        rows = list(openpyxl.load_workbook(BytesIO(resp.content)).active.iter_rows(values_only=True))
+        assert {r[3] for r in rows[1:]} == {"점심", "저녁"}
+
+        client.delete(f"/api/v1/transactions/{tx_id}", headers=auth_headers)
+        resp = client.get("/api/v1/transactions/export?period=all", headers=auth_headers)
+        rows = list(openpyxl.load_workbook(BytesIO(resp.content)).active.iter_rows(values_only=True))
+        assert {r[3] for r in rows[1:]} == {"저녁"}
+
+        # Category writes bump the version too (names appear in the export)
+        _create_category(client, auth_headers, "식비", "expense")
+        client.get("/api/v1/transactions/export?period=all", headers=auth_headers)
+        assert len(builds) == 4
+
+    def test_cache_is_per_user(self, client, auth_headers):
+        self._add(client, auth_headers, "점심")
+        client.get("/api/v1/transactions/export?period=all", headers=auth_headers)
+
+        other = register_and_login(client, email="other-export@example.com")
+        resp = client.get("/api/v1/transactions/export?period=all", headers=other)
+        rows = list(openpyxl.load_workbook(BytesIO(resp.content)).active.iter_rows(values_only=True))
+        assert len(rows) == 1  # header only
+
+    def test_cache_disabled(self, client, auth_headers, monkeypatch):
+        from app.core.config import settings
+
+        monkeypatch.setattr(settings, "EXPORT_CACHE_MAX_MB", 0)
+        builds = self._count_builds(monkeypatch)
+        client.get("/api/v1/transactions/export?period=all", headers=auth_headers)
+        client.get("/api/v1/transactions/export?period=all", headers=auth_headers)
+        assert len(builds) == 2
+
+    def test_export_csv(self, client, auth_headers):
+        cat_id = _create_category(client, auth_headers, "식비", "expense")
+        client.post(
+            "/api/v1/transactions/",
+            json={
+                "type": "expense",
+                "amount": 1234567,
+                "description": "점심, 회식",
+                "transacted_at": "2024-01-15T00:00:00Z",
+                "category_id": cat_id,
+            },
+            headers=auth_headers,
+        )
+        resp = client.get("/api/v1/transactions/export?period=month&year=2024&month=1&format=csv", headers=auth_headers)
+        assert resp.status_code == 200
+        assert resp.headers["content-type"].startswith("text/csv")
+        assert 'filename="transactions_2024_01.csv"' in resp.headers["content-disposition"]
+        assert resp.content.startswith("\ufeff".encode("utf-8"))
+        rows = list(csv.reader(StringIO(resp.content.decode("utf-8-sig"))))
+        assert rows[0] == ["날짜", "유형", "금액", "내역", "카테고리", "결제수단", "카드명"]
+        assert rows[1][:5] == ["2024-01-15", "지출", "1234567", "점심, 회식", "식비"]
+
+    def test_export_csv_streams_many_rows(self, client, auth_headers, monkeypatch):
+        from app.services import excel_io
+
+        monkeypatch.setattr(excel_io, "EXPORT_CHUNK_SIZE", 64)  # force several chunks
+        for day in range(1, 6):
+            client.post(
+                "/api/v1/transactions/",
+                json={"type": "expense", "amount": 1000, "description": f"항목{day}", "transacted_at": f"2024-01-{day:02d}T00:00:00Z"},
+                headers=auth_headers,
+            )
+        resp = client.get("/api/v1/transactions/export?period=all&format=csv", headers=auth_headers)
+        rows = list(csv.reader(StringIO(resp.content.decode("utf-8-sig"))))
+        assert [r[3] for r in rows[1:]] == ["항목5", "항목4", "항목3", "항목2", "항목1"]
+
+    def test_export_columnar(self, client, auth_headers):
+        from decimal import Decimal
+
+        from app.services import columnar
+
+        cat_id = _create_category(client, auth_headers, "식비", "expense")
+        card_id = _create_card(client, auth_headers, "신한카드")
+        for day, extra in ((1, {"category_id": cat_id, "user_card_id": card_id, "payment_type": "credit_card"}), (2, {})):
+            client.post(
+                "/api/v1/transactions/",
+                json={"type": "expense", "amount": "1500.50", "description": f"항목{day}",
+                      "transacted_at": f"2024-01-{day:02d}T09:30:00Z", **extra},
+                headers=auth_headers,
+            )
+        resp = client.get("/api/v1/transactions/export?period=all&format=columnar", headers=auth_headers)
+        assert resp.status_code == 200
+        assert resp.headers["content-type"] == "application/octet-stream"
+
+        data = columnar.read(resp.content)
+        assert data["description"] == ["항목2", "항목1"]
+        assert data["amount"] == [Decimal("1500.50"), Decimal("1500.50")]
+        assert data["transacted_at"][1] == datetime(2024, 1, 1, 9, 30, tzinfo=timezone.utc)
+        assert data["type"] == ["expense", "expense"]
+        assert data["category"] == [None, "식비"]
+        assert data["card"] == [None, "신한카드"]
+        assert data["payment_type"][1] == "credit_card"
+
+    def test_export_columnar_empty(self, client, auth_headers):
+        from app.services import columnar
+
+        resp = client.get("/api/v1/transactions/export?period=all&format=columnar", headers=auth_headers)
+        assert resp.status_code == 200
+        assert columnar.read(resp.content)["amount"] == []
+
+    def test_export_rejects_unknown_format(self, client, auth_headers):
+        resp = client.get("/api/v1/transactions/export?period=all&format=pdf", headers=auth_headers)
+        assert resp.status_code == 422
+
     def test_requires_auth(self, client):
         resp = client.get("/api/v1/transactions/export?period=all")
         assert resp.status_code == 403
+
+
+# ── Import Job Tests ─────────────────────────────────────────────────────────
+
+
+class TestImportJobs:
+    MAPPING = {"transacted_at": 0, "amount": 1, "description": 2}
+
+    def _wait(self, client, auth_headers, job_id, timeout=10.0):
+        deadline = time.monotonic() + timeout
+        while True:
+            resp = client.get(f"/api/v1/transactions/import/jobs/{job_id}", headers=auth_headers)
+            assert resp.status_code == 200
+            job = resp.json()
+            if job["status"] in ("done", "failed") or time.monotonic() > deadline:
+                return job
+            time.sleep(0.05)
+
+    def test_job_runs_in_background(self, client, auth_headers):
+        client.post(
+            "/api/v1/transactions/",
+            json={"type": "expense", "amount": 15000, "description": "스타벅스", "transacted_at": "2024-01-15T00:00:00Z"},
+            headers=auth_headers,
+        )
+        import_id = upload_preview(
+            client, auth_headers,
+            ["날짜", "금액", "내역"],
+            [["2024-01-15", 15000, "스타벅스"], ["2024-01-16", 25000, "편의점"], ["bad", 1000, "오류"]],
+        )
+        resp = client.post(
+            "/api/v1/transactions/import/jobs",
+            json={"import_id": import_id, "mapping": self.MAPPING},
+            headers=auth_headers,
+        )
+        assert resp.status_code == 202
+        assert resp.json()["status"] in ("pending", "running", "done")
+        assert resp.json()["total_rows"] == 3
+
+        job = self._wait(client, auth_headers, resp.json()["job_id"])
+        assert job["status"] == "done"
+        assert job["processed_rows"] == 3
+        assert job["created_count"] == 1
+        assert job["duplicate_count"] == 1
+        assert job["error_count"] == 1
+        assert job["errors"][0]["row"] == 4
+        assert len(client.get("/api/v1/transactions/", headers=auth_headers).json()) == 2
+
+    def test_job_visible_only_to_owner(self, client, auth_headers):
+        import_id = upload_preview(client, auth_headers, ["날짜", "금액", "내역"], [["2024-01-15", 15000, "스타벅스"]])
+        job_id = client.post(
+            "/api/v1/transactions/import/jobs",
+            json={"import_id": import_id, "mapping": self.MAPPING},
+            headers=auth_headers,
+        ).json()["job_id"]
+
+        other = register_and_login(client, "other@example.com")
+        resp = client.get(f"/api/v1/transactions/import/jobs/{job_id}", headers=other)
+        assert resp.status_code == 404
+        self._wait(client, auth_headers, job_id)
+
+    def test_expired_import_id_404(self, client, auth_headers):
+        resp = client.post(
+            "/api/v1/transactions/import/jobs",
+            json={"import_id": "nonexistent", "mapping": self.MAPPING},
+            headers=auth_headers,
+        )
+        assert resp.status_code == 404
+
+    def test_rejects_when_queue_full(self, client, auth_headers, monkeypatch):
+        from app.core.config import settings
+
+        monkeypatch.setattr(settings, "IMPORT_MAX_PENDING_JOBS", 0)
+        import_id = upload_preview(client, auth_headers, ["날짜", "금액", "내역"], [["2024-01-15", 15000, "스타벅스"]])
+        resp = client.post(
+            "/api/v1/transactions/import/jobs",
+            json={"import_id": import_id, "mapping": self.MAPPING},
+            headers=auth_headers,
+        )
+        assert resp.status_code == 503
+
+    def test_job_of_dead_worker_reported_failed(self, client, auth_headers):
+        """Jobs live in the database: a running job whose heartbeat stopped is failed on the next poll."""
+        import uuid
+        from datetime import timedelta
+
+        import sqlalchemy as sa
+
+        from app.core.database import engine
+        from app.models.import_job import ImportJob
+        from app.models.user import User
+        from tests.conftest import USER_PAYLOAD
+
+        job_id = str(uuid.uuid4())
+        long_ago = datetime.now(timezone.utc) - timedelta(hours=1)
+        with engine.begin() as conn:
+            user_id = conn.scalar(sa.select(User.id).where(User.email == USER_PAYLOAD["email"]))
+            conn.execute(sa.insert(ImportJob).values(
+                id=job_id, user_id=user_id, status="running", total_rows=100, processed_rows=40,
+                result={"created_count": 40, "duplicate_count": 0, "error_count": 0, "errors": []},
+                created_at=long_ago, updated_at=long_ago,
+            ))
+
+        resp = client.get(f"/api/v1/transactions/import/jobs/{job_id}", headers=auth_headers)
+        assert resp.status_code == 200
+        job = resp.json()
+        assert job["status"] == "failed"
+        assert job["processed_rows"] == 40
+        assert job["detail"] == "가져오기 작업이 중단되었습니다. 다시 시도해 주세요."
+
+    def test_requires_auth(self, client):
+        resp = client.get("/api/v1/transactions/import/jobs/some-id")
+        assert resp.status_code == 403
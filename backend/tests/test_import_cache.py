@@ -0,0 +1,165 @@
+# backend/tests/test_import_cache.py
+"""Tests for the import preview staging backends."""
+import sys
+import time
+
+import pytest
+from sqlalchemy import select
+
+from app.core.database import engine
+from app.models.import_staging import ImportStaging
+from app.services import import_cache
+from app.services.import_cache import MemoryBackend, PostgresBackend, WorkbookRows
+from app.services.import_cache.memory import estimate_bytes
+from tests.test_excel_io import make_xlsx
+
+
+def _workbook(rows: list[list]) -> WorkbookRows:
+    return WorkbookRows(make_xlsx(["날짜", "금액", "내역"], rows).getvalue(), "xlsx", len(rows))
+
+
+ROWS = [["2024-01-15", 15000, "스타벅스"], ["2024-01-16", 2500.5, "편의점"]]
+
+
+@pytest.fixture(params=[MemoryBackend, PostgresBackend], ids=["memory", "postgres"])
+def backend(request):
+    backend = request.param()
+    import_cache.set_backend(backend)
+    yield backend
+    backend.clear()
+    backend.close()
+    import_cache.set_backend(None)
+
+
+def test_round_trip_keeps_cell_types(backend):
+    import_id = import_cache.store(["날짜", "금액", "내역"], _workbook(ROWS))
+    entry = import_cache.retrieve(import_id)
+    assert entry["headers"] == ["날짜", "금액", "내역"]
+    assert len(entry["rows"]) == 2
+    assert list(entry["rows"]) == ROWS
+
+
+def test_remove(backend):
+    import_id = import_cache.store(["a"], _workbook([[1]]))
+    import_cache.remove(import_id)
+    assert import_cache.retrieve(import_id) is None
+
+
+def test_expired_entry_not_returned(backend, monkeypatch):
+    monkeypatch.setattr(import_cache, "_TTL_SECONDS", -1)
+    import_id = import_cache.store(["a"], _workbook([[1]]))
+    assert import_cache.retrieve(import_id) is None
+
+
+def test_unknown_import_id(backend):
+    assert import_cache.retrieve("nonexistent") is None
+
+
+def test_store_accounts_file_size():
+    backend = MemoryBackend(sweep_interval=0)
+    import_cache.set_backend(backend)
+    try:
+        rows = _workbook(ROWS)
+        import_id = import_cache.store(["a"], rows)
+        assert import_cache.retrieve(import_id)["rows"] is rows
+        assert backend.stats()["bytes"] == sys.getsizeof("a") + rows.nbytes
+    finally:
+        import_cache.set_backend(None)
+
+
+def test_postgres_payload_is_compressed():
+    backend = PostgresBackend()
+    try:
+        data = "날짜,금액,내역\n".encode() + "".join(f"2024-01-{1 + i % 28:02d},{i},편의점 {i}\n" for i in range(1000)).encode()
+        backend.put("csv", {"headers": ["날짜", "금액", "내역"], "rows": WorkbookRows(data, "csv", 1000)}, 60)
+        with engine.connect() as conn:
+            payload = conn.scalar(select(ImportStaging.payload).where(ImportStaging.import_id == "csv"))
+        assert len(payload) < len(data) / 2
+        rows = backend.get("csv")["rows"]
+        assert len(rows) == 1000
+        assert next(iter(rows)) == ["2024-01-01", "0", "편의점 0"]
+    finally:
+        backend.clear()
+
+
+# ── Memory backend bounds ──
+
+
+def _entry(n: int) -> dict:
+    return {"headers": ["a", "b"], "rows": _workbook([[f"2024-01-{1 + i % 28:02d}", i, f"row {i}"] for i in range(n)])}
+
+
+def test_memory_lru_evicts_least_recently_used():
+    backend = MemoryBackend(max_entries=2, sweep_interval=0)
+    backend.put("a", _entry(1), 60)
+    backend.put("b", _entry(1), 60)
+    assert backend.get("a") is not None  # "b" becomes least recently used
+    backend.put("c", _entry(1), 60)
+
+    assert backend.get("b") is None
+    assert backend.get("a") is not None
+    assert backend.get("c") is not None
+    stats = backend.stats()
+    assert stats["entries"] == 2
+    assert stats["evictions"] == 1
+    assert stats["hits"] == 3
+    assert stats["misses"] == 1
+
+
+def test_memory_byte_bound_and_accounting():
+    size = estimate_bytes(_entry(100))
+    backend = MemoryBackend(max_bytes=size * 2, sweep_interval=0)
+    for key in ("a", "b", "c"):
+        backend.put(key, _entry(100), 60)
+    assert backend.stats()["entries"] == 2
+    assert backend.stats()["bytes"] == size * 2
+
+    backend.delete("b")
+    backend.delete("c")
+    assert backend.stats()["bytes"] == 0
+
+
+def test_memory_oversized_entry_is_kept_alone():
+    backend = MemoryBackend(max_bytes=1, sweep_interval=0)
+    backend.put("a", _entry(1), 60)
+    backend.put("b", _entry(10), 60)
+    assert backend.get("a") is None
+    assert backend.get("b") is not None
+
+
+def test_memory_sweeper_drops_abandoned_previews():
+    backend = MemoryBackend(sweep_interval=0.01)
+    try:
+        backend.put("abandoned", _entry(10), 0.01)
+        deadline = time.monotonic() + 5
+        while backend.stats()["entries"] and time.monotonic() < deadline:
+            time.sleep(0.01)
+        stats = backend.stats()
+        assert stats["entries"] == 0
+        assert stats["bytes"] == 0
+        assert stats["expirations"] == 1
+    finally:
+        backend.close()
+
+
+def test_preview_and_confirm_across_workers(client, auth_headers):
+    """Two backend instances over the same table behave like two API processes."""
+    import_cache.set_backend(PostgresBackend())
+    try:
+        resp = client.post(
+            "/api/v1/transactions/import/preview",
+            files={"file": ("test.xlsx", make_xlsx(["날짜", "금액", "내역"], [["2024-01-15", 15000, "스타벅스"]]), "application/octet-stream")},
+            headers=auth_headers,
+        )
+        assert resp.status_code == 200
+
+        import_cache.set_backend(PostgresBackend())  # "another worker"
+        resp = client.post(
+            "/api/v1/transactions/import/confirm",
+            json={"import_id": resp.json()["import_id"], "mapping": {"transacted_at": 0, "amount": 1, "description": 2}},
+            headers=auth_headers,
+        )
+        assert resp.status_code == 201
+        assert resp.json()["created_count"] == 1
+    finally:
+        import_cache.set_backend(None)
@@ -0,0 +1,90 @@
+# backend/tests/test_query_plans.py
+"""
+EXPLAIN-based checks that the hot service queries are served by indexes.
+
+Test tables hold a handful of rows, so the planner would happily pick a
+sequential scan for everything.  Sequential scans are therefore disabled for
+the EXPLAIN session: a query that still shows a Seq Scan has no usable index.
+"""
+from datetime import date
+
+import sqlalchemy as sa
+
+from app.core.database import SessionLocal, engine
+from app.models.email_verification import EmailVerification
+from app.models.user import User
+from app.models.user_card import UserCard
+from app.services import benefit_index, card_spending, catalog_snapshot
+from app.services.card_recommendation import recommend_cards
+from app.services.category import list_categories
+from app.services.transaction import list_transactions
+from app.services.user_card import get_cards_performance, get_cards_performance_history, list_cards
+from tests.conftest import USER_PAYLOAD
+from tests.test_card_recommendation import (
+    _add_benefit,
+    _create_user_card,
+    _insert_catalog_benefit,
+    _insert_catalog_card,
+    _link_card_to_catalog,
+)
+
+
+def _explain(statements) -> list[str]:
+    plans = []
+    with engine.connect() as conn:
+        conn.exec_driver_sql("SET enable_seqscan = off")
+        for statement, parameters in statements:
+            rows = conn.exec_driver_sql("EXPLAIN " + statement, parameters).all()
+            plans.append("\n".join(r[0] for r in rows))
+        conn.rollback()
+    return plans
+
+
+def test_service_queries_use_indexes(client, auth_headers, capture_sql):
+    catalog_id = _insert_catalog_card()
+    _insert_catalog_benefit(catalog_id, category="전체", rate=1.0)
+    card = _create_user_card(client, auth_headers, {"type": "credit_card", "name": "인덱스카드", "billing_day": 5})
+    _add_benefit(client, auth_headers, card["id"], {"category": "식비", "benefit_type": "cashback", "rate": 3.0})
+    linked = _create_user_card(client, auth_headers, {"type": "credit_card", "name": "카탈로그카드"})
+    _link_card_to_catalog(linked["id"], catalog_id)
+    client.post("/api/v1/transactions/", headers=auth_headers, json={
+        "type": "expense", "amount": 10000,
+        "transacted_at": f"{date.today()}T10:00:00+00:00", "user_card_id": card["id"],
+    })
+
+    db = SessionLocal()
+    try:
+        user = db.scalar(sa.select(User).where(User.email == USER_PAYLOAD["email"]))
+        catalog_snapshot.get(db)  # whole-catalog load (by design a full read) stays out of the capture
+        benefit_index.clear()  # recommend_cards below must load the index
+        with capture_sql() as executed:
+            list_transactions(db, user.id)
+            list_transactions(db, user.id, card_id=card["id"], from_date=date(2026, 1, 1), to_date=date.today())
+            list_categories(db, user.id)
+            list_cards(db, user.id)
+            get_cards_performance(db, user.id)
+            get_cards_performance_history(db, user.id, 12)
+            recommend_cards(db, user.id, "식비", 10000)
+            card_spending.rebuild_card(db, db.get(UserCard, card["id"]))
+            db.scalar(
+                sa.select(EmailVerification)
+                .where(EmailVerification.user_id == user.id, EmailVerification.is_used == False)  # noqa: E712
+                .order_by(EmailVerification.created_at.desc())
+            )
+        db.rollback()
+    finally:
+        db.close()
+
+    # Single-row DML and queries only: EXPLAIN takes one parameter set.
+    statements = [
+        (e.statement, e.parameters)
+        for e in executed
+        if not e.executemany and e.statement.lstrip().upper().startswith(("SELECT", "INSERT", "UPDATE", "DELETE"))
+    ]
+    assert len(statements) >= 10
+    offenders = [
+        f"{statement}\n{plan}"
+        for (statement, _), plan in zip(statements, _explain(statements))
+        if "Seq Scan" in plan
+    ]
+    assert offenders == []
@@ -6,6 +6,7 @@ Coverage:
   GET    /transactions/              – list (empty, populated, sorted)
   GET    /transactions/?card_id=...  – filter by card
   GET    /transactions/?from=...&to= – filter by date range
+  GET    /transactions/?limit=&cursor= – keyset pagination (ties, filters, bad cursor)
   POST   /transactions/              – create (all fields, minimal fields)
   GET    /transactions/{id}          – found, not found, user isolation
   PUT    /transactions/{id}          – partial update
@@ -71,6 +72,67 @@ def test_list_transactions_only_returns_own_data(client, auth_headers):
     assert resp.json() == []
 
 
+# ── pagination ───────────────────────────────────────────────────────────────
+
+
+def _collect_pages(client, headers, query="limit=2"):
+    items, cursor, pages = [], None, 0
+    while True:
+        url = f"/api/v1/transactions/?{query}" + (f"&cursor={cursor}" if cursor else "")
+        resp = client.get(url, headers=headers)
+        assert resp.status_code == 200, resp.text
+        page = resp.json()
+        items.extend(page["items"])
+        pages += 1
+        cursor = page["next_cursor"]
+        if cursor is None:
+            return items, pages
+
+
+def test_paginated_list_walks_all_rows_in_order(client, auth_headers):
+    for day in range(1, 6):
+        create_tx(client, auth_headers, {**TX_PAYLOAD, "transacted_at": f"2026-01-{day:02d}T12:00:00+00:00"})
+    items, pages = _collect_pages(client, auth_headers)
+    assert pages == 3
+    assert [tx["transacted_at"][:10] for tx in items] == [f"2026-01-{d:02d}" for d in range(5, 0, -1)]
+
+
+def test_paginated_list_handles_same_timestamp(client, auth_headers):
+    """Rows sharing transacted_at are ordered by id and never skipped or repeated."""
+    created = [create_tx(client, auth_headers)["id"] for _ in range(5)]
+    items, _ = _collect_pages(client, auth_headers)
+    ids = [tx["id"] for tx in items]
+    assert sorted(ids) == sorted(created)
+    assert ids == sorted(ids, reverse=True)
+
+
+def test_paginated_list_respects_filters(client, auth_headers):
+    card = create_card(client, auth_headers)
+    create_tx(client, auth_headers, {**TX_PAYLOAD, "user_card_id": card["id"]})
+    create_tx(client, auth_headers, {**TX_PAYLOAD, "transacted_at": "2026-01-16T12:00:00+00:00", "user_card_id": card["id"]})
+    create_tx(client, auth_headers)
+    items, _ = _collect_pages(client, auth_headers, f"limit=1&card_id={card['id']}&from=2026-01-15&to=2026-01-15")
+    assert len(items) == 1
+    assert items[0]["user_card_id"] == card["id"]
+
+
+def test_paginated_list_last_page_has_no_cursor(client, auth_headers):
+    create_tx(client, auth_headers)
+    resp = client.get("/api/v1/transactions/?limit=10", headers=auth_headers)
+    assert resp.json()["next_cursor"] is None
+    assert len(resp.json()["items"]) == 1
+
+
+def test_paginated_list_invalid_cursor_returns_400(client, auth_headers):
+    resp = client.get("/api/v1/transactions/?limit=10&cursor=not-a-cursor", headers=auth_headers)
+    assert resp.status_code == 400
+
+
+def test_paginated_list_limit_is_capped(client, auth_headers):
+    resp = client.get("/api/v1/transactions/?limit=1000", headers=auth_headers)
+    assert resp.status_code == 422
+
+
 # ── card_id filter ────────────────────────────────────────────────────────────
 
 
@@ -413,3 +475,53 @@ def test_update_transaction_with_empty_body_preserves_data(client, auth_headers)
     body = resp.json()
     assert float(body["amount"]) == float(created["amount"])
     assert body["description"] == created["description"]
+
+
+# ── dedup key race ────────────────────────────────────────────────────────────
+
+
+def test_dedup_key_claim_lost_to_concurrent_write(client, auth_headers, monkeypatch):
+    """If the key is taken between the check and the flush, the write still succeeds (without a key)."""
+    import sqlalchemy as sa
+
+    from app.core.database import engine
+    from app.services import transaction as transaction_service
+
+    # Simulate the race: the check never sees the other holder of the key.
+    monkeypatch.setattr(transaction_service, "_dedup_key_taken", lambda *args: False)
+
+    first = create_tx(client, auth_headers)
+    second = create_tx(client, auth_headers)
+    other = create_tx(client, auth_headers, {**TX_PAYLOAD, "description": "저녁"})
+    resp = client.put(
+        f"/api/v1/transactions/{other['id']}", headers=auth_headers, json={"description": "점심"}
+    )
+    assert resp.status_code == 200, resp.text
+    assert resp.json()["description"] == "점심"
+
+    with engine.connect() as conn:
+        keys = dict(conn.execute(sa.text("SELECT id::text, dedup_key FROM transactions")).all())
+    assert keys[first["id"]] is not None
+    assert keys[second["id"]] is None
+    assert keys[other["id"]] is None
+
+
+# ── data version ──────────────────────────────────────────────────────────────
+
+
+def test_write_bumps_data_version_without_touching_user_row(client, auth_headers):
+    import sqlalchemy as sa
+
+    from app.core.database import engine
+
+    def _state():
+        with engine.connect() as conn:
+            updated_at = conn.scalar(sa.text("SELECT updated_at FROM users"))
+            version = conn.scalar(sa.text("SELECT version FROM user_data_versions"))
+        return updated_at, version
+
+    create_tx(client, auth_headers)
+    updated_at, version = _state()
+    create_tx(client, auth_headers, {**TX_PAYLOAD, "description": "저녁"})
+    assert _state() == (updated_at, version + 1)
+